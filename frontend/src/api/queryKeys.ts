@@ -51,8 +51,10 @@ export const gameKeys = {
     [...gameKeys.gameState(gameId), "discard-pile"] as const,
   craftableItems: (gameId: number) =>
     [...gameKeys.gameState(gameId), "craftable-items"] as const,
+  gameLogs: (gameId: number) =>
+    [...gameKeys.gameState(gameId), "game-log"] as const,
   gameLog: (gameId: number, username: string | null | undefined) =>
-    [...gameKeys.gameState(gameId), "game-log", username ?? "anonymous"] as const,
+    [...gameKeys.gameLogs(gameId), username ?? "anonymous"] as const,
 
   // Player specific
   playerHand: (gameId: number, username: string) =>
@@ -802,6 +802,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/cards/catalog/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * @description Every card type with its data, as repeated in card payloads under its card_name.
+         *     Static: fetch it once, an If-None-Match with its ETag gets an empty 304.
+         */
+        get: operations["cards_catalog_list"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/cats/birdsong/place-wood/": {
         parameters: {
             query?: never;
@@ -1594,6 +1614,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/game-log/{game_id}/feed/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** @description The game log as a feed: only the logs that are new or changed since the client's
+         *     cursor (?after=), flat, to be merged by id and nested by parent_id.
+         *     Without a cursor, or when it was undone (reset), the whole log.
+         *     Game updates carry latest_log_id and logs_updated_at, to fetch only when they moved. */
+        get: operations["game_log_feed_retrieve"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/game/{game_id}/session/": {
         parameters: {
             query?: never;
@@ -2680,6 +2720,40 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/woodland-alliance/evening/discard-cards/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** @description Return initial step data. */
+        get: operations["woodland_alliance_evening_discard_cards_retrieve"];
+        put?: never;
+        post: operations["woodland_alliance_evening_discard_cards_create"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/woodland-alliance/evening/discard-cards/{game_id}/{route}/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** @description Return initial step data. */
+        get: operations["woodland_alliance_evening_discard_cards_retrieve_2"];
+        put?: never;
+        post: operations["woodland_alliance_evening_discard_cards_create_2"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/woodland-alliance/evening/operations/": {
         parameters: {
             query?: never;
@@ -2754,7 +2828,7 @@ export interface components {
         Bird: {
             player: components["schemas"]["PlayerPublic"];
             buildings: components["schemas"]["BirdBuilding"];
-            warriors: components["schemas"]["Warrior"][];
+            warriors: components["schemas"]["WarriorCount"][];
             leaders: components["schemas"]["BirdLeader"][];
             decree: components["schemas"]["BirdDecreeEntry"][];
             viziers: components["schemas"]["Vizier"][];
@@ -2829,11 +2903,61 @@ export interface components {
             dominance: boolean;
         };
         /** @description Serializer to provide all (public) information about cats */
+        /** @description a card type of the catalog, which card payloads repeat under their card_name */
+        CardCatalogEntry: {
+            readonly card_name: string;
+            suit: {
+                /**
+                 * @description * `r` - r
+                 *     * `y` - y
+                 *     * `o` - o
+                 *     * `b` - b
+                 * @enum {string}
+                 */
+                value: "r" | "y" | "o" | "b";
+                /** @enum {string} */
+                label: "Bird" | "Fox" | "Mouse" | "Rabbit";
+            };
+            title: string;
+            text: string;
+            craftable: boolean;
+            cost: {
+                /**
+                 * @description * `r` - r
+                 *     * `y` - y
+                 *     * `o` - o
+                 *     * `b` - b
+                 * @enum {string}
+                 */
+                value: "r" | "y" | "o" | "b";
+                /** @enum {string} */
+                label: "Bird" | "Fox" | "Mouse" | "Rabbit";
+            }[];
+            item: {
+                /**
+                 * @description * `0` - 0
+                 *     * `1` - 1
+                 *     * `2` - 2
+                 *     * `3` - 3
+                 *     * `4` - 4
+                 *     * `5` - 5
+                 *     * `6` - 6
+                 * @enum {string}
+                 */
+                value: "0" | "1" | "2" | "3" | "4" | "5" | "6";
+                /** @enum {string} */
+                label: "Bag" | "Boots" | "Coin" | "Crossbow" | "Hammer" | "Sword" | "Tea";
+            } | null;
+            crafted_points: number;
+            ambush: boolean;
+            dominance: boolean;
+        };
+        /** @description Serializer to provide all (public) information about cats */
         Cat: {
             player: components["schemas"]["PlayerPublic"];
             tokens: components["schemas"]["CatToken"];
             buildings: components["schemas"]["CatBuilding"];
-            warriors: components["schemas"]["Warrior"][];
+            warriors: components["schemas"]["WarriorCount"][];
         };
         /** @description Serializer for cat buildings. collects lists of all buildings */
         CatBuilding: {
@@ -2912,7 +3036,7 @@ export interface components {
         /** @description Serializer to provide all (public) information about crows */
         Crows: {
             player: components["schemas"]["PlayerPublic"];
-            warriors: components["schemas"]["Warrior"][];
+            warriors: components["schemas"]["WarriorCount"][];
             readonly reserve_plots_count: number;
             exposure_guessed_plots: components["schemas"]["ExposureGuessedPlot"][];
         };
@@ -2982,6 +3106,25 @@ export interface components {
             readonly details: unknown;
             readonly children: string;
         };
+        GameLogFeed: {
+            latest_log_id: number | null;
+            /** Format: date-time */
+            logs_updated_at: string | null;
+            cursor: string | null;
+            reset: boolean;
+            logs: components["schemas"]["GameLogNode"][];
+        };
+        /** @description a log without its children, which come as logs of their own (log
+         *     feed) */
+        GameLogNode: {
+            readonly id: number;
+            readonly parent_id: number | null;
+            readonly player_faction: string | null;
+            /** Format: date-time */
+            readonly created_at: string;
+            log_type: components["schemas"]["LogTypeEnum"];
+            readonly details: unknown;
+        };
         GameSession: {
             readonly id: number;
             owner_username: string;
@@ -3122,7 +3265,7 @@ export interface components {
         /** @description Serializer to provide all (public) information about moles */
         Moles: {
             player: components["schemas"]["PlayerPublic"];
-            warriors: components["schemas"]["Warrior"][];
+            warriors: components["schemas"]["WarriorCount"][];
             buildings: components["schemas"]["MolesBuildings"];
             tokens: components["schemas"]["MolesTokens"];
             ministers: components["schemas"]["MolesMinister"][];
@@ -3262,7 +3405,7 @@ export interface components {
             player: components["schemas"]["PlayerPublic"];
             tokens: components["schemas"]["WAToken"];
             buildings: components["schemas"]["WABuilding"];
-            warriors: components["schemas"]["Warrior"][];
+            warriors: components["schemas"]["WarriorCount"][];
             readonly supporter_count: number;
             readonly officer_count: number;
         };
@@ -3283,9 +3426,10 @@ export interface components {
         WAToken: {
             sympathy: components["schemas"]["WASympathy"][];
         };
-        Warrior: {
-            player_name: string;
-            readonly clearing_number: number | null;
+        /** @description how many of a player's warriors are in a clearing (clearing_number None: supply) */
+        WarriorCount: {
+            clearing_number: number | null;
+            count: number;
         };
         WorkShop: {
             building: components["schemas"]["Building"];
@@ -5547,6 +5691,32 @@ export interface operations {
             };
         };
     };
+    cards_catalog_list: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CardCatalogEntry"][];
+                };
+            };
+            /** @description No response body */
+            304: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+        };
+    };
     cats_birdsong_place_wood_retrieve: {
         parameters: {
             query?: never;
@@ -7578,6 +7748,30 @@ export interface operations {
             };
         };
     };
+    game_log_feed_retrieve: {
+        parameters: {
+            query?: {
+                /** @description cursor of the client's last feed response */
+                after?: string;
+            };
+            header?: never;
+            path: {
+                game_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GameLogFeed"];
+                };
+            };
+        };
+    };
     game_session_retrieve: {
         parameters: {
             query?: never;
@@ -10114,6 +10308,102 @@ export interface operations {
             };
         };
     };
+    woodland_alliance_evening_discard_cards_retrieve: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description No response body */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+        };
+    };
+    woodland_alliance_evening_discard_cards_create: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GameActionStep"];
+                };
+            };
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ValidationError"];
+                };
+            };
+        };
+    };
+    woodland_alliance_evening_discard_cards_retrieve_2: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                game_id: number;
+                route: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description No response body */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+        };
+    };
+    woodland_alliance_evening_discard_cards_create_2: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                game_id: number;
+                route: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GameActionStep"];
+                };
+            };
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ValidationError"];
+                };
+            };
+        };
+    };
     woodland_alliance_evening_operations_retrieve: {
         parameters: {
             query?: never;
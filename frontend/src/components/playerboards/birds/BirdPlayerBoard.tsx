@@ -32,9 +32,8 @@ export default function BirdPlayerBoard({
   const viziers = publicInfo?.viziers ?? [];
   const warriors = publicInfo?.warriors ?? [];
 
-  const warriorsInSupply = warriors.filter(
-    (w: any) => w.clearing_number === null,
-  ).length;
+  const warriorsInSupply =
+    warriors.find((w: any) => w.clearing_number === null)?.count ?? 0;
 
   const activeLeader = leaders.find((l: any) => l.active);
 
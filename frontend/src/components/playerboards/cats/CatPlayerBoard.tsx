@@ -21,8 +21,8 @@ export default function CatPlayerBoard({
   const { buildingTable } = useBuildingTable(gameId, ["Cats"], isOpen);
 
   const warriorsInSupply =
-    publicInfo?.warriors.filter((w: any) => w.clearing_number === null)
-      .length ?? 0;
+    publicInfo?.warriors.find((w: any) => w.clearing_number === null)
+      ?.count ?? 0;
 
   const catBuildingsOnBoard = buildingTable.filter(
     (b) => b.faction === "Cats" && b.clearing_number === null,
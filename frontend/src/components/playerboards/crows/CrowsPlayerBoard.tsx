@@ -27,8 +27,8 @@ export default function CrowsPlayerBoard({
   const isOwner = faction === "Crows";
 
   const warriorsInSupply =
-    publicInfo?.warriors.filter((w: any) => w.clearing_number === null)
-      .length ?? 0;
+    publicInfo?.warriors.find((w: any) => w.clearing_number === null)
+      ?.count ?? 0;
 
   return (
     <Modal
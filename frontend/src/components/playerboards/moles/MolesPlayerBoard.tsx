@@ -24,9 +24,8 @@ export default function MolesPlayerBoard({
   const { buildingTable } = useBuildingTable(gameId, ["Moles"], isOpen);
 
   const warriors = publicInfo?.warriors ?? [];
-  const warriorsInSupply = warriors.filter(
-    (w) => w.clearing_number === null,
-  ).length;
+  const warriorsInSupply =
+    warriors.find((w) => w.clearing_number === null)?.count ?? 0;
 
   const molesBuildingsOnBoard = buildingTable.filter(
     (b) => b.faction === "Moles" && b.clearing_number === null,
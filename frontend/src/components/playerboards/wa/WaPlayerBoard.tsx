@@ -40,9 +40,8 @@ export default function WaPlayerBoard({ isOpen, onClose }: WaPlayerBoardProps) {
   const supporterCards = privateInfo?.supporter_cards;
   const warriors = publicInfo?.warriors ?? [];
 
-  const warriorsInSupply = warriors.filter(
-    (w) => w.clearing_number === null,
-  ).length;
+  const warriorsInSupply =
+    warriors.find((w) => w.clearing_number === null)?.count ?? 0;
 
   return (
     <Modal
@@ -1,35 +1,128 @@
-import { useQuery } from "@tanstack/react-query";
+import { useQuery, useQueryClient, type QueryClient } from "@tanstack/react-query";
 import type { components } from "../api/types";
 import { gameKeys } from "../api/queryKeys";
 
-export type GameLogType = components["schemas"]["GameLog"];
+type GameLogNodeType = components["schemas"]["GameLogNode"];
+type GameLogFeedType = components["schemas"]["GameLogFeed"];
+
+export type GameLogType = GameLogNodeType & { children: GameLogType[] };
+
+// the game log fetched so far from the feed, merged by id
+export type GameLogFeedState = {
+  latest_log_id: number | null;
+  logs_updated_at: string | null;
+  cursor: string | null;
+  nodes: Record<number, GameLogNodeType>;
+};
+
+// the head of the game log carried by websocket updates
+export type GameLogHead = Pick<GameLogFeedState, "latest_log_id" | "logs_updated_at">;
 
 const djangoUrl = import.meta.env.VITE_DJANGO_URL || "";
 
+const mergeFeed = (
+  previous: GameLogFeedState | undefined,
+  feed: GameLogFeedType,
+): GameLogFeedState => {
+  const nodes = feed.reset || !previous ? {} : { ...previous.nodes };
+  for (const node of feed.logs) {
+    nodes[node.id] = node;
+  }
+  return {
+    latest_log_id: feed.latest_log_id,
+    logs_updated_at: feed.logs_updated_at,
+    cursor: feed.cursor,
+    nodes,
+  };
+};
+
+// nests the logs under their parents, in the order they were logged
+const buildTree = (state: GameLogFeedState): GameLogType[] => {
+  const ordered = Object.values(state.nodes).sort(
+    (a, b) => a.created_at.localeCompare(b.created_at) || a.id - b.id,
+  );
+  const byId: Record<number, GameLogType> = {};
+  for (const node of ordered) {
+    byId[node.id] = { ...node, children: [] };
+  }
+  const roots: GameLogType[] = [];
+  for (const node of ordered) {
+    const parent = node.parent_id != null ? byId[node.parent_id] : undefined;
+    if (parent) {
+      parent.children.push(byId[node.id]);
+    } else if (node.parent_id == null) {
+      roots.push(byId[node.id]);
+    }
+  }
+  return roots;
+};
+
+/**
+ * Refetches the game logs of a game whose head moved: only the tail while the logs
+ * grow, everything again when logs the client holds were undone.
+ */
+export const refreshGameLogs = (
+  queryClient: QueryClient,
+  gameId: number,
+  head: GameLogHead,
+) => {
+  const cached = queryClient.getQueriesData<GameLogFeedState>({
+    queryKey: gameKeys.gameLogs(gameId),
+  });
+  for (const [queryKey, state] of cached) {
+    if (
+      state &&
+      state.latest_log_id === head.latest_log_id &&
+      state.logs_updated_at === head.logs_updated_at
+    ) {
+      continue;
+    }
+    if (
+      state &&
+      (head.latest_log_id == null ||
+        (state.latest_log_id ?? 0) > head.latest_log_id)
+    ) {
+      queryClient.resetQueries({ queryKey, exact: true });
+    } else {
+      queryClient.invalidateQueries({ queryKey, exact: true });
+    }
+  }
+};
+
 const useGameLogQuery = (
   gameId: number,
   username: string | null | undefined,
   enabled: boolean = true,
 ) => {
+  const queryClient = useQueryClient();
+  const queryKey = gameKeys.gameLog(gameId, username);
   const {
     data: gameLogs,
     isLoading,
     isError,
     isSuccess,
   } = useQuery({
-    queryKey: gameKeys.gameLog(gameId, username),
-    queryFn: async (): Promise<GameLogType[]> => {
-      const response = await fetch(`${djangoUrl}/api/game-log/${gameId}/`, {
-        headers: {
-          Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
-          "Content-Type": "application/json",
+    queryKey,
+    queryFn: async (): Promise<GameLogFeedState> => {
+      // only ask for what changed since the logs already held
+      const previous = queryClient.getQueryData<GameLogFeedState>(queryKey);
+      const cursor =
+        previous?.cursor != null ? `?after=${encodeURIComponent(previous.cursor)}` : "";
+      const response = await fetch(
+        `${djangoUrl}/api/game-log/${gameId}/feed/${cursor}`,
+        {
+          headers: {
+            Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
+            "Content-Type": "application/json",
+          },
         },
-      });
+      );
       if (!response.ok) {
         throw new Error("Network response was not ok");
       }
-      return response.json();
+      return mergeFeed(previous, await response.json());
     },
+    select: buildTree,
     enabled: !!gameId && !!username && enabled,
   });
   return { gameLogs, isLoading, isError, isSuccess };
@@ -1,6 +1,7 @@
 import { useEffect, useRef } from "react";
 import { useQueryClient } from "@tanstack/react-query";
 import { gameKeys } from "../api/queryKeys";
+import { refreshGameLogs } from "./useGameLogQuery";
 
 const useGameWebSocket = (gameId: string | undefined) => {
   const queryClient = useQueryClient();
@@ -51,10 +52,15 @@ const useGameWebSocket = (gameId: string | undefined) => {
           console.log("WebSocket authenticated");
           queryClient.setQueryData(gameKeys.wsAuth(gameId), true);
         } else if (data.message === "update") {
-          // Invalidate all queries related to the game
+          // Invalidate all queries related to the game, but the game log
+          const gameLogKey = gameKeys.gameLogs(Number(gameId));
           queryClient.invalidateQueries({
             queryKey: gameKeys.gameState(Number(gameId)),
+            predicate: (query) =>
+              !gameLogKey.every((part, i) => query.queryKey[i] === part),
           });
+          // which only fetches what was logged since, if anything
+          refreshGameLogs(queryClient, Number(gameId), data);
         }
       };
 
@@ -8,16 +8,20 @@ export type warriorTableType = {
   faction: FactionLabel;
 };
 
-type WarriorType = {
-  player_name: string;
+type WarriorCountType = {
   clearing_number: number | null;
+  count: number;
 };
 
+// one row per warrior, from the warrior counts per clearing
 const tabulateWarriors = (faction: FactionLabel, data: any) => {
-  const warriors: WarriorType[] = data.warriors ?? [];
-  return warriors.map((warrior: WarriorType): warriorTableType => {
-    return { clearing_number: warrior.clearing_number ?? null, faction };
-  });
+  const warriors: WarriorCountType[] = data.warriors ?? [];
+  return warriors.flatMap((entry: WarriorCountType): warriorTableType[] =>
+    Array.from({ length: entry.count }, () => ({
+      clearing_number: entry.clearing_number ?? null,
+      faction,
+    })),
+  );
 };
 
 const useWarriorTable = (
@@ -5,12 +5,13 @@ from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from game.models.game_models import Game
+from game.utils.game_updates import game_group_name
 
 
 class GameConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         self.game_id = self.scope["url_route"]["kwargs"]["game_id"]
-        self.room_group_name = f"game_{self.game_id}"
+        self.room_group_name = game_group_name(self.game_id)
         self.authenticated = False
 
         # Accept connection but do not join group yet
@@ -63,7 +64,15 @@ class GameConsumer(AsyncWebsocketConsumer):
 
     # Receive message from room group
     async def game_update(self, event):
-        message = event["message"]
-
         # Send message to WebSocket
-        await self.send(text_data=json.dumps({"message": message}))
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "message": event["message"],
+                    "version": event.get("version"),
+                    "committed_at": event.get("committed_at"),
+                    "latest_log_id": event.get("latest_log_id"),
+                    "logs_updated_at": event.get("logs_updated_at"),
+                }
+            )
+        )
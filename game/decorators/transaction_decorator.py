@@ -1,12 +1,14 @@
 import functools
 import threading
+from django.conf import settings
 from django.db import transaction
 from game.models.game_models import Game
 from game.models.checkpoint_models import Checkpoint, Action
+from game.queries.board_state import board_state_cache
 from game.serializers.action_serializer import ActionSerializer
-from game.utils.snapshot import capture_gamestate
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from game.utils import metrics
+from game.utils.game_updates import schedule_game_update
+from game.utils.snapshot import capture_gamestate, diff_gamestate
 
 # Context for playback to avoid infinite recursion
 _playback_context = threading.local()
@@ -20,7 +22,55 @@ def is_playback_mode():
     return getattr(_playback_context, "is_replaying", False)
 
 
+# Transactions wrapped by atomic_game_action, keyed by their recorded name.
+# Lets playback resolve Action.transaction_name without importing modules.
+_transaction_registry: dict = {}
+
+
+def transaction_name(func) -> str:
+    """the name an action of func is recorded (and replayed) under"""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def get_registered_transaction(full_name: str):
+    return _transaction_registry.get(full_name)
+
+
+def register_transaction(full_name: str, func) -> None:
+    _transaction_registry[full_name] = func
+
+
+def lock_game(game: Game) -> None:
+    """
+    Serializes writes to the game: a second transaction waits here until the one holding
+    the game commits, while other games go ahead (no-op on SQLite, which locks the file).
+    The game may have changed while waiting, so the instance is updated in place from the
+    locked row, arguments holding it (player.game) see the same state.
+    """
+    locked = Game.objects.select_for_update().get(pk=game.pk)
+    for field in Game._meta.concrete_fields:
+        setattr(game, field.attname, getattr(locked, field.attname))
+
+
+def create_checkpoint(game: Game, previous: Checkpoint | None = None) -> Checkpoint:
+    """Captures the current gamestate and stores it as a (possibly delta) checkpoint"""
+    gamestate_data = capture_gamestate(game)
+
+    # Debug: Check DecreeEntry integrity
+    for obj in gamestate_data:
+        if obj["model"] == "game.decreeentry":
+            if "column" not in obj["fields"] or obj["fields"]["column"] is None:
+                print(f"CRITICAL: Caught bad DecreeEntry in snapshot: {obj}")
+
+    checkpoint = Checkpoint.record(game, gamestate_data, previous=previous)
+    metrics.add_checkpoint_size(checkpoint.gamestate)
+    return checkpoint
+
+
 def atomic_game_action(func, undoable: bool = True):
+    full_name = transaction_name(func)
+    register_transaction(full_name, func)
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # return func(*args, **kwargs)
@@ -66,41 +116,24 @@ def atomic_game_action(func, undoable: bool = True):
             # Fallback: execute without logging if game cannot be found
             return func(*args, **kwargs)
 
-        with transaction.atomic():
+        with (
+            metrics.measure(metrics.TRANSACTION, full_name),
+            transaction.atomic(),
+            board_state_cache(),
+        ):
+            # Serialize actions on the same game, and act on it as the last one left it
+            lock_game(game)
+
             # Get the last checkpoint for the game
             last_checkpoint = Checkpoint.objects.filter(game=game).order_by("id").last()
 
             checkpoint = None
-            if last_checkpoint:
-                # Check if the serialized state matches the current turn
-                # Find Game object in snapshot list
-                snapshot_turn = None
-                for obj in last_checkpoint.gamestate:
-                    if obj["model"] == "game.game":
-                        snapshot_turn = obj["fields"].get("current_turn")
-                        break
-
-                if snapshot_turn == game.current_turn:
-                    checkpoint = last_checkpoint
+            # Reuse the last checkpoint if it was captured during the current turn
+            if last_checkpoint and last_checkpoint.snapshot_turn == game.current_turn:
+                checkpoint = last_checkpoint
 
             if not checkpoint:
-                # Create a new checkpoint
-                gamestate_data = capture_gamestate(game)
-
-                # Debug: Check DecreeEntry integrity
-                for obj in gamestate_data:
-                    if obj["model"] == "game.decreeentry":
-                        if (
-                            "column" not in obj["fields"]
-                            or obj["fields"]["column"] is None
-                        ):
-                            print(
-                                f"CRITICAL: Caught bad DecreeEntry in snapshot: {obj}"
-                            )
-
-                checkpoint = Checkpoint.objects.create(
-                    game=game, gamestate=gamestate_data
-                )
+                checkpoint = create_checkpoint(game, previous=last_checkpoint)
 
             # Serialize arguments for the action
             s_args, s_kwargs = ActionSerializer.serialize_args(args, kwargs)
@@ -109,8 +142,7 @@ def atomic_game_action(func, undoable: bool = True):
             action_number = Action.objects.filter(checkpoint=checkpoint).count()
 
             # Record the action
-            full_name = f"{func.__module__}.{func.__qualname__}"
-            Action.objects.create(
+            action = Action.objects.create(
                 checkpoint=checkpoint,
                 action_number=action_number,
                 transaction_name=full_name,
@@ -120,31 +152,22 @@ def atomic_game_action(func, undoable: bool = True):
             result = func(*args, **kwargs)
             if not undoable:
                 # Create a new checkpoint
-                gamestate_data = capture_gamestate(game)
-
-                # Debug: Check DecreeEntry integrity
-                for obj in gamestate_data:
-                    if obj["model"] == "game.decreeentry":
-                        if (
-                            "column" not in obj["fields"]
-                            or obj["fields"]["column"] is None
-                        ):
-                            print(
-                                f"CRITICAL: Caught bad DecreeEntry in snapshot: {obj}"
-                            )
-
-                checkpoint = Checkpoint.objects.create(
-                    game=game, gamestate=gamestate_data
+                # (reload: the action may have changed the game row through another instance)
+                create_checkpoint(Game.objects.get(pk=game.pk), previous=checkpoint)
+            elif (action_number + 1) % settings.CHECKPOINT_ACTION_INTERVAL == 0:
+                # Capture the resulting state so undo can skip replaying up to here
+                # (against the checkpoint's snapshot, rebuilt once per process and kept)
+                action.gamestate = diff_gamestate(
+                    checkpoint.get_gamestate(),
+                    capture_gamestate(Game.objects.get(pk=game.pk)),
                 )
+                action.save(update_fields=["gamestate"])
+                metrics.add_checkpoint_size(action.gamestate)
 
-            # Publish update to WebSocket
-            try:
-                channel_layer = get_channel_layer()
-                async_to_sync(channel_layer.group_send)(
-                    f"game_{game.id}", {"type": "game_update", "message": "update"}
-                )
-            except Exception as e:
-                print(f"Failed to send websocket update: {e}")
+            Game.bump_version(game.pk)
+
+            # Publish the diff to WebSocket once the action is visible to everyone
+            schedule_game_update(game.pk)
 
             return result
 
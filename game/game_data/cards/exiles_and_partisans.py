@@ -429,3 +429,11 @@ deck: list[CardsEP] = [
     CardsEP.AMBUSH_WILD,
     CardsEP.AMBUSH_WILD,
 ]
+
+# per card type, looked up instead of going through the enum for every card row
+# the suit letter stored on Card rows
+CARD_SUITS: dict[str, str] = {card.name: card.value.suit.value[0] for card in CardsEP}
+# the crafting cost, as suit values
+CARD_COSTS: dict[str, tuple[str, ...]] = {
+    card.name: tuple(suit.value for suit in card.value.cost) for card in CardsEP
+}
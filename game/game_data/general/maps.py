@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+from game.errors import InternalGameError
+from game.models import Game
+
+
+@dataclass(frozen=True)
+class MapGraph:
+    """static topology of a board map, keyed by clearing number"""
+
+    paths: Mapping[int, frozenset[int]]
+    rivers: Mapping[int, frozenset[int]]
+
+    def adjacent(self, clearing_number: int) -> frozenset[int]:
+        """clearings connected by a path"""
+        return self.paths.get(clearing_number, frozenset())
+
+    def river_adjacent(self, clearing_number: int) -> frozenset[int]:
+        """clearings connected by a river"""
+        return self.rivers.get(clearing_number, frozenset())
+
+
+def _adjacency(edges: list[tuple[int, int]]) -> Mapping[int, frozenset[int]]:
+    adjacency: dict[int, set[int]] = {}
+    for a, b in edges:
+        adjacency.setdefault(a, set()).add(b)
+        adjacency.setdefault(b, set()).add(a)
+    return MappingProxyType(
+        {number: frozenset(adjacent) for number, adjacent in adjacency.items()}
+    )
+
+
+# numbers based on map from https://www.therootdatabase.com/map/autumn/
+AUTUMN_MAP = MapGraph(
+    paths=_adjacency(
+        [
+            (1, 5), (1, 9), (1, 10),
+            (2, 5), (2, 6), (2, 10),
+            (3, 6), (3, 7), (3, 11),
+            (4, 8), (4, 9), (4, 12),
+            (6, 11),
+            (7, 8), (7, 12),
+            (9, 12),
+            (10, 12),
+            (11, 12),
+        ]
+    ),
+    rivers=_adjacency([(4, 7), (7, 11), (11, 10), (10, 5)]),
+)
+
+MAP_GRAPHS: Mapping[str, MapGraph] = MappingProxyType(
+    {
+        Game.BoardMaps.AUTUMN: AUTUMN_MAP,
+    }
+)
+
+
+def get_map_graph(boardmap: str) -> MapGraph:
+    try:
+        return MAP_GRAPHS[boardmap]
+    except KeyError:
+        raise InternalGameError("Board map not supported")
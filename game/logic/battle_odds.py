@@ -0,0 +1,105 @@
+import functools
+from dataclasses import dataclass
+import numpy as np
+
+# the 16 equally likely rolls of the two 0-3 battle dice
+_DIE1, _DIE2 = np.meshgrid(np.arange(4), np.arange(4))
+_HIGH = np.maximum(_DIE1, _DIE2).ravel()
+_LOW = np.minimum(_DIE1, _DIE2).ravel()
+
+
+@dataclass(frozen=True)
+class BattleScenario:
+    """everything that decides how a battle can end, the key of the odds cache"""
+
+    attacker_warriors: int
+    defender_warriors: int
+    # buildings and tokens in the clearing, hit once the warriors are gone
+    attacker_pieces: int = 0
+    defender_pieces: int = 0
+    # Woodland Alliance defending: the defender deals the higher roll
+    guerrilla: bool = False
+    # the defender ambushes and the attacker does not cancel it
+    ambush: bool = False
+    # hits added to the roll (Birds Commander, Partisans, facedown plots)
+    extra_attacker_hits: int = 0
+    extra_defender_hits: int = 0
+
+
+@dataclass(frozen=True)
+class BattleOdds:
+    # expected hits taken, and warriors lost to them
+    attacker_hits: float
+    defender_hits: float
+    attacker_warriors_lost: float
+    defender_warriors_lost: float
+    # chance of losing every warrior, and every piece, in the clearing
+    attacker_warriors_wiped: float
+    defender_warriors_wiped: float
+    attacker_wiped: float
+    defender_wiped: float
+    # expected points for the buildings and tokens removed
+    attacker_points: float
+    defender_points: float
+
+
+def _losses(hits: np.ndarray, warriors: int, pieces: int) -> tuple[np.ndarray, np.ndarray]:
+    """warriors and other pieces removed by hits, warriors first"""
+    warriors_lost = np.minimum(hits, warriors)
+    return warriors_lost, np.minimum(hits - warriors_lost, pieces)
+
+
+@functools.lru_cache(maxsize=4096)
+def battle_odds(scenario: BattleScenario) -> BattleOdds:
+    """
+    the outcome of a battle over every roll of the dice, following roll_dice and
+    apply_dice_hits. Partisans are assumed to be used.
+    """
+    attackers = scenario.attacker_warriors
+    defenders = scenario.defender_warriors
+    attacker_pieces = scenario.attacker_pieces
+    ambush_hits = 2 if scenario.ambush else 0
+    ambush_warriors = min(ambush_hits, attackers)
+    # an attacker with a single warrior loses a building or token to the second hit
+    ambush_pieces = min(ambush_hits - ambush_warriors, attacker_pieces)
+    attackers -= ambush_warriors
+    attacker_pieces -= ambush_pieces
+
+    if attackers == 0:
+        # the ambush ended the battle before the roll
+        attacker_hits = defender_hits = np.zeros_like(_HIGH)
+    elif scenario.guerrilla:
+        attacker_hits = np.minimum(_HIGH, defenders)
+        defender_hits = np.minimum(_LOW, attackers)
+    else:
+        attacker_hits = np.minimum(_LOW, defenders)
+        defender_hits = np.minimum(_HIGH, attackers)
+    if attackers:
+        attacker_hits = attacker_hits + scenario.extra_attacker_hits
+        # defenseless: an extra hit on a defender without warriors
+        defender_hits = defender_hits + scenario.extra_defender_hits + (defenders == 0)
+
+    attacker_warriors_lost, attacker_pieces_lost = _losses(
+        attacker_hits, attackers, attacker_pieces
+    )
+    defender_warriors_lost, defender_pieces_lost = _losses(
+        defender_hits, defenders, scenario.defender_pieces
+    )
+    attackers_left = attackers - attacker_warriors_lost
+    defenders_left = defenders - defender_warriors_lost
+    return BattleOdds(
+        attacker_hits=ambush_hits + float(attacker_hits.mean()),
+        defender_hits=float(defender_hits.mean()),
+        attacker_warriors_lost=ambush_warriors + float(attacker_warriors_lost.mean()),
+        defender_warriors_lost=float(defender_warriors_lost.mean()),
+        attacker_warriors_wiped=float((attackers_left == 0).mean()),
+        defender_warriors_wiped=float((defenders_left == 0).mean()),
+        attacker_wiped=float(
+            ((attackers_left == 0) & (attacker_pieces_lost == attacker_pieces)).mean()
+        ),
+        defender_wiped=float(
+            ((defenders_left == 0) & (defender_pieces_lost == scenario.defender_pieces)).mean()
+        ),
+        attacker_points=float(defender_pieces_lost.mean()),
+        defender_points=ambush_pieces + float(attacker_pieces_lost.mean()),
+    )
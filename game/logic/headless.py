@@ -0,0 +1,223 @@
+import threading
+from contextlib import contextmanager
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Q
+from django.db.models.fields import AutoFieldMixin
+from django.db.utils import load_backend
+from game.decorators.transaction_decorator import (
+    create_checkpoint,
+    is_playback_mode,
+    set_playback_mode,
+)
+from game.errors import InternalGameError
+from game.logic.playback import actions_to_replay, replay_actions, restore_point
+from game.models.checkpoint_models import Checkpoint
+from game.models.game_models import Game
+from game.queries.board_state import board_state_cache
+from game.utils.game_updates import schedule_game_update
+from game.utils.loader import load_gamestate
+from game.utils.snapshot import SNAPSHOT_MODEL_ORDER, capture_gamestate
+
+# the database in settings.DATABASES the in-memory engines are opened like
+HEADLESS_DB_ALIAS = "headless"
+
+# an empty in-memory database with every table, copied into each new engine.
+# Kept open for the thread's next engines, it goes with the thread
+_templates = threading.local()
+
+
+def _memory_connection():
+    """a new connection to a private in-memory SQLite database"""
+    settings_dict = connections[HEADLESS_DB_ALIAS].settings_dict
+    # aliased as the default database, so instances read in the engine save back to it
+    engine = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(
+        settings_dict, DEFAULT_DB_ALIAS
+    )
+    engine.ensure_connection()
+    return engine
+
+
+def _close(engine) -> None:
+    """
+    drops an in-memory database. Django's close() keeps in-memory connections open
+    so their data survives, the raw connection has to be closed instead
+    """
+    if engine.connection is not None:
+        engine.connection.close()
+        engine.connection = None
+
+
+def _schema_template():
+    template = getattr(_templates, "connection", None)
+    if template is None:
+        template = _memory_connection()
+        with template.schema_editor() as editor:
+            for model in apps.get_models():
+                if model._meta.managed and not model._meta.proxy:
+                    editor.create_model(model)
+        _templates.connection = template
+    return template
+
+
+def _sequence_tables() -> list[tuple[str, str]]:
+    """tables (and their pk column) of snapshot models that own an autoincrement sequence"""
+    return sorted(
+        {
+            (model._meta.db_table, model._meta.pk.column)
+            for model in SNAPSHOT_MODEL_ORDER
+            if isinstance(model._meta.pk, AutoFieldMixin)
+        }
+    )
+
+
+def _next_ids() -> dict[str, int]:
+    """highest pk in use per snapshot table of the real database, in one query"""
+    connection = connections[DEFAULT_DB_ALIAS]
+    quote = connection.ops.quote_name
+    tables = _sequence_tables()
+    sql = " UNION ALL ".join(
+        f"SELECT %s, COALESCE(MAX({quote(column)}), 0) FROM {quote(table)}"
+        for table, column in tables
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table for table, _ in tables])
+        return dict(cursor.fetchall())
+
+
+class HeadlessGame:
+    """
+    A copy of a game in a private in-memory SQLite database, for bots, what-if analysis
+    and fast replays.
+    Inside activate() the thread's default connection is the in-memory one, so the
+    transaction functions and queries run unchanged, without touching the database file
+    and without recording checkpoints or actions. write_back() applies the result to the
+    real game as one bulk diff.
+    One thread only, like any database connection. close() (or a with block) drops the
+    in-memory database.
+    """
+
+    def __init__(self, game_id: int, engine):
+        self.game_id = game_id
+        self.engine = engine
+
+    @classmethod
+    def from_gamestate(cls, game_id: int, gamestate: list) -> "HeadlessGame":
+        """loads a snapshot (capture_gamestate format) of the game"""
+        users = serializers.serialize(
+            "python",
+            User.objects.filter(Q(player__game_id=game_id) | Q(game__pk=game_id)).distinct(),
+        )
+        next_ids = _next_ids()
+        engine = _memory_connection()
+        headless = cls(game_id, engine)
+        try:
+            _schema_template().connection.backup(engine.connection)
+            with headless.activate(), transaction.atomic():
+                for obj in serializers.deserialize("python", users + gamestate):
+                    obj.save()
+                # rows created in the engine take pks the real database has not used yet,
+                # so write_back() can insert them as they are
+                with engine.cursor() as cursor:
+                    cursor.execute("DELETE FROM sqlite_sequence")
+                    cursor.executemany(
+                        "INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)",
+                        list(next_ids.items()),
+                    )
+        except BaseException:
+            headless.close()
+            raise
+        return headless
+
+    @classmethod
+    def from_game(cls, game: Game) -> "HeadlessGame":
+        return cls.from_gamestate(game.pk, capture_gamestate(game))
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Checkpoint, action_number: int) -> "HeadlessGame":
+        """the game as it was after action_number of the checkpoint, replayed in memory"""
+        gamestate, replay_from = restore_point(checkpoint, action_number)
+        actions = actions_to_replay(checkpoint, replay_from, action_number)
+        headless = cls.from_gamestate(checkpoint.game_id, gamestate)
+        try:
+            with headless.activate(), transaction.atomic():
+                replay_actions(actions)
+        except BaseException:
+            headless.close()
+            raise
+        return headless
+
+    def fork(self) -> "HeadlessGame":
+        """an independent copy of the current in-memory game"""
+        self.validate_open()
+        engine = _memory_connection()
+        self.engine.connection.backup(engine.connection)
+        return HeadlessGame(self.game_id, engine)
+
+    def close(self) -> None:
+        """drops the in-memory game"""
+        _close(self.engine)
+
+    @property
+    def closed(self) -> bool:
+        return self.engine.connection is None
+
+    def validate_open(self) -> None:
+        """raises if closed, instead of quietly connecting to a new, empty database"""
+        if self.closed:
+            raise InternalGameError("Headless game is closed")
+
+    def __enter__(self) -> "HeadlessGame":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def activate(self):
+        """runs the block against the in-memory game"""
+        self.validate_open()
+        real = connections[DEFAULT_DB_ALIAS]
+        replaying = is_playback_mode()
+        connections[DEFAULT_DB_ALIAS] = self.engine
+        # nothing to undo in memory: atomic_game_action runs the bare transaction
+        set_playback_mode(True)
+        try:
+            with board_state_cache(isolated=True):
+                yield
+        finally:
+            set_playback_mode(replaying)
+            connections[DEFAULT_DB_ALIAS] = real
+
+    @property
+    def game(self) -> Game:
+        with self.activate():
+            return Game.objects.get(pk=self.game_id)
+
+    def run(self, func, *args, **kwargs):
+        """
+        runs a transaction function on the in-memory game, all or nothing.
+        Model arguments should be read inside activate(), the real rows may be stale.
+        """
+        with self.activate(), transaction.atomic():
+            return func(*args, **kwargs)
+
+    def snapshot(self) -> list:
+        with self.activate():
+            return capture_gamestate(Game.objects.get(pk=self.game_id))
+
+    @transaction.atomic
+    def write_back(self) -> None:
+        """
+        Makes the in-memory game the real one, writing only the rows that changed.
+        The result is checkpointed like an action that can't be undone.
+        """
+        load_gamestate(self.game_id, self.snapshot())
+        game = Game.objects.get(pk=self.game_id)
+        create_checkpoint(
+            game, previous=Checkpoint.objects.filter(game=game).order_by("id").last()
+        )
+        Game.bump_version(game.pk)
+        schedule_game_update(game.pk)
@@ -1,20 +1,131 @@
+import copy
 import importlib
 from django.db import transaction
 from game.models.game_models import Game
 from game.models.checkpoint_models import Checkpoint, Action
 from game.utils.loader import load_gamestate
-from game.decorators.transaction_decorator import set_playback_mode
+from game.utils.snapshot import apply_gamestate_delta
+from game.decorators.transaction_decorator import (
+    is_playback_mode,
+    lock_game,
+    set_playback_mode,
+    get_registered_transaction,
+    register_transaction,
+)
+from game.queries.board_state import board_state_cache
 from game.serializers.action_serializer import ActionSerializer
 
 
 def get_function_by_name(full_name):
+    func = get_registered_transaction(full_name)
+    if func is not None:
+        return func
+    # not wrapped in this process yet: import it once and remember it
     try:
         module_name, func_name = full_name.rsplit(".", 1)
         module = importlib.import_module(module_name)
         func = getattr(module, func_name)
-        return func
     except (ValueError, ImportError, AttributeError):
         raise ValueError(f"Could not resolve function: {full_name}")
+    register_transaction(full_name, func)
+    return func
+
+
+def _action_refs(action: Action) -> dict:
+    """model references in an action's recorded args, grouped by model label"""
+    return ActionSerializer.collect_model_refs(
+        [action.args.get("args", []), list(action.args.get("kwargs", {}).values())]
+    )
+
+
+def _filter_refs(refs: dict, static: bool) -> dict:
+    return {
+        label: pks
+        for label, pks in refs.items()
+        if (label in ActionSerializer.STATIC_MODELS) == static
+    }
+
+
+def _fresh_copies(instances: dict, refs: dict) -> dict:
+    """
+    copies of the instances among refs: a transaction caching a relation on one
+    (clearing.game, slot.building...) must not hand it to the next replayed action
+    """
+    return {
+        (label, pk): copy.copy(instances[(label, pk)])
+        for label, pks in refs.items()
+        for pk in pks
+        if (label, pk) in instances
+    }
+
+
+def restore_point(checkpoint: Checkpoint, action_number: int) -> tuple[list, int]:
+    """
+    the gamestate to restore before replaying up to action_number:
+    the checkpoint's, or the latest one captured by an action, and the first action after it
+    """
+    gamestate = checkpoint.get_gamestate()
+    captured = (
+        Action.objects.filter(
+            checkpoint=checkpoint,
+            action_number__lte=action_number,
+            gamestate__isnull=False,
+        )
+        .order_by("action_number")
+        .last()
+    )
+    if captured is None:
+        return gamestate, 0
+    return apply_gamestate_delta(gamestate, captured.gamestate), captured.action_number + 1
+
+
+def actions_to_replay(checkpoint: Checkpoint, replay_from: int, action_number: int) -> list:
+    return list(
+        Action.objects.filter(
+            checkpoint=checkpoint,
+            action_number__gte=replay_from,
+            action_number__lte=action_number,
+        )
+        .defer("gamestate")
+        .order_by("action_number")
+    )
+
+
+def replay_actions(actions: list[Action]) -> None:
+    """runs the recorded transactions again, without recording them"""
+    # Static rows (clearings, cards) are loaded once for the whole batch, and copied
+    # for each action. Other references are loaded per action, after the previous ones ran.
+    batch_refs = {}
+    for action in actions:
+        for label, pks in _action_refs(action).items():
+            batch_refs.setdefault(label, set()).update(pks)
+    static_instances = ActionSerializer.fetch_model_refs(
+        _filter_refs(batch_refs, static=True)
+    )
+
+    replaying = is_playback_mode()
+    set_playback_mode(True)
+    try:
+        with board_state_cache():
+            for action in actions:
+                func = get_function_by_name(action.transaction_name)
+                # Deserialize args
+                raw_args = action.args.get("args", [])
+                raw_kwargs = action.args.get("kwargs", {})
+                refs = _action_refs(action)
+                instances = {
+                    **_fresh_copies(static_instances, _filter_refs(refs, static=True)),
+                    **ActionSerializer.fetch_model_refs(_filter_refs(refs, static=False)),
+                }
+                d_args, d_kwargs = ActionSerializer.deserialize_args(
+                    raw_args, raw_kwargs, instances
+                )
+
+                # Execute
+                func(*d_args, **d_kwargs)
+
+    finally:
+        set_playback_mode(replaying)
 
 
 @transaction.atomic
@@ -25,51 +136,33 @@ def playback_to_action(game: Game, checkpoint_id: int, action_number: int):
     except Checkpoint.DoesNotExist:
         return
 
-    # Restore Game State from checkpoint
-
-    load_gamestate(game.id, checkpoint.gamestate)
+    # Restore Game State from checkpoint, or from the latest captured action state
+    gamestate, replay_from = restore_point(checkpoint, action_number)
+    load_gamestate(game.id, gamestate)
 
     # Reload game object
     game.refresh_from_db()
 
-    # Retrieve actions to replay
-    actions = Action.objects.filter(
-        checkpoint=checkpoint, action_number__lte=action_number
-    ).order_by("action_number")
-
-    # Replay actions
-
-    set_playback_mode(True)
-    try:
-        for action in actions:
-            print(f"Action: {action.transaction_name}")
-            func = get_function_by_name(action.transaction_name)
-            print(f"func: {func}")
-            # Deserialize args
-            raw_args = action.args.get("args", [])
-            raw_kwargs = action.args.get("kwargs", {})
-            print(f"raw_args: {raw_args}")
-            print(f"raw_kwargs: {raw_kwargs}")
-            d_args, d_kwargs = ActionSerializer.deserialize_args(raw_args, raw_kwargs)
-            print(f"Args: {d_args}, {d_kwargs}")
-
-            # Execute
-            func(*d_args, **d_kwargs)
-
-    finally:
-        set_playback_mode(False)
+    # Replay the actions after the restored state
+    replay_actions(actions_to_replay(checkpoint, replay_from, action_number))
 
 
 @transaction.atomic
 @transaction.atomic
 def undo_last_action(game: Game):
+    # wait for an action in progress, and undo the one it leaves last
+    lock_game(game)
     # Get the MOST RECENT checkpoint
     checkpoint = Checkpoint.objects.filter(game=game).order_by("id").last()
 
     if not checkpoint:
         return
 
-    actions = Action.objects.filter(checkpoint=checkpoint).order_by("action_number")
+    actions = (
+        Action.objects.filter(checkpoint=checkpoint)
+        .defer("gamestate")
+        .order_by("action_number")
+    )
     if actions.exists():
         last_action = actions.last()
         last_action.delete()
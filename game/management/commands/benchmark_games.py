@@ -0,0 +1,189 @@
+import json
+import logging
+import time
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from game.models.game_models import Faction
+from game.tests.scripted_game import ScriptedGame
+from game.utils import metrics
+
+SCENARIOS = {
+    "4p": [Faction.CATS, Faction.BIRDS, Faction.WOODLAND_ALLIANCE, Faction.CROWS],
+    "5p": [
+        Faction.CATS,
+        Faction.BIRDS,
+        Faction.WOODLAND_ALLIANCE,
+        Faction.CROWS,
+        Faction.MOLES,
+    ],
+}
+DEFAULT_BASELINE = settings.BASE_DIR / "benchmarks" / "baseline.json"
+# figures compared against the baseline; totals depend on how far a game got, and
+# endpoint percentiles over a few dozen calls swing too much between identical runs
+COMPARED_FIGURES = ("queries_per_action", "checkpoint_bytes_per_action")
+# wall clock depends on the machine as much as on the code: reported, compared on request
+TIME_FIGURE = "time_per_action"
+
+
+class Command(BaseCommand):
+    help = (
+        "Plays scripted 4 and 5 faction games on a throwaway test database and reports "
+        "endpoint latency (p50/p95), and time, queries and checkpoint bytes per action. "
+        "Compares queries and checkpoint bytes per action against a JSON baseline (time "
+        "too with --compare-time) and fails on regressions over the threshold, or if a "
+        "game hit a server error or got stuck."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=sorted(SCENARIOS),
+            help="scenario to play (repeatable, default: all)",
+        )
+        parser.add_argument("--actions", type=int, default=300)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="allowed relative increase over the baseline (0.25 = 25%%)",
+        )
+        parser.add_argument(
+            "--compare-time",
+            action="store_true",
+            help="fail on time per action too (only against a baseline from this machine)",
+        )
+        parser.add_argument("--output", type=Path, help="write the results to this file")
+        parser.add_argument(
+            "--write-baseline",
+            action="store_true",
+            help="store the results as the new baseline instead of comparing",
+        )
+
+    def handle(self, *args, **options):
+        names = options["scenario"] or sorted(SCENARIOS)
+        # the scripted players try plenty of illegal payloads, don't log every 400
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            with override_settings(
+                CHANNEL_LAYERS={
+                    "default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}
+                },
+                METRICS_CHECKPOINT_SIZE=True,
+                # against the throwaway in-memory database, from this thread only
+                GAME_UPDATES_IN_BACKGROUND=False,
+            ):
+                results = {
+                    name: self.run_scenario(name, options["seed"], options["actions"])
+                    for name in names
+                }
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        report = {"seed": options["seed"], "actions": options["actions"], "scenarios": results}
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name}: {result['game']['actions']} actions in {result['wall_time']:.1f}s, "
+                f"{result['queries_per_action']:.1f} queries/action, "
+                f"{result['checkpoint_bytes_per_action']:.0f} checkpoint bytes/action"
+            )
+            for error, count in result["errors"].items():
+                self.stderr.write(f"{name}: {count} x {error}")
+        if options["output"]:
+            self.write_json(options["output"], report)
+        # figures of a game cut short by a bug don't describe the code, don't keep or compare them
+        incomplete = [name for name, result in results.items() if not result["completed"]]
+        if incomplete:
+            raise CommandError(
+                f"{', '.join(incomplete)} did not complete (server errors or stuck), "
+                "pick another --seed or fix the game"
+            )
+        if options["write_baseline"]:
+            self.write_json(options["baseline"], report)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+            return
+        if not options["baseline"].exists():
+            self.stdout.write(f"No baseline at {options['baseline']}, nothing to compare")
+            return
+
+        baseline = json.loads(options["baseline"].read_text())
+        for name, result in report["scenarios"].items():
+            old_time = baseline.get("scenarios", {}).get(name, {}).get(TIME_FIGURE)
+            if old_time is not None:
+                self.stdout.write(
+                    f"{name} time per action: {old_time} -> {result[TIME_FIGURE]}"
+                    + ("" if options["compare_time"] else " (not compared, see --compare-time)")
+                )
+        figures = COMPARED_FIGURES + ((TIME_FIGURE,) if options["compare_time"] else ())
+        regressions = self.compare(baseline, report, options["threshold"], figures)
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(regression)
+            raise CommandError(f"{len(regressions)} regression(s) over the baseline")
+        self.stdout.write(self.style.SUCCESS("No regressions over the baseline"))
+
+    def run_scenario(self, name: str, seed: int, max_actions: int) -> dict:
+        metrics.reset_metrics()
+        game = ScriptedGame(SCENARIOS[name], seed=seed, name=f"bench-{name}")
+        start = time.perf_counter()
+        game.set_up()
+        game.play(max_actions)
+        wall_time = time.perf_counter() - start
+
+        endpoints = [m for m in metrics.get_all_metrics() if m["kind"] == metrics.ENDPOINT]
+        queries = sum(m["queries"] for m in endpoints)
+        checkpoint_bytes = sum(m["checkpoint_size"] for m in endpoints)
+        # every request a player makes counts towards the actions it completes
+        actions = max(game.actions, 1)
+        return {
+            "game": game.report(),
+            "completed": game.completed,
+            "errors": game.errors(),
+            "wall_time": round(wall_time, 3),
+            "time_per_action": round(wall_time / actions, 4),
+            "queries_per_action": round(queries / actions, 2),
+            "checkpoint_bytes": checkpoint_bytes,
+            "checkpoint_bytes_per_action": round(checkpoint_bytes / actions, 1),
+            "endpoints": {
+                route: {
+                    "count": len(timings),
+                    "p50": round(metrics.percentile(timings, 0.5), 4),
+                    "p95": round(metrics.percentile(timings, 0.95), 4),
+                }
+                for route, timings in sorted(game.timings.items())
+            },
+        }
+
+    def compare(
+        self, baseline: dict, report: dict, threshold: float, figures: tuple[str, ...]
+    ) -> list[str]:
+        regressions = []
+
+        for name, result in report["scenarios"].items():
+            old = baseline.get("scenarios", {}).get(name)
+            if old is None:
+                continue
+            for figure in figures:
+                old_value, new_value = old.get(figure), result[figure]
+                if old_value is not None and new_value > old_value * (1 + threshold):
+                    regressions.append(
+                        f"{name} {figure.replace('_', ' ')}: {old_value} -> {new_value}"
+                    )
+        return regressions
+
+    def write_json(self, path: Path, data: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2) + "\n")
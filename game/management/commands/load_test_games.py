@@ -0,0 +1,208 @@
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from rest_framework_simplejwt.tokens import AccessToken
+from game.models.game_models import Faction
+from game.tests.scripted_game import ScriptedGame
+from game.utils import metrics
+from rootGame.asgi import application
+
+FACTIONS = [Faction.CATS, Faction.BIRDS, Faction.WOODLAND_ALLIANCE, Faction.CROWS]
+# time left to the subscribers for the updates of the last actions
+DRAIN_TIME = 1.0
+
+
+class GameSubscriber:
+    """A player's websocket connection to ws/game/<id>/, timing every update it receives"""
+
+    def __init__(self, application, game_id: int, user: User):
+        self.communicator = WebsocketCommunicator(application, f"/ws/game/{game_id}/")
+        self.token = str(AccessToken.for_user(user))
+        self.delays: list[float] = []
+        self.messages = 0
+        # updates older than one received before (versions may skip: updates are merged)
+        self.out_of_order = 0
+        self.version = None
+
+    async def connect(self) -> None:
+        connected, _ = await self.communicator.connect()
+        assert connected
+        await self.communicator.send_json_to({"type": "authenticate", "token": self.token})
+        response = await self.communicator.receive_json_from()
+        assert response["type"] == "authenticated", response
+
+    async def listen(self) -> None:
+        while True:
+            # no timeout: a timed out receive cancels the consumer
+            message = await self.communicator.receive_json_from(timeout=None)
+            received_at = time.time()
+            self.messages += 1
+            if message.get("committed_at") is not None:
+                self.delays.append(received_at - message["committed_at"])
+            version = message.get("version")
+            if version is not None:
+                if self.version is not None and version < self.version:
+                    self.out_of_order += 1
+                self.version = max(version, self.version or 0)
+
+
+def summary(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "p50": round(metrics.percentile(values, 0.5), 4),
+        "p95": round(metrics.percentile(values, 0.95), 4),
+        "p99": round(metrics.percentile(values, 0.99), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def is_lock_error(exception: BaseException) -> bool:
+    return isinstance(exception, OperationalError) and "locked" in str(exception)
+
+
+class Command(BaseCommand):
+    help = (
+        "Plays concurrent scripted games, 4 players each, on a throwaway SQLite file "
+        "database, with every player subscribed to the game's websocket. Reports "
+        "throughput, request latency, database lock errors and commit to websocket "
+        "delivery time. Runs in-process, on an in-memory channel layer unless --redis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--games", type=int, default=4)
+        parser.add_argument("--actions", type=int, default=100, help="actions per game")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--redis",
+            action="store_true",
+            help="use the configured channel layer (a local Redis) instead of an in-memory one",
+        )
+        parser.add_argument("--output", type=Path, help="write the results to this file")
+
+    def handle(self, *args, **options):
+        # the scripted players try plenty of illegal payloads, don't log every 400
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        channel_layers = (
+            {}
+            if options["redis"]
+            else {
+                "CHANNEL_LAYERS": {
+                    "default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}
+                }
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            # a database file like production, not SQLite's shared in-memory database,
+            # so concurrent writers wait on (and fail with) the same locks
+            database = connections["default"].settings_dict
+            if database["ENGINE"] == "django.db.backends.sqlite3":
+                database["TEST"]["NAME"] = str(Path(directory) / "load_test.sqlite3")
+            setup_test_environment()
+            old_config = setup_databases(verbosity=0, interactive=False)
+            try:
+                with override_settings(**channel_layers):
+                    report = asyncio.run(self.run(options))
+            finally:
+                teardown_databases(old_config, verbosity=0)
+                teardown_test_environment()
+
+        self.stdout.write(
+            f"{report['actions']} actions in {report['wall_time']:.1f}s "
+            f"({report['actions_per_second']:.2f}/s), "
+            f"{report['lock_errors']} lock errors, {report['server_errors']} server errors"
+        )
+        for label, key in (("actions", "action_latency"), ("delivery", "delivery_latency")):
+            stats = report[key]
+            if stats["count"]:
+                self.stdout.write(
+                    f"{label}: p50 {stats['p50']}s, p95 {stats['p95']}s, "
+                    f"p99 {stats['p99']}s, max {stats['max']}s"
+                )
+        if options["output"]:
+            options["output"].parent.mkdir(parents=True, exist_ok=True)
+            options["output"].write_text(json.dumps(report, indent=2) + "\n")
+
+    async def run(self, options: dict) -> dict:
+        games = [
+            ScriptedGame(FACTIONS, seed=options["seed"] + i, name=f"load-{i}")
+            for i in range(options["games"])
+        ]
+        # set up one after the other, the load is the playing
+        for game in games:
+            await sync_to_async(game.set_up, thread_sensitive=False)()
+        users = await sync_to_async(
+            lambda: {
+                game.game_id: list(User.objects.filter(player__game_id=game.game_id))
+                for game in games
+            }
+        )()
+        subscribers = [
+            GameSubscriber(application, game.game_id, user)
+            for game in games
+            for user in users[game.game_id]
+        ]
+        for subscriber in subscribers:
+            await subscriber.connect()
+        listeners = [asyncio.create_task(s.listen()) for s in subscribers]
+
+        def play(game: ScriptedGame) -> None:
+            try:
+                game.play(options["actions"])
+            finally:
+                connections.close_all()
+
+        start = time.perf_counter()
+        # one thread per game, the players of a game take turns
+        await asyncio.gather(
+            *(sync_to_async(play, thread_sensitive=False)(game) for game in games)
+        )
+        wall_time = time.perf_counter() - start
+
+        await asyncio.sleep(DRAIN_TIME)
+        for listener in listeners:
+            listener.cancel()
+        await asyncio.gather(*listeners, return_exceptions=True)
+        for subscriber in subscribers:
+            await subscriber.communicator.disconnect()
+
+        actions = sum(game.actions for game in games)
+        exceptions = [e for game in games for e in game.exceptions]
+        return {
+            "games": len(games),
+            "players": len(subscribers),
+            "actions": actions,
+            "wall_time": round(wall_time, 3),
+            "actions_per_second": round(actions / wall_time, 3),
+            "action_latency": summary(
+                [
+                    t
+                    for game in games
+                    for route, timings in game.timings.items()
+                    if route.startswith("POST ")
+                    for t in timings
+                ]
+            ),
+            "delivery_latency": summary([d for s in subscribers for d in s.delays]),
+            "messages": sum(s.messages for s in subscribers),
+            "out_of_order_updates": sum(s.out_of_order for s in subscribers),
+            "lock_errors": sum(is_lock_error(e) for e in exceptions),
+            "server_errors": sum(game.server_errors for game in games),
+            "stuck_games": sum(game.stuck for game in games),
+        }
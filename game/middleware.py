@@ -0,0 +1,70 @@
+from rest_framework.permissions import SAFE_METHODS
+from game.models.game_models import Game
+from game.queries.board_state import board_state_cache
+from game.utils import metrics
+from game.utils.game_updates import deferred_game_updates
+
+
+class MetricsMiddleware:
+    """Records queries, DB time and total time of every request, per route"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with metrics.measure(metrics.ENDPOINT, "unresolved") as measurement:
+            response = self.get_response(request)
+            match = request.resolver_match
+            # the route pattern, so all games share one entry
+            route = match.route if match is not None else "unresolved"
+            measurement.name = f"{request.method} /{route}"
+        return response
+
+
+class BoardStateCacheMiddleware:
+    """Shares one BoardState per game between the queries of a request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with board_state_cache():
+            return self.get_response(request)
+
+
+class GameUpdateMiddleware:
+    """
+    Sends at most one websocket update per game and request, after the response
+    is built (and the game version bumped), however many actions were committed
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with deferred_game_updates():
+            return self.get_response(request)
+
+
+class GameVersionMiddleware:
+    """
+    Bumps the version of the game a successful write request (POST, PATCH, ...)
+    was made for, so setup and undo views change the game's ETag too.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        game_id = getattr(request, "game_id", None)
+        if (
+            game_id is not None
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            Game.bump_version(game_id)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.game_id = view_kwargs.get("game_id")
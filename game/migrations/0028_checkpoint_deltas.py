@@ -0,0 +1,24 @@
+# Generated by Django 5.0.6 on 2026-10-18 01:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0027_revealedcardentry_returned_to_hand_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='checkpoint',
+            name='base',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='deltas', to='game.checkpoint'),
+        ),
+        migrations.AddField(
+            model_name='checkpoint',
+            name='current_turn',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-18 01:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0028_checkpoint_deltas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='action',
+            name='gamestate',
+            field=models.JSONField(blank=True, default=None, null=True),
+        ),
+    ]
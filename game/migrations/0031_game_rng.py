@@ -0,0 +1,34 @@
+# Generated by Django 5.0.6 on 2026-10-18 03:37
+
+import game.utils.rng
+from django.db import migrations, models
+
+
+def reseed_games(apps, schema_editor):
+    """the default is evaluated once for existing rows: give every game a seed of its own"""
+    Game = apps.get_model("game", "Game")
+    rows = list(Game.objects.only("pk"))
+    for row in rows:
+        row.rng_seed = game.utils.rng.new_rng_seed()
+    Game.objects.bulk_update(rows, ["rng_seed"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0030_game_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='rng_draws',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='rng_seed',
+            field=models.BigIntegerField(default=game.utils.rng.new_rng_seed),
+        ),
+        migrations.RunPython(reseed_games, migrations.RunPython.noop),
+    ]
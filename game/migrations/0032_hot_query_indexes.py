@@ -0,0 +1,49 @@
+# Generated by Django 5.0.6 on 2026-10-18 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0031_game_rng'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='birdturn',
+            index=models.Index(fields=['player', 'turn_number'], name='game_birdtu_player__0523ff_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catturn',
+            index=models.Index(fields=['player', 'turn_number'], name='game_cattur_player__0a3c12_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='crowturn',
+            index=models.Index(fields=['player', 'turn_number'], name='game_crowtu_player__d0c1c0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_resolved', False)), fields=['game', 'created_at', 'id'], name='unresolved_event_stack'),
+        ),
+        migrations.AddIndex(
+            model_name='gamelog',
+            index=models.Index(fields=['game', 'created_at'], name='game_gamelo_game_id_fb8d84_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gamelog',
+            index=models.Index(fields=['game', 'player', 'log_type', 'created_at'], name='game_gamelo_game_id_c7c30e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='handentry',
+            index=models.Index(fields=['player', 'card'], name='game_handen_player__99695d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moleturn',
+            index=models.Index(fields=['player', 'turn_number'], name='game_moletu_player__dbd388_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='waturn',
+            index=models.Index(fields=['player', 'turn_number'], name='game_waturn_player__d17171_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:12
+
+from django.db import migrations, models
+
+
+def copy_created_at(apps, schema_editor):
+    """existing logs were last written when they were created, not when this ran"""
+    GameLog = apps.get_model("game", "GameLog")
+    GameLog.objects.update(updated_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0032_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamelog',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='gamelog',
+            index=models.Index(fields=['game', 'updated_at'], name='game_gamelo_game_id_3ebd34_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-18 05:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0033_game_log_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamelog',
+            name='rendered',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='gamelog',
+            name='rendered_redacted',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -1,19 +1,141 @@
+import threading
+from collections import OrderedDict
+from django.conf import settings
 from django.db import models
 from game.models.game_models import Game
 
+# The last snapshot materialized per game, so recording the next checkpoint (or an
+# action state) does not replay the base's deltas again. An entry only answers for
+# the checkpoint row it was built from: (id, created_at), as ids are reused after undo.
+_materialized: OrderedDict = OrderedDict()
+_materialized_lock = threading.Lock()
+
 class Checkpoint(models.Model):
     game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name='checkpoints')
+    # Full snapshot (fixture list) when base is null. Otherwise a delta
+    # ({"changed": [...], "deleted": [[model, pk], ...]}) against the previous
+    # checkpoint that shares the same base.
     gamestate = models.JSONField()
+    base = models.ForeignKey(
+        'self', on_delete=models.CASCADE, null=True, blank=True, related_name='deltas'
+    )
+    # game.current_turn at capture time, so the turn can be checked without
+    # rebuilding the snapshot. Null for checkpoints written before deltas existed.
+    current_turn = models.PositiveSmallIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['created_at']
 
+    @property
+    def is_delta(self) -> bool:
+        return self.base_id is not None
+
+    @property
+    def snapshot_turn(self) -> int | None:
+        """game.current_turn as it was when this checkpoint was captured"""
+        if self.current_turn is not None:
+            return self.current_turn
+        # legacy full snapshots: read it from the serialized Game row
+        for obj in self.get_gamestate():
+            if obj["model"] == "game.game":
+                return obj["fields"].get("current_turn")
+        return None
+
+    def get_gamestate(self) -> list:
+        """
+        Returns the full snapshot (fixture list) for this checkpoint,
+        rebuilding it from the base snapshot plus deltas if needed.
+        The list may be shared with later calls: never modify it.
+        """
+        return self._materialize()[0]
+
+    def _materialize(self) -> tuple[list, int]:
+        """the full snapshot and how many deltas of its base lead up to it"""
+        from game.utils.snapshot import apply_gamestate_delta
+
+        key = (self.id, self.created_at)
+        with _materialized_lock:
+            cached = _materialized.get(self.game_id)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        if not self.is_delta:
+            gamestate, chain = self.gamestate, 0
+        else:
+            base = self.base
+            assert base is not None
+            deltas = list(
+                Checkpoint.objects.filter(base=base, id__lte=self.id)
+                .order_by("id")
+                .values_list("gamestate", flat=True)
+            )
+            gamestate = base.gamestate
+            for delta in deltas:
+                gamestate = apply_gamestate_delta(gamestate, delta)
+            chain = len(deltas)
+        self._remember(gamestate, chain)
+        return gamestate, chain
+
+    def _remember(self, gamestate: list, chain: int) -> None:
+        with _materialized_lock:
+            _materialized[self.game_id] = ((self.id, self.created_at), gamestate, chain)
+            _materialized.move_to_end(self.game_id)
+            while len(_materialized) > settings.CHECKPOINT_STATE_CACHE_SIZE:
+                _materialized.popitem(last=False)
+
+    @classmethod
+    def record(
+        cls, game: Game, gamestate_data: list, previous: "Checkpoint | None" = None
+    ) -> "Checkpoint":
+        """
+        Stores a new checkpoint for the game.
+        If delta checkpoints are enabled, only the rows that differ from the
+        previous checkpoint are stored. A full snapshot is written for the first
+        checkpoint of a game and then every CHECKPOINT_KEYFRAME_INTERVAL checkpoints,
+        which bounds how many deltas have to be applied on restore.
+        """
+        from game.utils.snapshot import diff_gamestate
+
+        current_turn = None
+        for obj in gamestate_data:
+            if obj["model"] == "game.game":
+                current_turn = obj["fields"].get("current_turn")
+                break
+
+        if previous is None:
+            previous = cls.objects.filter(game=game).order_by("id").last()
+        previous_state, chain = [], 0
+        if settings.CHECKPOINT_DELTAS and previous is not None:
+            previous_state, chain = previous._materialize()
+            chain += 1
+        if not chain or chain >= settings.CHECKPOINT_KEYFRAME_INTERVAL:
+            checkpoint = cls.objects.create(
+                game=game, gamestate=gamestate_data, current_turn=current_turn
+            )
+            checkpoint._remember(gamestate_data, 0)
+            return checkpoint
+
+        base = previous.base if previous.is_delta else previous
+        assert base is not None
+        checkpoint = cls.objects.create(
+            game=game,
+            base=base,
+            gamestate=diff_gamestate(previous_state, gamestate_data),
+            current_turn=current_turn,
+        )
+        checkpoint._remember(gamestate_data, chain)
+        return checkpoint
+
 class Action(models.Model):
     checkpoint = models.ForeignKey(Checkpoint, on_delete=models.CASCADE, related_name='actions')
     action_number = models.PositiveIntegerField()
     transaction_name = models.CharField(max_length=255)
     args = models.JSONField(default=dict)
+    # State after this action, as a delta against the checkpoint snapshot.
+    # Captured every CHECKPOINT_ACTION_INTERVAL actions so undo only replays the
+    # actions after the nearest capture.
+    gamestate = models.JSONField(null=True, blank=True, default=None)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -5,6 +5,10 @@ class CrowTurn(models.Model):
     player = models.ForeignKey(Player, on_delete=models.CASCADE)
     turn_number = models.PositiveSmallIntegerField()
 
+    class Meta:
+        # the current turn is the player's highest turn_number
+        indexes = [models.Index(fields=["player", "turn_number"])]
+
     @classmethod
     def create_turn(cls, player: Player):
         turn_counts = cls.objects.filter(player=player).count()
@@ -28,3 +28,13 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     type = models.CharField(max_length=50, choices=EventType.choices)
     is_resolved = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            # the unresolved event stack of a game, newest first
+            models.Index(
+                fields=["game", "created_at", "id"],
+                condition=models.Q(is_resolved=False),
+                name="unresolved_event_stack",
+            )
+        ]
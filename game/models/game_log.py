@@ -92,11 +92,32 @@ class GameLog(models.Model):
         Player, on_delete=models.CASCADE, null=True, blank=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # last write (details are sometimes filled in later): the log feed also sends
+    # a client the logs changed since its cursor
+    updated_at = models.DateTimeField(auto_now=True)
     log_type = models.CharField(choices=LogType.choices, max_length=50)
     details = models.JSONField(default=dict)
+    # details as shown, rendered when the log is saved (see render_log):
+    # as its player sees them, and without their hidden parts (None: nothing hidden)
+    rendered = models.JSONField(null=True, blank=True)
+    rendered_redacted = models.JSONField(null=True, blank=True)
     
     # Optional links to events/state
     outrage_event = models.ForeignKey("game.OutrageEvent", on_delete=models.SET_NULL, null=True, blank=True, related_name="logs")
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # the log feed of a game
+            models.Index(fields=["game", "created_at"]),
+            # the current turn and phase logs a player's actions nest under
+            models.Index(fields=["game", "player", "log_type", "created_at"]),
+            # logs changed since a feed cursor
+            models.Index(fields=["game", "updated_at"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        from game.serializers.logs.main import render_log
+
+        render_log(self)
+        super().save(*args, **kwargs)
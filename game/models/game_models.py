@@ -1,10 +1,10 @@
-from typing import cast
 from django.db import models
 
 # from django.contrib.auth.models import User
 
 from game.models.enums import Faction, Suit, DayPhase, ItemTypes
-from game.game_data.cards.exiles_and_partisans import CardsEP
+from game.game_data.cards.exiles_and_partisans import CARD_COSTS, CARD_SUITS, CardsEP
+from game.utils.rng import new_rng_seed
 
 
 class Game(models.Model):
@@ -30,6 +30,30 @@ class Game(models.Model):
         max_length=1, choices=GameStatus.choices, default=GameStatus.NOT_STARTED
     )
     current_turn = models.PositiveSmallIntegerField(default=0)
+    # bumped whenever the game changes, clients use it (as ETag) to skip refetching.
+    # Only ever increases, also across undo.
+    version = models.PositiveIntegerField(default=0)
+    # the game's random stream (see game.utils.rng): dice, shuffles and random cards.
+    # rng_draws counts the draws so far, it's checkpointed with the rest of the game
+    rng_seed = models.BigIntegerField(default=new_rng_seed)
+    rng_draws = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def bump_version(cls, game_id: int) -> None:
+        cls.objects.filter(pk=game_id).update(version=models.F("version") + 1)
+
+    # counters moved only by their own updates (bump_version, game_random()):
+    # a full save from a stale instance must not rewind them
+    COUNTER_FIELDS = ("version", "rng_draws")
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
 
 class FactionChoiceEntry(models.Model):
@@ -198,7 +222,7 @@ class Card(models.Model):
 
     def save(self, *args, **kwargs):
         # auto-sync suit: card enums first value is letter, which is how it is saved
-        self.suit = self.enum.value.suit.value[0]
+        self.suit = CARD_SUITS[self.card_type]
         if not self.suit:
             raise ValueError("suit is blank")
         super().save(*args, **kwargs)
@@ -219,8 +243,7 @@ class Card(models.Model):
     def cost(
         self,
     ) -> list[str]:
-        # convert list of enums to list of strings
-        return [cast(str, suit.value) for suit in self.enum.value.cost]
+        return list(CARD_COSTS[self.card_type])
 
     @property
     def text(self) -> str:
@@ -366,6 +389,10 @@ class HandEntry(models.Model):
     player = models.ForeignKey(Player, on_delete=models.CASCADE)
     card = models.ForeignKey(Card, on_delete=models.CASCADE)
 
+    class Meta:
+        # a hand is read with its cards without touching the entries table
+        indexes = [models.Index(fields=["player", "card"])]
+
 
 class RevealedCardEntry(models.Model):
     """
@@ -7,6 +7,10 @@ class WATurn(models.Model):
     player = models.ForeignKey(Player, on_delete=models.CASCADE)
     turn_number = models.PositiveSmallIntegerField()
 
+    class Meta:
+        # the current turn is the player's highest turn_number
+        indexes = [models.Index(fields=["player", "turn_number"])]
+
     @classmethod
     def create_turn(cls, player: Player):
         """creates a new turn for the player"""
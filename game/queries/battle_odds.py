@@ -0,0 +1,78 @@
+from dataclasses import asdict, replace
+from game.errors import IllegalActionError
+from game.logic.battle_odds import BattleScenario, battle_odds
+from game.models.birds.player import BirdLeader
+from game.models.crows.tokens import PlotToken
+from game.models.game_models import Faction, Game
+from game.queries.board_state import get_board_state
+from game.queries.crafted_cards import get_partisan_card_type
+
+
+def get_battle_odds(
+    game: Game, attacker: Faction, defender: Faction | None = None
+) -> list[dict]:
+    """
+    the odds of every battle attacker could start, in every clearing and against
+    every other faction (or only defender), with and without an ambush.
+    Reads the board in a fixed number of queries, whatever the number of battles.
+    """
+    board = get_board_state(game)
+    players = {player.faction: player for player in board.players.values()}
+    attacking_player = players.get(attacker)
+    if attacking_player is None:
+        raise IllegalActionError(f"{attacker.label} are not in this game")
+    if defender is not None and defender not in players:
+        raise IllegalActionError(f"{defender.label} are not in this game")
+    defending_players = [
+        player
+        for faction, player in players.items()
+        if faction != attacker and defender in (None, faction)
+    ]
+
+    commander = (
+        attacker == Faction.BIRDS
+        and BirdLeader.objects.filter(
+            player=attacking_player,
+            active=True,
+            leader=BirdLeader.BirdLeaders.COMMANDER,
+        ).exists()
+    )
+    plot_clearings = set(
+        PlotToken.objects.filter(
+            player__game_id=board.game_id, clearing__isnull=False, is_facedown=True
+        ).values_list("clearing_id", flat=True)
+    )
+
+    odds = []
+    for number, clearing in sorted(board.clearings_by_number.items()):
+        attackers = board.warrior_count(attacking_player, clearing)
+        if attackers == 0:
+            continue
+        partisans = get_partisan_card_type(clearing.suit)
+        for defending_player in defending_players:
+            if not board.has_pieces(defending_player, clearing):
+                continue
+            defenders = board.warrior_count(defending_player, clearing)
+            scenario = BattleScenario(
+                attacker_warriors=attackers,
+                defender_warriors=defenders,
+                attacker_pieces=board.piece_count(attacking_player, clearing) - attackers,
+                defender_pieces=board.piece_count(defending_player, clearing) - defenders,
+                guerrilla=defending_player.faction == Faction.WOODLAND_ALLIANCE,
+                extra_attacker_hits=(
+                    defending_player.faction == Faction.CROWS
+                    and clearing.pk in plot_clearings
+                )
+                + bool(partisans and board.has_crafted(defending_player, partisans)),
+                extra_defender_hits=commander
+                + bool(partisans and board.has_crafted(attacking_player, partisans)),
+            )
+            odds.append(
+                {
+                    "clearing_number": number,
+                    "defender": defending_player.faction,
+                    "odds": asdict(battle_odds(scenario)),
+                    "if_ambushed": asdict(battle_odds(replace(scenario, ambush=True))),
+                }
+            )
+    return odds
@@ -4,6 +4,7 @@ from game.models.events.event import Event, EventType
 from game.models.game_models import Faction, Player
 from game.queries.current_action.events import get_current_event
 from game.queries.general import get_current_player
+from game.queries.turn_context import get_turn_context
 from game.errors import UnavailableActionError, InternalGameError
 
 
@@ -14,7 +15,7 @@ def validate_turn(player: Player) -> BirdTurn:
         raise UnavailableActionError("Not this player's turn")
     if current_player.faction != Faction.BIRDS:
         raise UnavailableActionError("This player is not birds")
-    bird_turn = BirdTurn.objects.filter(player=player).order_by("-turn_number").first()
+    bird_turn = get_turn_context(player.game).turn
     if bird_turn is None:
         raise InternalGameError("No turns found for this birdsplayer")
     return bird_turn
@@ -27,9 +28,7 @@ def get_phase(player: Player) -> BirdBirdsong | BirdDaylight | BirdEvening:
     # get most recent turn
     bird_turn = validate_turn(player)
     # get phase
-    birdsong = BirdBirdsong.objects.get(turn=bird_turn)
-    daylight = BirdDaylight.objects.get(turn=bird_turn)
-    evening = BirdEvening.objects.get(turn=bird_turn)
+    birdsong, daylight, evening = get_turn_context(player.game).phases
     if birdsong.step != BirdBirdsong.BirdBirdsongSteps.COMPLETED:
         return birdsong
     elif daylight.step != BirdDaylight.BirdDaylightSteps.COMPLETED:
@@ -0,0 +1,356 @@
+from collections import Counter
+from contextlib import contextmanager
+from functools import cached_property
+from contextvars import ContextVar
+from typing import Callable, TypeVar
+from django.db import connection
+from django.db.models import F
+from game.errors import InternalGameError
+from game.game_data.cards.exiles_and_partisans import CardsEP
+from game.game_data.general.maps import MapGraph, get_map_graph
+from game.models import (
+    Building,
+    BuildingSlot,
+    Clearing,
+    CraftedCardEntry,
+    Faction,
+    Player,
+    Token,
+    Warrior,
+)
+from game.models.cats.tokens import CatKeep, CatWood
+from game.models.crows.tokens import PlotToken
+
+
+# statements that leave the game's rows untouched and keep cached board states valid
+_READ_ONLY_PREFIXES = ("SELECT", "SAVEPOINT", "RELEASE")
+
+_board_states: ContextVar[dict | None] = ContextVar("board_states", default=None)
+
+T = TypeVar("T")
+
+
+def _clearing_id(clearing: Clearing | int | None) -> int | None:
+    if clearing is None or isinstance(clearing, int):
+        return clearing
+    return clearing.pk
+
+
+def _player_id(player: Player | int) -> int:
+    return player if isinstance(player, int) else player.pk
+
+
+class BoardState:
+    """
+    Snapshot of where every piece of a game is, loaded in a fixed number of queries.
+    Answers rule, piece count and enemy presence questions in memory.
+    Use get_board_state() to share one between queries inside a board_state_cache().
+    """
+
+    def __init__(self, game_id: int):
+        self.game_id = game_id
+        self.clearings: dict[int, Clearing] = {
+            clearing.pk: clearing
+            for clearing in Clearing.objects.filter(game_id=game_id).annotate(
+                boardmap=F("game__boardmap")
+            )
+        }
+        self.clearings_by_number: dict[int, Clearing] = {
+            clearing.clearing_number: clearing for clearing in self.clearings.values()
+        }
+        self.players: dict[int, Player] = {
+            player.pk: player for player in Player.objects.filter(game_id=game_id)
+        }
+        # (player_id, clearing_id) -> count. Warriors with clearing None are in supply.
+        self.warriors = Counter(
+            Warrior.objects.filter(player__game_id=game_id).values_list(
+                "player_id", "clearing_id"
+            )
+        )
+        self.buildings = Counter(
+            Building.objects.filter(
+                player__game_id=game_id, building_slot__isnull=False
+            ).values_list("player_id", "building_slot__clearing_id")
+        )
+        self.tokens = Counter(
+            Token.objects.filter(
+                player__game_id=game_id, clearing__isnull=False
+            ).values_list("player_id", "clearing_id")
+        )
+        # (player_id, card_type) of every crafted card, for passive effects
+        self.crafted_cards = set(
+            CraftedCardEntry.objects.filter(player__game_id=game_id).values_list(
+                "player_id", "card__card_type"
+            )
+        )
+        # player_id -> clearing_id -> the ruled clearings connected to it, built on demand
+        self._ruled_components: dict[int, dict[int, frozenset[int]]] = {}
+        self._component_wood: dict[frozenset[int], int] = {}
+
+    @property
+    def map_graph(self) -> MapGraph:
+        clearing = next(iter(self.clearings.values()), None)
+        if clearing is None:
+            raise InternalGameError("Game has no map")
+        return get_map_graph(clearing.boardmap)
+
+    def clearings_numbered(self, clearing_numbers) -> set[Clearing]:
+        return {
+            self.clearings_by_number[number]
+            for number in clearing_numbers
+            if number in self.clearings_by_number
+        }
+
+    def has_crafted(self, player: Player | int, card: CardsEP) -> bool:
+        """True if player has crafted the card (and it is still in play)"""
+        return (_player_id(player), card.name) in self.crafted_cards
+
+    def warrior_count(self, player: Player | int, clearing: Clearing | int | None) -> int:
+        """warriors of player in clearing (None: in the player's supply)"""
+        return self.warriors[(_player_id(player), _clearing_id(clearing))]
+
+    def warrior_counts(self, player: Player | int) -> dict[int | None, int]:
+        """clearing number -> warriors of player there (None: in the player's supply)"""
+        player_id = _player_id(player)
+        return {
+            None if clearing_id is None else self.clearings[clearing_id].clearing_number: count
+            for (owner_id, clearing_id), count in self.warriors.items()
+            if owner_id == player_id and count > 0
+        }
+
+    def piece_count(self, player: Player | int, clearing: Clearing | int) -> int:
+        """warriors, buildings and tokens of player in clearing"""
+        key = (_player_id(player), _clearing_id(clearing))
+        return self.warriors[key] + self.buildings[key] + self.tokens[key]
+
+    def has_pieces(self, player: Player | int, clearing: Clearing | int) -> bool:
+        return self.piece_count(player, clearing) > 0
+
+    def rule_score(self, player: Player | int, clearing: Clearing | int) -> int:
+        player_id = _player_id(player)
+        key = (player_id, _clearing_id(clearing))
+        score = self.warriors[key] + self.buildings[key]
+        # tokens of soup kitchen crafters count twice towards rule
+        if self.has_crafted(player_id, CardsEP.SOUP_KITCHENS):
+            score += 2 * self.tokens[key]
+        return score
+
+    def ruler(self, clearing: Clearing | int) -> Player | None:
+        """the player who rules the clearing, None if nobody does (Birds win ties)"""
+        return rule_winner(
+            {
+                player: self.rule_score(player_id, clearing)
+                for player_id, player in self.players.items()
+            }
+        )
+
+    @cached_property
+    def wood(self) -> Counter:
+        """clearing_id -> Cats wood tokens on the board, loaded on first use"""
+        return Counter(
+            CatWood.objects.filter(
+                player__game_id=self.game_id, clearing__isnull=False
+            ).values_list("clearing_id", flat=True)
+        )
+
+    @cached_property
+    def free_building_slots(self) -> Counter:
+        """clearing_id -> building slots without a building or ruin, loaded on first use"""
+        return Counter(
+            BuildingSlot.objects.filter(
+                clearing__game_id=self.game_id, building__isnull=True, ruin__isnull=True
+            ).values_list("clearing_id", flat=True)
+        )
+
+    @cached_property
+    def keep_clearings(self) -> frozenset[int]:
+        """ids of clearings with the Cats keep, loaded on first use"""
+        return frozenset(
+            CatKeep.objects.filter(
+                player__game_id=self.game_id, clearing__isnull=False
+            ).values_list("clearing_id", flat=True)
+        )
+
+    @cached_property
+    def snared_clearings(self) -> frozenset[int]:
+        """ids of clearings with a face-up Snare, loaded on first use"""
+        return frozenset(
+            PlotToken.objects.filter(
+                player__game_id=self.game_id,
+                clearing__isnull=False,
+                plot_type=PlotToken.PlotType.SNARE,
+                is_facedown=False,
+            ).values_list("clearing_id", flat=True)
+        )
+
+    def ruled_components(self, player: Player | int) -> dict[int, frozenset[int]]:
+        """
+        Groups the clearings player rules into islands connected by paths.
+        Maps every ruled clearing id to the ids of its island.
+        """
+        player_id = _player_id(player)
+        components = self._ruled_components.get(player_id)
+        if components is not None:
+            return components
+
+        map_graph = self.map_graph
+        ruled = {
+            clearing_id
+            for clearing_id in self.clearings
+            if (ruler := self.ruler(clearing_id)) is not None and ruler.pk == player_id
+        }
+        components = {}
+        for start in ruled:
+            if start in components:
+                continue
+            island = {start}
+            stack = [start]
+            while stack:
+                number = self.clearings[stack.pop()].clearing_number
+                for adjacent in self.clearings_numbered(map_graph.adjacent(number)):
+                    if adjacent.pk in ruled and adjacent.pk not in island:
+                        island.add(adjacent.pk)
+                        stack.append(adjacent.pk)
+            island = frozenset(island)
+            components.update(dict.fromkeys(island, island))
+        self._ruled_components[player_id] = components
+        return components
+
+    def ruled_component(
+        self, player: Player | int, clearing: Clearing | int
+    ) -> frozenset[int]:
+        """ids of the ruled clearings connected to clearing (empty if player doesn't rule it)"""
+        return self.ruled_components(player).get(_clearing_id(clearing), frozenset())
+
+    def connected_wood(self, player: Player | int, clearing: Clearing | int) -> int:
+        """wood tokens player could spend on a building in clearing"""
+        island = self.ruled_component(player, clearing)
+        if island not in self._component_wood:
+            self._component_wood[island] = sum(self.wood[c] for c in island)
+        return self._component_wood[island]
+
+    def players_with_pieces(
+        self, clearing: Clearing | int, exclude: Player | int | None = None
+    ) -> list[Player]:
+        """players with any pieces in the clearing, optionally leaving one out"""
+        excluded_id = None if exclude is None else _player_id(exclude)
+        return [
+            player
+            for player_id, player in self.players.items()
+            if player_id != excluded_id and self.has_pieces(player_id, clearing)
+        ]
+
+
+def rule_winner(scores: dict[Player, int]) -> Player | None:
+    """the player with the highest rule score, None if nobody scores (Birds win ties)"""
+    max_score = 0
+    players_with_max_score = []
+    for player, score in scores.items():
+        if score == 0:
+            continue
+        if score > max_score:
+            max_score = score
+            players_with_max_score = [player]
+        elif score == max_score:
+            players_with_max_score.append(player)
+    if len(players_with_max_score) == 1:
+        return players_with_max_score[0]
+    for player in players_with_max_score:
+        if player.faction == Faction.BIRDS:
+            return player
+    return None
+
+
+def _transaction_position() -> tuple:
+    """the atomic blocks (and their savepoints) currently open on the connection"""
+    return (tuple(connection.atomic_blocks), tuple(connection.savepoint_ids))
+
+
+def _is_still_open(position: tuple) -> bool:
+    """True if the atomic blocks open at position have not been exited since"""
+    blocks, savepoint_ids = position
+    current_blocks, current_savepoint_ids = _transaction_position()
+    return (
+        len(current_blocks) >= len(blocks)
+        and all(block is current for block, current in zip(blocks, current_blocks))
+        and current_savepoint_ids[: len(savepoint_ids)] == savepoint_ids
+    )
+
+
+def get_cached(kind: type, game_id: int, load: Callable[[], T]) -> T:
+    """
+    returns the state of the given kind (BoardState, TurnContext) of the game,
+    reusing the cached one inside a board_state_cache() and calling load() otherwise
+    """
+    cache = _board_states.get()
+    if cache is None:
+        return load()
+    cached = cache.get((kind, game_id))
+    # a state read inside an atomic block that has since been left may have been
+    # rolled back with it
+    if cached is not None and _is_still_open(cached[1]):
+        return cached[0]
+    state = load()
+    cache[(kind, game_id)] = (state, _transaction_position())
+    return state
+
+
+def get_board_state(game) -> BoardState:
+    """
+    returns the BoardState of the game, reusing the cached one inside a board_state_cache()
+    and loading a fresh one otherwise
+    """
+    game_id = game if isinstance(game, int) else game.pk
+    return get_cached(BoardState, game_id, lambda: BoardState(game_id))
+
+
+def cached_board_state(game) -> BoardState | None:
+    """
+    the shared BoardState of the game inside a board_state_cache(), None outside one:
+    there a single query answers one question for less than loading the board
+    """
+    if _board_states.get() is None:
+        return None
+    return get_board_state(game)
+
+
+def invalidate_board_state(game=None):
+    """drops the cached states of the game (of every game if None)"""
+    cache = _board_states.get()
+    if cache is None:
+        return
+    if game is None:
+        cache.clear()
+        return
+    game_id = game if isinstance(game, int) else game.pk
+    for key in [key for key in cache if key[1] == game_id]:
+        del cache[key]
+
+
+@contextmanager
+def board_state_cache(isolated: bool = False):
+    """
+    Shares BoardStates (and TurnContexts) between the queries run inside the block.
+    Every write statement (and savepoint rollback) on the connection drops the cache,
+    so pieces moved by bulk_update or queryset.update() are seen too, and a state read
+    inside an atomic block is not reused once that block is left.
+    Re-entrant, nested blocks share the outer cache unless isolated
+    (e.g. when the block runs against another database).
+    """
+    if _board_states.get() is not None and not isolated:
+        yield
+        return
+
+    cache: dict[tuple[type, int], tuple[object, tuple]] = {}
+
+    def invalidate_on_write(execute, sql, params, many, context):
+        if not sql.lstrip()[:9].upper().startswith(_READ_ONLY_PREFIXES):
+            cache.clear()
+        return execute(sql, params, many, context)
+
+    token = _board_states.set(cache)
+    try:
+        with connection.execute_wrapper(invalidate_on_write):
+            yield
+    finally:
+        _board_states.reset(token)
@@ -3,7 +3,7 @@ from django.apps import apps
 
 from game.models.cats.tokens import CatWood
 from game.models.game_models import Clearing, Player
-from game.queries.general import determine_clearing_rule
+from game.queries.board_state import get_board_state
 
 scoring_after_placement = (
     {  # idx: [0 on board (before placement), 1 on board,... 6 on board] val: score
@@ -56,27 +56,31 @@ def get_usable_wood_for_building(
     required_wood = get_wood_cost(player, building_type)
     if required_wood is None:  # no building of that type in supply
         raise ValueError(f"No building of that type in supply: {building_type.value}")
-    # algo: add intended clearing to the stack. set for rulership island, set for unruled. if node in either set, pop off and continue .if ruled, add to rulership set,
-    # add to result list, add its children to the stack and pop off. if unruled, add to unruled set and pop off.
-    wood_tokens = []
-    ruled_set = set()
-    visited = set()
-    clearing_stack = [clearing]
-    while len(clearing_stack) > 0:
-        clearing = clearing_stack.pop()
-        if clearing in visited:
-            continue
-        visited.add(clearing)
-
-        if determine_clearing_rule(clearing) == player:
-            ruled_set.add(clearing)
-            for connected_clearing in clearing.connected_clearings.all():
-                if connected_clearing not in visited:
-                    clearing_stack.append(connected_clearing)
+    # wood can be used from any clearing in the ruled island around the building clearing
+    board_state = get_board_state(player.game_id)
+    if board_state.connected_wood(player, clearing) < required_wood:
+        return None
+    return list(
+        CatWood.objects.filter(
+            clearing_id__in=board_state.ruled_component(player, clearing)
+        )
+    )
 
-    # tally up wood tokens in ruled sets
-    for clearing_ in ruled_set:
-        wood_in_clearing = CatWood.objects.filter(clearing=clearing_)
-        wood_tokens.extend(wood_in_clearing)
 
-    return wood_tokens if len(wood_tokens) >= required_wood else None
+def get_buildable_clearings(
+    player: Player, building_type: CatBuildingTypes
+) -> list[Clearing]:
+    """clearings where player could place the building now: ruled, with a free slot and enough connected wood"""
+    required_wood = get_wood_cost(player, building_type)
+    if required_wood is None:
+        return []
+    board_state = get_board_state(player.game_id)
+    return sorted(
+        (
+            board_state.clearings[clearing_id]
+            for clearing_id in board_state.ruled_components(player)
+            if board_state.free_building_slots[clearing_id] > 0
+            and board_state.connected_wood(player, clearing_id) >= required_wood
+        ),
+        key=lambda clearing: clearing.clearing_number,
+    )
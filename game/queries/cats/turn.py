@@ -1,12 +1,18 @@
 from game.models.cats.turn import CatBirdsong, CatDaylight, CatEvening, CatTurn
 from game.models.game_models import Player
+from game.queries.turn_context import get_turn_context
 from game.errors import InternalGameError
 
 
 def get_turn(player: Player) -> CatTurn:
     """returns the current turn"""
-    # get most recent turn
-    cat_turn = CatTurn.objects.filter(player=player).order_by("-turn_number").first()
+    context = get_turn_context(player.game)
+    if player.turn_order == context.current_turn:
+        # with its phases
+        cat_turn = context.turn
+    else:
+        # get most recent turn
+        cat_turn = CatTurn.objects.filter(player=player).order_by("-turn_number").first()
     if cat_turn is None:
         raise InternalGameError("No turns found")
     return cat_turn
@@ -13,3 +13,13 @@ def get_coffin_makers_player(game: Game) -> Player | None:
 def get_coffin_warriors_count(game: Game) -> int:
     """Returns the total number of warriors in the coffin for the game."""
     return CoffinWarrior.objects.filter(player__game=game).count()
+
+
+def get_partisan_card_type(suit_str: str) -> CardsEP | None:
+    """the Partisans card that gives an extra hit in clearings of the suit"""
+    suit_map = {
+        "r": CardsEP.FOX_PARTISANS,
+        "y": CardsEP.RABBIT_PARTISANS,
+        "o": CardsEP.MOUSE_PARTISANS,
+    }
+    return suit_map.get(suit_str)
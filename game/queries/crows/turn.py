@@ -1,6 +1,7 @@
 from game.models.game_models import Faction, Player
 from game.models.crows.turn import CrowBirdsong, CrowDaylight, CrowEvening, CrowTurn
 from game.queries.general import get_current_player
+from game.queries.turn_context import get_turn_context
 from game.errors import UnavailableActionError, InternalGameError
 
 
@@ -11,7 +12,7 @@ def validate_turn(player: Player) -> CrowTurn:
         raise UnavailableActionError("Not this player's turn")
     if current_player.faction != Faction.CROWS:
         raise UnavailableActionError("This player is not Corvid Conspiracy")
-    crow_turn = CrowTurn.objects.filter(player=player).order_by("-turn_number").first()
+    crow_turn = get_turn_context(player.game).turn
     if crow_turn is None:
         raise InternalGameError("No turns found for this Corvid Conspiracy player")
     return crow_turn
@@ -24,9 +25,7 @@ def get_phase(player: Player) -> CrowBirdsong | CrowDaylight | CrowEvening:
     # get most recent turn
     crow_turn = validate_turn(player)
     # get phase
-    birdsong = CrowBirdsong.objects.get(turn=crow_turn)
-    daylight = CrowDaylight.objects.get(turn=crow_turn)
-    evening = CrowEvening.objects.get(turn=crow_turn)
+    birdsong, daylight, evening = get_turn_context(player.game).phases
     if birdsong.step != CrowBirdsong.CrowBirdsongSteps.COMPLETED:
         return birdsong
     elif daylight.step != CrowDaylight.CrowDaylightSteps.COMPLETED:
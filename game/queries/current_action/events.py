@@ -2,6 +2,7 @@ from django.urls import reverse
 from game.models.events.battle import Battle
 from game.models.events.event import Event, EventType
 from game.models.game_models import Game
+from game.queries.turn_context import get_turn_context
 
 
 def get_current_event_action(game: Game) -> str | None:
@@ -44,9 +45,4 @@ def get_current_event_action(game: Game) -> str | None:
 def get_current_event(game: Game) -> Event | None:
     """returns the current event for the game"""
     # get newest event (resolving like a stack)
-    event = (
-        Event.objects.filter(game=game, is_resolved=False)
-        .order_by("-created_at", "-id")
-        .first()
-    )
-    return event
+    return get_turn_context(game).event
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+from django.db.models import Max, Q
+from game.models.game_log import GameLog
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def get_log_head(game_id: int) -> dict:
+    """
+    newest log id and time of the latest log write of a game (None without logs):
+    a client holding both has nothing to fetch from the log feed
+    """
+    head = GameLog.objects.filter(game_id=game_id).aggregate(
+        latest_log_id=Max("id"), logs_updated_at=Max("updated_at")
+    )
+    if head["logs_updated_at"] is not None:
+        head["logs_updated_at"] = head["logs_updated_at"].isoformat()
+    return head
+
+
+def log_cursor(log_id: int, created_at: datetime) -> str:
+    """
+    feed cursor at a log: its id and creation time (µs since the epoch).
+    Ids are handed out again after an undo, the creation time tells the logs apart.
+    """
+    return f"{log_id}.{_microseconds(created_at)}"
+
+
+def parse_log_cursor(cursor: str) -> tuple[int, int]:
+    """(log id, creation time in µs) of a feed cursor, ValueError when malformed"""
+    log_id, created = cursor.split(".")
+    return int(log_id), int(created)
+
+
+def get_log_feed(game_id: int, after: str | None) -> tuple[list[GameLog], bool, str | None]:
+    """
+    The logs a client holding everything up to the cursor `after` is missing, flat and
+    in order: logs created after it, and older logs written to since (details filled in
+    later, rows restored by an undo). Children reach the client this way too, under parent_id.
+    Returns (logs, reset, cursor): reset when there is no cursor or its log is gone
+    (undone, or its id reused by a later log), then every log of the game is returned
+    and the client starts over. cursor is the one to send next time.
+    """
+    logs = GameLog.objects.select_related("player").order_by("created_at", "id")
+    if after is not None:
+        after_id, after_created = parse_log_cursor(after)
+        since = (
+            GameLog.objects.filter(game_id=game_id, pk=after_id)
+            .values_list("created_at", flat=True)
+            .first()
+        )
+        if since is not None and _microseconds(since) == after_created:
+            # the game in both branches, for each to search its own index
+            changed = list(
+                logs.filter(
+                    Q(game_id=game_id, pk__gt=after_id)
+                    | Q(game_id=game_id, updated_at__gte=since)
+                )
+            )
+            newer = [log for log in changed if log.pk > after_id]
+            return changed, False, _latest_cursor(newer) or after
+    every_log = list(logs.filter(game_id=game_id))
+    return every_log, True, _latest_cursor(every_log)
+
+
+def _microseconds(moment: datetime) -> int:
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def _latest_cursor(logs: list[GameLog]) -> str | None:
+    if not logs:
+        return None
+    latest = max(logs, key=lambda log: log.pk)
+    return log_cursor(latest.pk, latest.created_at)
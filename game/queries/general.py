@@ -1,3 +1,5 @@
+from collections import Counter
+from django.db.models import Q
 from typing import Literal
 from typing import Set
 from game.models import Ruin
@@ -28,6 +30,8 @@ from game.models.cats.buildings import Workshop
 from game.models.birds.buildings import BirdRoost
 from game.models.dominance import DominanceSupplyEntry, ActiveDominanceEntry
 from game.models.game_models import Card, Game, HandEntry, Piece
+from game.queries.board_state import cached_board_state, get_board_state, rule_winner
+from game.queries.turn_context import get_turn_context
 from game.errors import UnavailableActionError, IllegalActionError, InternalGameError
 
 
@@ -44,133 +48,112 @@ def available_building_slot(clearing: Clearing) -> BuildingSlot | None:
 
 def determine_clearing_rule(clearing: Clearing) -> Player | None:
     """returns the player who controls the clearing or None if no player controls it"""
-    rule_score_dict = {}
-    pieces_in_clearing = []
-    # tally up warriors in clearing
-    pieces_in_clearing.extend(list(Warrior.objects.filter(clearing=clearing)))
-    # tally up buldings in clearing
-    pieces_in_clearing.extend(
-        list(Building.objects.filter(building_slot__clearing=clearing))
+    # soup kitchen crafters' tokens count twice, birds rule ties
+    board_state = cached_board_state(clearing.game_id)
+    if board_state is not None:
+        return board_state.ruler(clearing)
+    scores = Counter(
+        Warrior.objects.filter(clearing=clearing).values_list("player_id", flat=True)
     )
-    # need to tally up soup kitchens if relevant
-    ## TODO: add soup kitchen card logic
-    ## search crafted cards for soup kitchen
-    ## if found, tally up tokens of that player
-    soupy_players = list(
-        CraftedCardEntry.objects.filter(
-            player__game=clearing.game, card__card_type=CardsEP.SOUP_KITCHENS.name
+    scores.update(
+        Building.objects.filter(building_slot__clearing=clearing).values_list(
+            "player_id", flat=True
         )
     )
-    for player in soupy_players:
-        # look up tokens in clearing of that player
-        tokens = list(Token.objects.filter(clearing=clearing, player=player.player))
-        pieces_in_clearing.extend(tokens * 2)
-
-    for piece in pieces_in_clearing:
-        if piece.player not in rule_score_dict:
-            rule_score_dict[piece.player] = 1
-        else:
-            rule_score_dict[piece.player] += 1
-    max_score = 0
-    players_with_max_score = []
-    for player, score in rule_score_dict.items():
-        if score > max_score:
-            max_score = score
-            players_with_max_score = [player]
-        elif score == max_score:
-            players_with_max_score.append(player)
-    if len(players_with_max_score) == 1:
-        return players_with_max_score[0]
-    else:  # if birds among tied, they rule
-        for player in players_with_max_score:
-            if player.faction == Faction.BIRDS:
-                return player
-        return None
+    soup_kitchen_crafters = CraftedCardEntry.objects.filter(
+        player__game_id=clearing.game_id, card__card_type=CardsEP.SOUP_KITCHENS.name
+    ).values("player_id")
+    for player_id in Token.objects.filter(
+        clearing=clearing, player_id__in=soup_kitchen_crafters
+    ).values_list("player_id", flat=True):
+        scores[player_id] += 2
+    players = Player.objects.in_bulk(list(scores))
+    return rule_winner({players[player_id]: score for player_id, score in scores.items()})
 
 
 def player_has_warriors_in_clearing(player: Player, clearing: Clearing) -> bool:
     """returns True if player has warriors in clearing"""
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.warrior_count(player, clearing) > 0
     return Warrior.objects.filter(clearing=clearing, player=player).exists()
 
 
 def warrior_count_in_clearing(player: Player, clearing: Clearing) -> int:
     """returns the number of warriors in clearing belonging to player"""
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.warrior_count(player, clearing)
     return Warrior.objects.filter(clearing=clearing, player=player).count()
 
 
 def warrior_count_in_supply(player: Player) -> int:
     """returns the number of warriors in the player's supply"""
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.warrior_count(player, None)
     return Warrior.objects.filter(player=player, clearing=None).count()
 
 
 def player_has_pieces_in_clearing(player: Player, clearing: Clearing) -> bool:
     """returns True if player has any pieces in clearing"""
-    return any(
-        [
-            Warrior.objects.filter(clearing=clearing, player=player).exists(),
-            Building.objects.filter(
-                building_slot__clearing=clearing, player=player
-            ).exists(),
-            Token.objects.filter(clearing=clearing, player=player).exists(),
-        ]
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.has_pieces(player, clearing)
+    return (
+        Warrior.objects.filter(clearing=clearing, player=player).exists()
+        or Building.objects.filter(building_slot__clearing=clearing, player=player).exists()
+        or Token.objects.filter(clearing=clearing, player=player).exists()
+    )
+
+
+def _players_with_pieces(player: Player, clearing: Clearing) -> list[Player]:
+    """the other players with any pieces in the clearing"""
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.players_with_pieces(clearing, exclude=player)
+    return list(
+        Player.objects.filter(game_id=player.game_id)
+        .exclude(pk=player.pk)
+        .filter(
+            Q(pk__in=Warrior.objects.filter(clearing=clearing).values("player_id"))
+            | Q(
+                pk__in=Building.objects.filter(building_slot__clearing=clearing).values(
+                    "player_id"
+                )
+            )
+            | Q(pk__in=Token.objects.filter(clearing=clearing).values("player_id"))
+        )
     )
 
 
 def get_enemy_factions_in_clearing(player: Player, clearing: Clearing) -> list[Faction]:
     """returns a list of opposing factions that have pieces in the clearing"""
-    factions = []
-    for player_ in Player.objects.filter(game=player.game):
-        if player_ != player:
-            if player_has_pieces_in_clearing(player_, clearing):
-                factions.append(Faction(player_.faction))
-    return factions
+    return [Faction(player_.faction) for player_ in _players_with_pieces(player, clearing)]
 
 
 def count_player_pieces_in_clearing(player: Player, clearing: Clearing) -> int:
     """returns the number of pieces in clearing belonging to player"""
-    return sum(
-        [
-            Warrior.objects.filter(clearing=clearing, player=player).count(),
-            Building.objects.filter(
-                building_slot__clearing=clearing, player=player
-            ).count(),
-            Token.objects.filter(clearing=clearing, player=player).count(),
-        ]
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.piece_count(player, clearing)
+    return (
+        Warrior.objects.filter(clearing=clearing, player=player).count()
+        + Building.objects.filter(building_slot__clearing=clearing, player=player).count()
+        + Token.objects.filter(clearing=clearing, player=player).count()
     )
 
 
 def get_current_player(game: Game) -> Player:
     """returns the player whose turn it is"""
-    return Player.objects.get(game=game, turn_order=game.current_turn)
+    return get_turn_context(game).player
 
 
 def get_current_turn_number(game: Game) -> int:
     """Returns the turn_number of the currently active player's turn"""
-    player = get_current_player(game)
-    if game.status == Game.GameStatus.SETUP_COMPLETED:
-        from game.models.cats.turn import CatTurn
-        from game.models.birds.turn import BirdTurn
-        from game.models.wa.turn import WATurn
-        from game.models.crows.turn import CrowTurn
-        from game.models.moles.turn import MoleTurn
-
-        turn_object_dict = {
-            Faction.CATS: CatTurn,
-            Faction.BIRDS: BirdTurn,
-            Faction.WOODLAND_ALLIANCE: WATurn,
-            Faction.CROWS: CrowTurn,
-            Faction.MOLES: MoleTurn,
-        }
-    else:
-        return 0
-
-    faction_model = turn_object_dict.get(Faction(player.faction))
-    if faction_model is None:
+    if game.status != Game.GameStatus.SETUP_COMPLETED:
         return 0
-
-    turn_object = (
-        faction_model.objects.filter(player=player).order_by("-turn_number").first()
-    )
+    turn_object = get_turn_context(game).turn
     return turn_object.turn_number if turn_object else 0
 
 
@@ -292,6 +275,14 @@ def validate_can_activate_dominance(player: Player):
         raise IllegalActionError("Already have an active dominance card.")
 
 
+def player_has_crafted_card(player: Player, card: CardsEP) -> bool:
+    """returns True if player has crafted the card"""
+    board_state = cached_board_state(player.game_id)
+    if board_state is not None:
+        return board_state.has_crafted(player, card)
+    return CraftedCardEntry.objects.filter(player=player, card__card_type=card.name).exists()
+
+
 def validate_player_has_crafted_card(player: Player, card: CardsEP) -> CraftedCardEntry:
     """returns CraftedCardEntry instance if player has card in hand, else raises ValueError
     should only be possible to have one at a time of a specific card
@@ -336,34 +327,44 @@ def get_player_hand_size(player: Player) -> int:
     return HandEntry.objects.filter(player=player).count()
 
 
+def get_connected_clearings(clearing: Clearing) -> set[Clearing]:
+    """returns the clearings connected to clearing by a path on the static map"""
+    board_state = get_board_state(clearing.game_id)
+    return board_state.clearings_numbered(
+        board_state.map_graph.adjacent(clearing.clearing_number)
+    )
+
+
 def get_adjacent_clearings(player: Player, clearing: Clearing) -> set[Clearing]:
     """
     Returns a set of clearings adjacent to the given clearing for the player,
     accounting for passive effects like Boat Builders and Tunnels.
+    The map's paths and rivers come from the static map graph, the effects are
+    applied on top of it.
     """
-    adjacent = set(clearing.connected_clearings.all())
+    board_state = get_board_state(player.game_id)
+    graph = board_state.map_graph
+    adjacent = board_state.clearings_numbered(graph.adjacent(clearing.clearing_number))
     # Moles: Tunnels are adjacent to burrow
     if player.faction == Faction.MOLES:
-        if clearing.clearing_number == 0:  # is burrow...
-            placed_tunnels = Tunnel.objects.filter(
-                player=player, clearing__isnull=False
+        tunnel_clearing_ids = set(
+            Tunnel.objects.filter(player=player, clearing__isnull=False).values_list(
+                "clearing_id", flat=True
             )
-            for tunnel in placed_tunnels:
-                adjacent.add(tunnel.clearing)
-        elif Tunnel.objects.filter(player=player, clearing=clearing).exists():
+        )
+        if clearing.clearing_number == 0:  # is burrow...
+            adjacent.update(board_state.clearings[id_] for id_ in tunnel_clearing_ids)
+        elif clearing.pk in tunnel_clearing_ids:
             # this clearing has a tunnel, add burrow as adjacent
-            burrow_clearing = Clearing.objects.get(game=player.game, clearing_number=0)
-            adjacent.add(burrow_clearing)
+            adjacent.add(board_state.clearings_by_number[0])
     # Boat Builders: treat rivers as paths
-    if CraftedCardEntry.objects.filter(
-        player=player, card__card_type=CardsEP.BOAT_BUILDERS.name
-    ).exists():
-        adjacent.update(clearing.water_connected_clearings.all())
+    if board_state.has_crafted(player, CardsEP.BOAT_BUILDERS):
+        adjacent.update(
+            board_state.clearings_numbered(graph.river_adjacent(clearing.clearing_number))
+        )
 
     # Tunnels: treat clearings with any of your crafting pieces as adjacent
-    if CraftedCardEntry.objects.filter(
-        player=player, card__card_type=CardsEP.TUNNELS.name
-    ).exists():
+    if board_state.has_crafted(player, CardsEP.TUNNELS):
         # Check if current clearing has any of our crafting pieces
         has_crafting_piece_here = (
             Workshop.objects.filter(
@@ -393,7 +394,7 @@ def get_adjacent_clearings(player: Player, clearing: Clearing) -> set[Clearing]:
                 ).values_list("clearing_id", flat=True)
             )
 
-            adjacent.update(Clearing.objects.filter(id__in=crafting_clearing_ids))
+            adjacent.update(board_state.clearings[id_] for id_ in crafting_clearing_ids)
 
             # Remove self if it was added
             adjacent.discard(clearing)
@@ -413,7 +414,7 @@ def validate_legal_move(
     -- clearing_start is not adjacent to clearing_end
     -- player does not control either origin or target clearing
     """
-    if not Warrior.objects.filter(clearing=clearing_start, player=player).exists():
+    if not player_has_warriors_in_clearing(player, clearing_start):
         raise IllegalActionError("No warriors in origin clearing")
 
     # check clearing adjacency (Boat Builders, Tunnels handled here)
@@ -435,11 +436,7 @@ def validate_legal_move(
             )
 
     # Corvid Planners: ignore rule while moving
-    try:
-        validate_player_has_crafted_card(player, CardsEP.CORVID_PLANNERS)
-        has_corvid_planners = True
-    except IllegalActionError:
-        has_corvid_planners = False
+    has_corvid_planners = player_has_crafted_card(player, CardsEP.CORVID_PLANNERS)
     if has_corvid_planners or ignore_rule:
         return  # skip rulership check
     rule_target = determine_clearing_rule(clearing_end)
@@ -470,16 +467,9 @@ def validate_enemy_pieces_in_clearing(
     Returns list of opposing players with pieces in the clearing
     """
     # confirm clearing and player are in the same game
-    players_with_pieces = []
-    if player.game != clearing.game:
+    if player.game_id != clearing.game_id:
         raise UnavailableActionError("Player and clearing are not in the same game")
-    # get opposing players
-    players_in_game = Player.objects.filter(game=player.game)
-    for player_ in players_in_game:
-        if player_ != player:
-            # check if there are any pieces in the clearing
-            if player_has_pieces_in_clearing(player_, clearing):
-                players_with_pieces.append(player_)
+    players_with_pieces = _players_with_pieces(player, clearing)
     if len(players_with_pieces) == 0:
         raise IllegalActionError("No enemy pieces in clearing")
     return players_with_pieces
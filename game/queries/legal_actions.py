@@ -0,0 +1,380 @@
+from collections import Counter
+from django.core.cache import cache
+from django.urls import resolve
+from game.game_data.cards.exiles_and_partisans import CardsEP
+from game.models.birds.buildings import BirdRoost
+from game.models.birds.player import DecreeEntry, Vizier
+from game.models.cats.buildings import CatBuildingTypes, Recruiter, Workshop
+from game.models.crows.tokens import PlotToken
+from game.models.game_models import (
+    CraftableItemEntry,
+    Faction,
+    Game,
+    HandEntry,
+    Player,
+    Suit,
+    Warrior,
+)
+from game.models.moles.buildings import Citadel, Market
+from game.models.moles.tokens import Tunnel
+from game.models.wa.tokens import WASympathy
+from game.queries.board_state import BoardState, get_board_state
+from game.queries.cats.building import get_buildable_clearings
+from game.queries.cats.recruit import is_recruit_used
+from game.queries.current_action.setup import get_setup_action
+from game.queries.current_action.turns import get_current_turn_action
+from game.queries.general import get_current_player
+
+# enumerated legal actions of a game version
+LEGAL_ACTIONS_TIMEOUT = 60 * 60
+
+# url name of a step -> the kinds of payload it takes that are enumerated.
+# Steps not listed (setup, events, card effects) get the route only, marked not complete.
+STEP_ACTIONS: dict[str, tuple[str, ...]] = {
+    "cats-daylight-craft": ("crafts",),
+    "cats-daylight-actions": ("moves", "battles", "build_sites", "recruit_sites"),
+    "birds-craft": ("crafts",),
+    "birds-recruit": ("recruit_sites",),
+    "birds-move": ("moves",),
+    "birds-battle": ("battles",),
+    "birds-build": ("build_sites",),
+    "wa-daylight": ("crafts",),
+    "wa-operations": ("moves", "battles"),
+    "crows-crafting": ("crafts",),
+    "crows-daylight": ("moves", "battles"),
+    "moles-daylight-actions": ("moves", "battles"),
+    "moles-daylight-move": ("moves",),
+    "moles-daylight-battle": ("battles",),
+    "moles-craft": ("crafts",),
+}
+# url name of a step -> the actions it offers that STEP_ACTIONS does not enumerate
+NOT_ENUMERATED: dict[str, tuple[str, ...]] = {
+    "wa-daylight": ("mobilize", "train"),
+    "wa-operations": ("recruit", "organize"),
+    "crows-daylight": ("plot", "trick"),
+    "moles-daylight-actions": ("dig", "recruit", "build"),
+}
+# kinds of payload read from the hand of the player whose turn it is, only shown to them
+PRIVATE_ACTIONS = {"crafts"}
+
+# crafting pieces of each faction, and the lookup to the clearing they are in
+_CRAFTING_PIECES = {
+    Faction.CATS: [(Workshop, "building_slot__clearing")],
+    Faction.BIRDS: [(BirdRoost, "building_slot__clearing")],
+    Faction.WOODLAND_ALLIANCE: [(WASympathy, "clearing")],
+    Faction.CROWS: [(PlotToken, "clearing")],
+    Faction.MOLES: [
+        (Citadel, "building_slot__clearing"),
+        (Market, "building_slot__clearing"),
+    ],
+}
+
+
+def _legal_actions_key(game_id: int, version: int) -> str:
+    return f"legal_actions:{game_id}:{version}"
+
+
+def _can_place(board: BoardState, player: Player, clearing_id: int) -> bool:
+    """validate_can_place_piece_in_clearing, for a clearing of the board"""
+    if player.faction != Faction.CATS and clearing_id in board.keep_clearings:
+        return False
+    if player.faction != Faction.CROWS and clearing_id in board.snared_clearings:
+        return False
+    return board.clearings[clearing_id].clearing_number != 0 or (
+        player.faction == Faction.MOLES
+    )
+
+
+def _decree_suits(player: Player, column: str) -> set[str]:
+    """suits of the unfulfilled decree entries of a Birds column (Wild for viziers)"""
+    suits = set(
+        DecreeEntry.objects.filter(
+            player=player, column=column, fulfilled=False
+        ).values_list("card__suit", flat=True)
+    )
+    if Vizier.objects.filter(player=player, column=column, fulfilled=False).exists():
+        suits.add(Suit.WILD)
+    return suits
+
+
+def _decree_clearings(board: BoardState, player: Player, column: str) -> set[int] | None:
+    """ids of the clearings a Birds decree column still allows, None for other factions"""
+    if player.faction != Faction.BIRDS:
+        return None
+    suits = _decree_suits(player, column)
+    return {
+        clearing_id
+        for clearing_id, clearing in board.clearings.items()
+        if Suit.WILD in suits or clearing.suit in suits
+    }
+
+
+def _adjacency(board: BoardState, player: Player) -> dict[int, set[int]]:
+    """get_adjacent_clearings for every clearing at once: clearing_id -> adjacent ids"""
+    graph = board.map_graph
+    boat_builders = board.has_crafted(player, CardsEP.BOAT_BUILDERS)
+    tunnel_clearings = set()
+    if player.faction == Faction.MOLES:
+        tunnel_clearings = set(
+            Tunnel.objects.filter(player=player, clearing__isnull=False).values_list(
+                "clearing_id", flat=True
+            )
+        )
+    crafting_clearings = set()
+    if board.has_crafted(player, CardsEP.TUNNELS):
+        for model in (Workshop, BirdRoost):
+            crafting_clearings.update(
+                model.objects.filter(player=player, building_slot__isnull=False).values_list(
+                    "building_slot__clearing_id", flat=True
+                )
+            )
+        crafting_clearings.update(
+            WASympathy.objects.filter(player=player, clearing__isnull=False).values_list(
+                "clearing_id", flat=True
+            )
+        )
+
+    adjacency = {}
+    for clearing_id, clearing in board.clearings.items():
+        number = clearing.clearing_number
+        adjacent = {c.pk for c in board.clearings_numbered(graph.adjacent(number))}
+        if player.faction == Faction.MOLES:
+            if number == 0:
+                adjacent.update(tunnel_clearings)
+            elif clearing_id in tunnel_clearings:
+                adjacent.add(board.clearings_by_number[0].pk)
+        if boat_builders:
+            adjacent.update(c.pk for c in board.clearings_numbered(graph.river_adjacent(number)))
+        if clearing_id in crafting_clearings:
+            adjacent.update(crafting_clearings)
+            adjacent.discard(clearing_id)
+        adjacency[clearing_id] = adjacent
+    return adjacency
+
+
+def get_legal_moves(board: BoardState, player: Player) -> list[dict]:
+    """every (origin, destination) validate_legal_move accepts, with the warriors that can go"""
+    allowed_origins = _decree_clearings(board, player, DecreeEntry.Column.MOVE)
+    ignore_rule = board.has_crafted(player, CardsEP.CORVID_PLANNERS)
+    ruled = {
+        clearing_id
+        for clearing_id in board.clearings
+        if (ruler := board.ruler(clearing_id)) is not None and ruler.pk == player.pk
+    }
+    adjacency = None
+    moves = []
+    for origin_id, origin in sorted(
+        board.clearings.items(), key=lambda item: item[1].clearing_number
+    ):
+        warriors = board.warrior_count(player, origin_id)
+        if warriors == 0:
+            continue
+        if allowed_origins is not None and origin_id not in allowed_origins:
+            continue
+        if player.faction != Faction.CROWS and origin_id in board.snared_clearings:
+            continue
+        if adjacency is None:
+            adjacency = _adjacency(board, player)
+        for destination_id in sorted(
+            adjacency[origin_id], key=lambda c: board.clearings[c].clearing_number
+        ):
+            if ignore_rule or origin_id in ruled or destination_id in ruled:
+                moves.append(
+                    {
+                        "origin": origin.clearing_number,
+                        "destination": board.clearings[destination_id].clearing_number,
+                        "max_count": warriors,
+                    }
+                )
+    return moves
+
+
+def get_battle_targets(board: BoardState, player: Player) -> list[dict]:
+    """every (clearing, defender) start_battle accepts"""
+    allowed = _decree_clearings(board, player, DecreeEntry.Column.BATTLE)
+    targets = []
+    for number, clearing in sorted(board.clearings_by_number.items()):
+        if board.warrior_count(player, clearing) == 0:
+            continue
+        if allowed is not None and clearing.pk not in allowed:
+            continue
+        for defender in board.players_with_pieces(clearing, exclude=player):
+            targets.append({"clearing_number": number, "defender": defender.faction})
+    return targets
+
+
+def get_craftable_cards(board: BoardState, player: Player) -> list[str]:
+    """
+    cards in hand the player's unused crafting pieces can pay for, and that
+    is_card_craftable_for_player allows
+    """
+    suits = Counter()
+    for model, clearing in _CRAFTING_PIECES[Faction(player.faction)]:
+        suits.update(
+            model.objects.filter(
+                player=player, crafted_with=False, **{f"{clearing}__isnull": False}
+            ).values_list(f"{clearing}__suit", flat=True)
+        )
+    items_in_pool = set(
+        CraftableItemEntry.objects.filter(game_id=player.game_id).values_list(
+            "item__item_type", flat=True
+        )
+    )
+    craftable = []
+    for card_type in HandEntry.objects.filter(player=player).values_list(
+        "card__card_type", flat=True
+    ):
+        card = CardsEP[card_type].value
+        if not card.craftable or card_type in craftable:
+            continue
+        if card.item is not None:
+            if card.item.value not in items_in_pool:
+                continue
+        elif (player.pk, card_type) in board.crafted_cards:
+            continue
+        # every suit of the cost needs its own piece, Wild costs take any piece left
+        cost = Counter(suit.value for suit in card.cost)
+        wild = cost.pop(Suit.WILD.value, 0)
+        if all(suits[suit] >= count for suit, count in cost.items()) and (
+            suits.total() >= cost.total() + wild
+        ):
+            craftable.append(card_type)
+    return craftable
+
+
+def get_build_sites(board: BoardState, player: Player) -> list[dict]:
+    """clearings the player can build in now, with the building that would go there"""
+    match player.faction:
+        case Faction.CATS:
+            sites = [
+                {"clearing_number": clearing.clearing_number, "building_type": building_type.name}
+                for building_type in CatBuildingTypes
+                for clearing in get_buildable_clearings(player, building_type)
+                if _can_place(board, player, clearing.pk)
+            ]
+        case Faction.BIRDS:
+            allowed = _decree_clearings(board, player, DecreeEntry.Column.BUILD)
+            if not BirdRoost.objects.filter(player=player, building_slot__isnull=True).exists():
+                return []
+            roost_clearings = set(
+                BirdRoost.objects.filter(player=player, building_slot__isnull=False).values_list(
+                    "building_slot__clearing_id", flat=True
+                )
+            )
+            sites = [
+                {"clearing_number": clearing.clearing_number, "building_type": "ROOST"}
+                for clearing_id, clearing in board.clearings.items()
+                if clearing_id in allowed
+                and board.free_building_slots[clearing_id] > 0
+                and clearing_id not in roost_clearings
+                and (ruler := board.ruler(clearing_id)) is not None
+                and ruler.pk == player.pk
+                and _can_place(board, player, clearing_id)
+            ]
+        case _:
+            raise ValueError(f"Build sites are not enumerated for {player.faction}")
+    return sorted(sites, key=lambda site: site["clearing_number"])
+
+
+def get_recruit_sites(board: BoardState, player: Player) -> list[int]:
+    """numbers of the clearings the player can recruit warriors in now"""
+    if not Warrior.objects.filter(player=player, clearing__isnull=True).exists():
+        return []
+    match player.faction:
+        case Faction.CATS:
+            if is_recruit_used(player):
+                return []
+            clearing_ids = Recruiter.objects.filter(
+                player=player, used=False, building_slot__isnull=False
+            ).values_list("building_slot__clearing_id", flat=True)
+        case Faction.BIRDS:
+            allowed = _decree_clearings(board, player, DecreeEntry.Column.RECRUIT)
+            clearing_ids = [
+                clearing_id
+                for clearing_id in BirdRoost.objects.filter(
+                    player=player, building_slot__isnull=False
+                ).values_list("building_slot__clearing_id", flat=True)
+                if clearing_id in allowed
+            ]
+        case _:
+            raise ValueError(f"Recruit sites are not enumerated for {player.faction}")
+    return sorted(
+        {
+            board.clearings[clearing_id].clearing_number
+            for clearing_id in clearing_ids
+            if _can_place(board, player, clearing_id)
+        }
+    )
+
+
+_ENUMERATORS = {
+    "moves": get_legal_moves,
+    "battles": get_battle_targets,
+    "crafts": get_craftable_cards,
+    "build_sites": get_build_sites,
+    "recruit_sites": get_recruit_sites,
+}
+
+
+def enumerate_legal_actions(game: Game) -> tuple[dict, int | None] | None:
+    """
+    The route of the current step and every payload it would accept, for the player
+    whose turn it is, and the id of that player's user. None if there is no current step.
+    complete is False when the step takes payloads that are not enumerated; the actions
+    it offers that are not enumerated are listed in not_enumerated.
+    Works from one BoardState, with a few extra bulk queries per kind of action,
+    instead of validating candidates one by one.
+    """
+    route = get_setup_action(game)
+    if route is not None:
+        legal_actions = {
+            "route": route,
+            "faction": None,
+            "actions": {},
+            "complete": False,
+            "not_enumerated": [],
+        }
+        return legal_actions, None
+    route = get_current_turn_action(game)
+    if route is None:
+        return None
+    url_name = resolve(route).url_name
+    actions = STEP_ACTIONS.get(url_name, ())
+    not_enumerated = NOT_ENUMERATED.get(url_name, ())
+    player = get_current_player(game)
+    board = get_board_state(game)
+    legal_actions = {
+        "route": route,
+        "faction": player.faction,
+        "actions": {name: _ENUMERATORS[name](board, player) for name in actions},
+        "complete": url_name in STEP_ACTIONS and not not_enumerated,
+        "not_enumerated": list(not_enumerated),
+    }
+    return legal_actions, player.user_id
+
+
+def get_legal_actions(game: Game, user) -> dict | None:
+    """
+    enumerate_legal_actions as the user may see them, cached per game version.
+    Actions from the hand of the player whose turn it is are left out for anyone else.
+    """
+    key = _legal_actions_key(game.pk, game.version)
+    cached = cache.get(key)
+    if cached is None:
+        enumerated = enumerate_legal_actions(game)
+        if enumerated is None:
+            return None
+        legal_actions, owner_id = enumerated
+        cached = ({"version": game.version, **legal_actions}, owner_id)
+        cache.set(key, cached, LEGAL_ACTIONS_TIMEOUT)
+    legal_actions, owner_id = cached
+    if owner_id is not None and owner_id == user.pk:
+        return legal_actions
+    return {
+        **legal_actions,
+        "actions": {
+            name: payloads
+            for name, payloads in legal_actions["actions"].items()
+            if name not in PRIVATE_ACTIONS
+        },
+    }
@@ -1,6 +1,7 @@
 from game.models.game_models import Faction, Player
 from game.models.moles.turn import MoleBirdsong, MoleDaylight, MoleEvening, MoleTurn
 from game.queries.general import get_current_player
+from game.queries.turn_context import get_turn_context
 from game.errors import UnavailableActionError, InternalGameError
 
 
@@ -11,7 +12,7 @@ def validate_turn(player: Player) -> MoleTurn:
         raise UnavailableActionError("Not this player's turn")
     if current_player.faction != Faction.MOLES:
         raise UnavailableActionError("This player is not the Moles")
-    mole_turn = MoleTurn.objects.filter(player=player).order_by("-turn_number").first()
+    mole_turn = get_turn_context(player.game).turn
     if mole_turn is None:
         raise InternalGameError("No turns found for this Moles player")
     return mole_turn
@@ -24,9 +25,7 @@ def get_phase(player: Player) -> MoleBirdsong | MoleDaylight | MoleEvening:
     # get most recent turn
     mole_turn = validate_turn(player)
     # get phase
-    birdsong = MoleBirdsong.objects.get(turn=mole_turn)
-    daylight = MoleDaylight.objects.get(turn=mole_turn)
-    evening = MoleEvening.objects.get(turn=mole_turn)
+    birdsong, daylight, evening = get_turn_context(player.game).phases
     if birdsong.step != MoleBirdsong.MoleBirdsongSteps.COMPLETED:
         return birdsong
     elif daylight.step != MoleDaylight.MoleDaylightSteps.COMPLETED:
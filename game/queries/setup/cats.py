@@ -4,6 +4,7 @@ from game.models.cats.setup import CatsSimpleSetup
 from game.models.cats.tokens import CatKeep
 from game.models.events.setup import GameSimpleSetup
 from game.models.game_models import Clearing, Player
+from game.queries.general import get_connected_clearings
 
 
 def validate_timing(player: Player, cat_setup_step: CatsSimpleSetup.Steps):
@@ -34,6 +35,6 @@ def validate_keep_is_here_or_adjacent(cat_player: Player, clearing: Clearing):
         keep = CatKeep.objects.get(player=cat_player)
     except CatKeep.DoesNotExist:
         raise InternalGameError("No keep belongs to this player")
-    adjacent = keep.clearing.connected_clearings.filter(pk=clearing.pk).exists()
+    adjacent = clearing in get_connected_clearings(keep.clearing)
     if not adjacent and clearing.pk != keep.clearing.pk:
         raise IllegalActionError("Clearing is not adjacent to the keep or in the same clearing")
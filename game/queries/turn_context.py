@@ -0,0 +1,86 @@
+from functools import cached_property
+from django.db import models
+from game.models.birds.turn import BirdBirdsong, BirdDaylight, BirdEvening, BirdTurn
+from game.models.cats.turn import CatBirdsong, CatDaylight, CatEvening, CatTurn
+from game.models.crows.turn import CrowBirdsong, CrowDaylight, CrowEvening, CrowTurn
+from game.models.events.event import Event
+from game.models.game_models import Faction, Game, Player
+from game.models.moles.turn import MoleBirdsong, MoleDaylight, MoleEvening, MoleTurn
+from game.models.wa.turn import WABirdsong, WADaylight, WAEvening, WATurn
+from game.queries.board_state import get_cached
+
+# faction -> (turn, birdsong, daylight, evening) models
+TURN_MODELS: dict[str, tuple[type[models.Model], ...]] = {
+    Faction.CATS: (CatTurn, CatBirdsong, CatDaylight, CatEvening),
+    Faction.BIRDS: (BirdTurn, BirdBirdsong, BirdDaylight, BirdEvening),
+    Faction.WOODLAND_ALLIANCE: (WATurn, WABirdsong, WADaylight, WAEvening),
+    Faction.CROWS: (CrowTurn, CrowBirdsong, CrowDaylight, CrowEvening),
+    Faction.MOLES: (MoleTurn, MoleBirdsong, MoleDaylight, MoleEvening),
+}
+
+
+class TurnContext:
+    """
+    Whose turn it is in a game: the current player, their latest turn, its phases and
+    the current event, each loaded on first use.
+    Use get_turn_context() to share one between the queries of a request (or transaction)
+    inside a board_state_cache(), where any write drops it like a BoardState.
+    """
+
+    def __init__(self, game: Game):
+        self.game_id = game.pk
+        self.current_turn = game.current_turn
+
+    @cached_property
+    def player(self) -> Player:
+        return Player.objects.select_related("game").get(
+            game_id=self.game_id, turn_order=self.current_turn
+        )
+
+    @cached_property
+    def turn(self) -> models.Model | None:
+        """the current player's latest turn, None before their first one"""
+        turn_models = TURN_MODELS.get(self.player.faction)
+        if turn_models is None:
+            return None
+        turn_model, *phase_models = turn_models
+        queryset = turn_model.objects.filter(player=self.player).order_by("-turn_number")
+        # one-to-one phases (Cats) come along in the same query
+        one_to_one = [
+            phase_model._meta.get_field("turn").remote_field.related_name
+            for phase_model in phase_models
+            if phase_model._meta.get_field("turn").one_to_one
+        ]
+        return queryset.select_related(*one_to_one).first()
+
+    @cached_property
+    def phases(self) -> tuple[models.Model, models.Model, models.Model]:
+        """birdsong, daylight and evening of the turn"""
+        _, *phase_models = TURN_MODELS[self.player.faction]
+        return tuple(
+            getattr(self.turn, phase_model._meta.get_field("turn").remote_field.related_name)
+            if phase_model._meta.get_field("turn").one_to_one
+            else phase_model.objects.get(turn=self.turn)
+            for phase_model in phase_models
+        )
+
+    @cached_property
+    def event(self) -> Event | None:
+        """the newest unresolved event (events resolve like a stack)"""
+        return (
+            Event.objects.filter(game_id=self.game_id, is_resolved=False)
+            .order_by("-created_at", "-id")
+            .first()
+        )
+
+
+def get_turn_context(game: Game) -> TurnContext:
+    """
+    returns the TurnContext of the game, reusing the cached one inside a board_state_cache()
+    and creating a fresh one otherwise
+    """
+    context = get_cached(TurnContext, game.pk, lambda: TurnContext(game))
+    # an unsaved change of turn
+    if context.current_turn != game.current_turn:
+        return TurnContext(game)
+    return context
@@ -1,6 +1,7 @@
 from game.models.game_models import Faction, Player
 from game.models.wa.turn import WABirdsong, WADaylight, WAEvening, WATurn
 from game.queries.general import get_current_player
+from game.queries.turn_context import get_turn_context
 from game.errors import UnavailableActionError, InternalGameError
 
 
@@ -11,7 +12,7 @@ def validate_turn(player: Player) -> WATurn:
         raise UnavailableActionError("Not this player's turn")
     if current_player.faction != Faction.WOODLAND_ALLIANCE:
         raise UnavailableActionError("This player is not Woodland Alliance")
-    wa_turn = WATurn.objects.filter(player=player).order_by("-turn_number").first()
+    wa_turn = get_turn_context(player.game).turn
     if wa_turn is None:
         raise InternalGameError("No turns found for this Woodland Alliance player")
     return wa_turn
@@ -24,9 +25,7 @@ def get_phase(player: Player) -> WABirdsong | WADaylight | WAEvening:
     # get most recent turn
     wa_turn = validate_turn(player)
     # get phase
-    birdsong = WABirdsong.objects.get(turn=wa_turn)
-    daylight = WADaylight.objects.get(turn=wa_turn)
-    evening = WAEvening.objects.get(turn=wa_turn)
+    birdsong, daylight, evening = get_turn_context(player.game).phases
     if birdsong.step != WABirdsong.WABirdsongSteps.COMPLETED:
         return birdsong
     elif daylight.step != WADaylight.WADaylightSteps.COMPLETED:
@@ -5,6 +5,11 @@ import importlib
 from datetime import datetime
 
 class ActionSerializer:
+    # Rows that never change after setup. During replay these are fetched once for
+    # the whole batch of actions; everything else is fetched per action, since an
+    # earlier replayed action may have changed it.
+    STATIC_MODELS = {"game.Clearing", "game.Burrow", "game.BuildingSlot", "game.Card"}
+
     @staticmethod
     def serialize_arg(arg):
         if isinstance(arg, models.Model):
@@ -31,12 +36,42 @@ class ActionSerializer:
            return {k: ActionSerializer.serialize_arg(v) for k, v in arg.items()}
         return arg
 
+    @classmethod
+    def collect_model_refs(cls, arg, refs: dict | None = None) -> dict:
+        """
+        Collects the model references in a serialized arg, grouped by model label.
+        Mirrors deserialize_arg, so every reference it would look up is included.
+        """
+        if refs is None:
+            refs = {}
+        if isinstance(arg, dict) and arg.get("_type") == "model":
+            refs.setdefault(arg.get("model"), set()).add(arg.get("pk"))
+        elif isinstance(arg, list):
+            for item in arg:
+                cls.collect_model_refs(item, refs)
+        return refs
+
+    @staticmethod
+    def fetch_model_refs(refs: dict) -> dict:
+        """loads referenced instances with one query per model label, keyed by (label, pk)"""
+        instances = {}
+        for model_label, pks in refs.items():
+            try:
+                Model = apps.get_model(model_label)
+            except LookupError:
+                continue
+            for pk, obj in Model.objects.in_bulk(list(pks)).items():
+                instances[(model_label, pk)] = obj
+        return instances
+
     @staticmethod
-    def deserialize_arg(arg):
+    def deserialize_arg(arg, instances: dict | None = None):
         if isinstance(arg, dict):
             if arg.get("_type") == "model":
                 model_label = arg.get("model")
                 pk = arg.get("pk")
+                if instances is not None and (model_label, pk) in instances:
+                    return instances[(model_label, pk)]
                 try:
                     Model = apps.get_model(model_label)
                     return Model.objects.get(pk=pk)
@@ -64,7 +99,7 @@ class ActionSerializer:
             elif arg.get("_type") == "datetime":
                 return datetime.fromisoformat(arg.get("value"))
         elif isinstance(arg, list):
-            return [ActionSerializer.deserialize_arg(item) for item in arg]
+            return [ActionSerializer.deserialize_arg(item, instances) for item in arg]
         return arg
 
     @classmethod
@@ -74,7 +109,11 @@ class ActionSerializer:
         return s_args, s_kwargs
 
     @classmethod
-    def deserialize_args(cls, args, kwargs):
-        d_args = [cls.deserialize_arg(a) for a in args]
-        d_kwargs = {k: cls.deserialize_arg(v) for k, v in kwargs.items()}
+    def deserialize_args(cls, args, kwargs, instances: dict | None = None):
+        """
+        instances: optional prefetched {(model label, pk): instance} lookup
+        (see fetch_model_refs); references missing from it are fetched one by one
+        """
+        d_args = [cls.deserialize_arg(a, instances) for a in args]
+        d_kwargs = {k: cls.deserialize_arg(v, instances) for k, v in kwargs.items()}
         return d_args, d_kwargs
@@ -4,17 +4,19 @@ from rest_framework import serializers
 from game.models.birds.buildings import BirdRoost
 from game.models.birds.player import BirdLeader, DecreeEntry
 from game.models.birds.turn import BirdTurn, BirdBirdsong, BirdDaylight, BirdEvening
-from game.models.game_models import Building, Player, Warrior
+from game.models.game_models import Building, Player
 from game.serializers.general_serializers import (
     BuildingSerializer,
     CardSerializer,
     PlayerPublicSerializer,
-    WarriorSerializer,
+    WarriorCountSerializer,
+    buildings_of,
+    warrior_counts,
 )
 
 
 class RoostSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer()
+    building = BuildingSerializer(source="*")
     crafted_with = serializers.BooleanField()
 
     class Meta:
@@ -83,18 +85,18 @@ class BirdSerializer(serializers.Serializer):
 
     player = PlayerPublicSerializer()
     buildings = BirdBuildingSerializer()
-    warriors = WarriorSerializer(many=True)
+    warriors = WarriorCountSerializer(many=True)
     leaders = BirdLeaderSerializer(many=True)
     decree = BirdDecreeEntrySerializer(many=True)
     viziers = VizierSerializer(many=True)
 
     @classmethod
     def from_player(cls, player: Player):
-        roosts = BirdRoost.objects.filter(player=player)
+        roosts = buildings_of(BirdRoost, player)
         buildings = {"roosts": roosts}
-        warriors = Warrior.objects.filter(player=player)
+        warriors = warrior_counts(player)
         leaders = BirdLeader.objects.filter(player=player)
-        decree = DecreeEntry.objects.filter(player=player)
+        decree = DecreeEntry.objects.filter(player=player).select_related("card")
         viziers = Vizier.objects.filter(player=player)
         return cls(
             instance={
@@ -3,18 +3,21 @@ from rest_framework import serializers
 from game.models.cats.buildings import CatBuildingTypes, Recruiter, Sawmill, Workshop
 from game.models.cats.tokens import CatKeep, CatWood
 from game.models.cats.turn import CatTurn, CatBirdsong, CatDaylight, CatEvening
-from game.models.game_models import Player, Warrior
+from game.models.game_models import Player
 from game.serializers.general_serializers import (
     BuildingSerializer,
     PlayerPublicSerializer,
     TextChoiceLabelField,
     TokenSerializer,
-    WarriorSerializer,
+    WarriorCountSerializer,
+    buildings_of,
+    tokens_of,
+    warrior_counts,
 )
 
 
 class WorkShopSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer()
+    building = BuildingSerializer(source="*")
 
     class Meta:
         model = Workshop
@@ -22,7 +25,7 @@ class WorkShopSerializer(serializers.ModelSerializer):
 
 
 class RecruiterSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer()
+    building = BuildingSerializer(source="*")
 
     class Meta:
         model = Recruiter
@@ -30,7 +33,7 @@ class RecruiterSerializer(serializers.ModelSerializer):
 
 
 class SawmillSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer()
+    building = BuildingSerializer(source="*")
 
     class Meta:
         model = Sawmill
@@ -50,7 +53,7 @@ class CatTokenSerializer(serializers.Serializer):
 
     class NestedTokenSerializer(serializers.Serializer):
         # want to nest the
-        token = TokenSerializer()
+        token = TokenSerializer(source="*")
 
     # while keep usually cant be many, useful to keep the token structure uniform
     keep = NestedTokenSerializer(many=True)
@@ -93,20 +96,20 @@ class CatSerializer(serializers.Serializer):
     player = PlayerPublicSerializer()
     tokens = CatTokenSerializer()
     buildings = CatBuildingSerializer()
-    warriors = WarriorSerializer(many=True)
+    warriors = WarriorCountSerializer(many=True)
 
     @classmethod
     def from_player(cls, player: Player):
-        keep = CatKeep.objects.filter(player=player)
-        wood = CatWood.objects.filter(player=player)
+        keep = tokens_of(CatKeep, player)
+        wood = tokens_of(CatWood, player)
 
         tokens = {"keep": keep, "wood": wood}
 
-        warriors = Warrior.objects.filter(player=player)
+        warriors = warrior_counts(player)
 
-        workshops = Workshop.objects.filter(player=player)
-        recruiters = Recruiter.objects.filter(player=player)
-        sawmills = Sawmill.objects.filter(player=player)
+        workshops = buildings_of(Workshop, player)
+        recruiters = buildings_of(Recruiter, player)
+        sawmills = buildings_of(Sawmill, player)
         buildings = {
             "workshops": workshops,
             "recruiters": recruiters,
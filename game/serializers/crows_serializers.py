@@ -1,12 +1,13 @@
 from rest_framework import serializers
 
-from game.models.game_models import Player, Warrior
+from game.models.game_models import Player
 from game.models.crows.tokens import PlotToken
 from game.models.crows.turn import CrowTurn, CrowBirdsong, CrowDaylight, CrowEvening
 from game.serializers.general_serializers import (
     PlayerPublicSerializer,
-    WarriorSerializer,
+    WarriorCountSerializer,
     CardSerializer,
+    warrior_counts,
 )
 
 
@@ -86,13 +87,15 @@ class CrowsSerializer(serializers.Serializer):
 
     player = PlayerPublicSerializer()
     tokens = CrowsTokenSerializer()
-    warriors = WarriorSerializer(many=True)
+    warriors = WarriorCountSerializer(many=True)
     reserve_plots_count = serializers.IntegerField(read_only=True)
     exposure_guessed_plots = ExposureGuessedPlotSerializer(many=True)
 
     @classmethod
     def from_player(cls, player: Player):
-        tokens_plots = PlotToken.objects.filter(player=player, clearing__isnull=False)
+        tokens_plots = PlotToken.objects.filter(
+            player=player, clearing__isnull=False
+        ).select_related("clearing")
 
         token_groups = {}
         for p in tokens_plots:
@@ -101,11 +104,13 @@ class CrowsSerializer(serializers.Serializer):
                 token_groups[label] = []
             token_groups[label].append(p)
 
-        warriors = Warrior.objects.filter(player=player)
+        warriors = warrior_counts(player)
         reserve_plots_count = PlotToken.objects.filter(
             player=player, clearing__isnull=True
         ).count()
-        guessed_plots = ExposureGuessedPlot.objects.filter(player__game=player.game)
+        guessed_plots = ExposureGuessedPlot.objects.filter(
+            player__game=player.game
+        ).select_related("clearing", "player")
 
         return cls(
             instance={
@@ -1,6 +1,8 @@
 from rest_framework import serializers
+from game.game_data.general.maps import get_map_graph
 from game.models.game_models import (
     Game,
+    Clearing,
     DeckEntry,
     DiscardPileEntry,
     Item,
@@ -21,6 +23,7 @@ from game.serializers.crows_serializers import CrowsSerializer, CrowTurnSerializ
 from game.serializers.moles_serializers import MolesSerializer, MoleTurnSerializer
 from game.serializers.general_serializers import (
     CardSerializer,
+    ClearingSerializer,
     DominanceSupplyEntrySerializer,
 )
 from game.serializers.event_serializers import EventSerializer
@@ -192,7 +195,7 @@ class GameStateSerializer(serializers.ModelSerializer):
 
     def get_players(self, game):
         players_data = []
-        for player in game.players.all().order_by("turn_order"):
+        for player in game.players.all().select_related("user").order_by("turn_order"):
             p_data = {
                 "id": player.id,
                 "faction": player.faction,
@@ -233,3 +236,57 @@ class GameStateSerializer(serializers.ModelSerializer):
             players_data.append(p_data)
 
         return players_data
+
+
+class PlayerGameStateSerializer(GameStateSerializer):
+    """
+    GameStateSerializer as seen by one player (context["player"], None for spectators),
+    plus the board, so a client can draw the whole game from a single response.
+    Hides the deck order, and other players' hands and WA supporters.
+    """
+
+    deck = None
+    version = serializers.IntegerField()
+    status = serializers.CharField()
+    viewer = serializers.SerializerMethodField()
+    deck_size = serializers.SerializerMethodField()
+    clearings = serializers.SerializerMethodField()
+
+    class Meta(GameStateSerializer.Meta):
+        fields = [
+            "version",
+            "status",
+            "viewer",
+            "deck_size",
+            "clearings",
+            *(field for field in GameStateSerializer.Meta.fields if field != "deck"),
+        ]
+
+    def get_viewer(self, game) -> int | None:
+        player = self.context.get("player")
+        return player.id if player is not None else None
+
+    def get_deck_size(self, game) -> int:
+        return DeckEntry.objects.filter(game=game).count()
+
+    def get_clearings(self, game):
+        clearings = Clearing.objects.filter(game=game).order_by("clearing_number")
+        if not clearings:  # map not set up yet
+            return []
+        return ClearingSerializer(
+            clearings, many=True, context={"map_graph": get_map_graph(game.boardmap)}
+        ).data
+
+    def get_players(self, game):
+        viewer = self.get_viewer(game)
+        players_data = super().get_players(game)
+        for p_data in players_data:
+            if p_data["id"] == viewer:
+                continue
+            p_data["hand_size"] = len(p_data.pop("hand"))
+            faction_state = p_data.get("faction_state")
+            if faction_state is not None and "supporters" in faction_state:
+                faction_state["supporters_count"] = len(
+                    faction_state.pop("supporters")
+                )
+        return players_data
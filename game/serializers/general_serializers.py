@@ -7,6 +7,8 @@ from game.models.birds.turn import BirdTurn
 from game.models.cats.setup import CatsSimpleSetup
 from game.models.cats.turn import CatTurn
 from game.models.events.setup import GameSimpleSetup
+from django.db.models import QuerySet
+from game.queries.board_state import get_board_state
 from game.queries.cards.active_effects import can_use_card, is_used
 from game.models.game_models import (
     Building,
@@ -18,7 +20,6 @@ from game.models.game_models import (
     Game,
     HandEntry,
     Player,
-    Warrior,
     Token,
     CraftedCardEntry,
     Suit,
@@ -28,6 +29,8 @@ from game.models.game_models import (
 )
 from game.models.wa.turn import WATurn
 from game.models.moles.setup import MolesSimpleSetup
+from game.game_data.cards.exiles_and_partisans import CARD_SUITS, CardsEP
+from game.game_data.general.maps import MapGraph, get_map_graph
 from game.models.moles.turn import MoleTurn
 from game.models.dominance import DominanceSupplyEntry, ActiveDominanceEntry
 from drf_spectacular.utils import extend_schema_field, Direction
@@ -116,6 +119,36 @@ class CardSerializer(serializers.ModelSerializer):
             return card.get("card_name", "")
         return ""
 
+    def to_representation(self, instance):
+        # a card row is its id and the catalog entry of its type
+        if isinstance(instance, Card):
+            return {"id": instance.id, **CARD_CATALOG[instance.card_type]}
+        return super().to_representation(instance)
+
+
+def build_card_catalog() -> dict[str, dict]:
+    """card_type -> CardSerializer payload of a card of that type, without the id"""
+    serializer = CardSerializer()
+    catalog = {}
+    for card_type in CardsEP:
+        card = Card(card_type=card_type.name, suit=CARD_SUITS[card_type.name])
+        payload = serializers.ModelSerializer.to_representation(serializer, card)
+        del payload["id"]
+        catalog[card_type.name] = payload
+    return catalog
+
+
+# the card data is static: serialized once per process, shared by every card payload
+# (so never modify one in place)
+CARD_CATALOG: dict[str, dict] = build_card_catalog()
+
+
+class CardCatalogEntrySerializer(CardSerializer):
+    """a card type of the catalog, which card payloads repeat under their card_name"""
+
+    class Meta(CardSerializer.Meta):
+        fields = [field for field in CardSerializer.Meta.fields if field != "id"]
+
 
 class CraftableItemSerializer(serializers.ModelSerializer):
     item = LabeledChoiceField(choices=ItemTypes.choices, source="item.item_type")
@@ -174,21 +207,32 @@ class CraftedCardSerializer(serializers.ModelSerializer):
         return None
 
 
-class WarriorSerializer(serializers.ModelSerializer):
-    player_name = serializers.CharField(source="player.user.username")
-    clearing_number = serializers.SerializerMethodField()
+class WarriorCountSerializer(serializers.Serializer):
+    """how many of a player's warriors are in a clearing (clearing_number None: supply)"""
 
-    class Meta:
-        model = Warrior
-        fields = [
-            "player_name",
-            "clearing_number",
-        ]
+    clearing_number = serializers.IntegerField(allow_null=True)
+    count = serializers.IntegerField()
+
+
+def warrior_counts(player: Player) -> list[dict]:
+    """the player's warriors per clearing, supply first, from the game's BoardState"""
+    counts = get_board_state(player.game_id).warrior_counts(player)
+    return [
+        {"clearing_number": clearing_number, "count": counts[clearing_number]}
+        for clearing_number in sorted(counts, key=lambda number: -1 if number is None else number)
+    ]
+
+
+def buildings_of(model: type[Building], player: Player) -> QuerySet:
+    """the player's buildings of a type, joined with what BuildingSerializer reads"""
+    return model.objects.filter(player=player).select_related(
+        "player__user", "building_slot__clearing"
+    )
 
-    def get_clearing_number(self, warrior: Warrior) -> int | None:
-        return (
-            warrior.clearing.clearing_number if warrior.clearing is not None else None
-        )
+
+def tokens_of(model: type[Token], player: Player) -> QuerySet:
+    """the player's tokens of a type, joined with what TokenSerializer reads"""
+    return model.objects.filter(player=player).select_related("player__user", "clearing")
 
 
 class BuildingSerializer(serializers.ModelSerializer):
@@ -249,16 +293,23 @@ class ClearingSerializer(serializers.ModelSerializer):
             "ruins",
         ]
 
+    def _map_graph(self, clearing: Clearing) -> MapGraph:
+        # views pass the graph in the context so the game isn't loaded per clearing
+        if "map_graph" in self.context:
+            return self.context["map_graph"]
+        # otherwise the game's map is read once per list (shared root context)
+        graphs = self.context.setdefault("map_graphs", {})
+        if clearing.game_id not in graphs:
+            graphs[clearing.game_id] = get_map_graph(clearing.game.boardmap)
+        return graphs[clearing.game_id]
+
     def get_connected_to(self, clearing: Clearing) -> list[int]:
-        return [
-            clearing.clearing_number for clearing in clearing.connected_clearings.all()
-        ]
+        return sorted(self._map_graph(clearing).adjacent(clearing.clearing_number))
 
     def get_water_connected_to(self, clearing: Clearing) -> list[int]:
-        return [
-            clearing.clearing_number
-            for clearing in clearing.water_connected_clearings.all()
-        ]
+        return sorted(
+            self._map_graph(clearing).river_adjacent(clearing.clearing_number)
+        )
 
     def get_ruins(self, clearing: Clearing) -> list[int]:
         from game.models.game_models import Ruin
@@ -1 +1 @@
-from .main import GameLogSerializer
+from .main import GameLogFeedSerializer, GameLogNodeSerializer, GameLogSerializer
@@ -140,7 +140,7 @@ def log_birds_setup_choose_leader(game: Game, player: Player, leader: 'BirdLeade
     )
 
 
-def get_serializer_data(log: GameLog, details: dict, request=None):
+def get_serializer_data(log: GameLog, details: dict, redacted: bool = False):
     if log.log_type == LogType.BIRDS_ADD_TO_DECREE:
         return BirdsAddToDecreeLogDetailsSerializer(details).data
     if log.log_type == LogType.BIRDS_EMERGENCY_ROOST:
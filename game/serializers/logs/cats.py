@@ -288,7 +288,7 @@ def get_current_march_log(game: Game, player: Player) -> GameLog | None:
     )
 
 
-def get_serializer_data(log: GameLog, details: dict, request=None):
+def get_serializer_data(log: GameLog, details: dict, redacted: bool = False):
     if log.log_type == LogType.CATS_WOOD_PLACEMENT:
         return CatsWoodPlacementLogDetailsSerializer(details).data
     if log.log_type == LogType.CATS_BUILD:
@@ -71,7 +71,7 @@ def log_crafted_card_action(game: Game, player: Player, card: Card, action_type:
     )
 
 
-def get_serializer_data(log: GameLog, details: dict, request=None):
+def get_serializer_data(log: GameLog, details: dict, redacted: bool = False):
     if log.log_type == LogType.CRAFTED_CARD_ACTION:
         return CraftedCardActionLogDetailsSerializer(details).data
     return None
@@ -193,12 +193,11 @@ def log_crows_extortion_stole_card(game: Game, player: Player, victim: Player, c
     )
 
 
-def get_serializer_data(log: GameLog, details: dict, request=None):
+def get_serializer_data(log: GameLog, details: dict, redacted: bool = False):
     if log.log_type == LogType.CROWS_PLOT:
         data = dict(details)
-        if request and hasattr(request, "user"):
-            if log.player and log.player.user != request.user:
-                data = CrowsPlotLogDetailsSerializer.get_redacted_details(data)
+        if redacted:
+            data = CrowsPlotLogDetailsSerializer.get_redacted_details(data)
         return CrowsPlotLogDetailsSerializer(data).data
     if log.log_type == LogType.CROWS_FLIP:
         return CrowsFlipLogDetailsSerializer(details).data
@@ -214,8 +213,7 @@ def get_serializer_data(log: GameLog, details: dict, request=None):
         return CrowsSetupPlaceWarriorLogDetailsSerializer(details).data
     if log.log_type == LogType.CROWS_EXTORTION_STOLE_CARD:
         data = dict(details)
-        if request and hasattr(request, "user"):
-            if log.player and log.player.user != request.user:
-                data = CrowsExtortionStoleCardLogDetailsSerializer.get_redacted_details(data)
+        if redacted:
+            data = CrowsExtortionStoleCardLogDetailsSerializer.get_redacted_details(data)
         return CrowsExtortionStoleCardLogDetailsSerializer(data).data
     return None
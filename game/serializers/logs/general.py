@@ -93,7 +93,9 @@ class AmbushLogDetailsSerializer(serializers.Serializer):
 
     def get_text(self, obj):
         faction = Faction(obj["faction"]).label
-        suit_label = obj["card"]["suit"]["label"]
+        # stored validated: the suit's value, not its labeled form
+        suit = obj["card"]["suit"]
+        suit_label = suit["label"] if isinstance(suit, dict) else Suit(suit).label
         return f"{faction} played Ambush ({suit_label})"
 
 
@@ -389,7 +391,7 @@ def get_battle_log(game: Game, battle_id: int) -> GameLog | None:
     ).last()
 
 
-def get_serializer_data(log: GameLog, details: dict, request=None):
+def get_serializer_data(log: GameLog, details: dict, redacted: bool = False):
     if log.log_type == LogType.TURN:
         if "turn_number" not in details:
             details["turn_number"] = 1
@@ -418,9 +420,8 @@ def get_serializer_data(log: GameLog, details: dict, request=None):
         return PieceRemovalLogDetailsSerializer(details).data
     if log.log_type == LogType.DRAW:
         data = dict(details)
-        if request and hasattr(request, "user"):
-            if log.player and log.player.user != request.user:
-                data = DrawLogDetailsSerializer.get_redacted_details(data)
+        if redacted:
+            data = DrawLogDetailsSerializer.get_redacted_details(data)
         return DrawLogDetailsSerializer(data).data
     if log.log_type == LogType.DISCARD:
         return DiscardLogDetailsSerializer(details).data
@@ -1,7 +1,55 @@
+import logging
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
-from game.models.game_log import GameLog
+from game.models.game_log import GameLog, LogType
+from game.models.game_models import Player
+from . import birds, cats, crafted_cards, crows, general, moles, wa
+
+# each returns the details of the log types it knows, None for the others
+DETAIL_RENDERERS = [
+    general.get_serializer_data,
+    cats.get_serializer_data,
+    birds.get_serializer_data,
+    wa.get_serializer_data,
+    crows.get_serializer_data,
+    moles.get_serializer_data,
+    crafted_cards.get_serializer_data,
+]
+
+logger = logging.getLogger(__name__)
+
+
+def render_details(log: GameLog, redacted: bool = False) -> dict:
+    """
+    the details of a log as shown to players
+    (redacted: as shown to those who may not see its player's hidden information)
+    """
+    details = dict(log.details)
+    for render in DETAIL_RENDERERS:
+        result = render(log, details, redacted=redacted)
+        if result is not None:
+            return result
+    return details
+
+
+def render_log(log: GameLog) -> None:
+    """
+    Renders the details of a log into its rendered fields, from GameLog.save(), so that
+    reading logs is a projection. rendered_redacted is None when nothing is hidden.
+    Details that do not fit their serializer are left to be rendered (and fail) when read.
+    """
+    try:
+        rendered = render_details(log)
+        rendered_redacted = render_details(log, redacted=True)
+    except (KeyError, AttributeError, serializers.ValidationError) as e:
+        # DRF raises KeyError/AttributeError for a field missing from the details
+        logger.warning("log %s (%s) not rendered: %r", log.pk, log.log_type, e)
+        log.rendered = log.rendered_redacted = None
+        return
+    log.rendered = rendered
+    log.rendered_redacted = rendered_redacted if rendered_redacted != rendered else None
+
 
 class GameLogSerializer(serializers.ModelSerializer):
     details = serializers.SerializerMethodField()
@@ -14,33 +62,56 @@ class GameLogSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(OpenApiTypes.ANY)
     def get_details(self, log: GameLog):
-        details = dict(log.details)
+        redacted = self.is_redacted(log)
+        if log.rendered is None:
+            return render_details(log, redacted=redacted)
+        if redacted and log.rendered_redacted is not None:
+            return log.rendered_redacted
+        return log.rendered
+
+    def is_redacted(self, log: GameLog) -> bool:
+        """whether the requesting user is shown the log without its player's hidden details"""
         request = self.context.get("request")
+        if request is None or log.player_id is None:
+            return False
+        # by user: a user may hold several seats of a game
+        if getattr(request.user, "is_authenticated", False) and log.player.user_id == request.user.pk:
+            return False
+        # the player who gave a card to an Outrage sees it too
+        if log.log_type == LogType.WA_OUTRAGE:
+            return log.details.get("outrageous_player_faction") not in self.get_viewer_factions(
+                log.game_id
+            )
+        return True
 
-        # Delegate to submodules
-        from .general import get_serializer_data as get_general_data
-        from .cats import get_serializer_data as get_cats_data
-        from .birds import get_serializer_data as get_birds_data
-        from .wa import get_serializer_data as get_wa_data
-        from .crows import get_serializer_data as get_crow_data
-        from .moles import get_serializer_data as get_moles_data
-        from .crafted_cards import get_serializer_data as get_crafted_data
-
-        for getter in [
-            get_general_data,
-            get_cats_data,
-            get_birds_data,
-            get_wa_data,
-            get_crow_data,
-            get_moles_data,
-            get_crafted_data,
-        ]:
-            result = getter(log, details, request=request)
-            if result is not None:
-                return result
-
-        return details
+    def get_viewer_factions(self, game_id: int) -> set[str]:
+        """factions of the requesting user's players in the game, looked up once per response"""
+        # the context is shared with the serializers of the children
+        viewers = self.context.setdefault("viewers", {})
+        if game_id not in viewers:
+            user = self.context["request"].user
+            viewers[game_id] = (
+                set(Player.objects.filter(game_id=game_id, user=user).values_list("faction", flat=True))
+                if getattr(user, "is_authenticated", False)
+                else set()
+            )
+        return viewers[game_id]
 
     def get_children(self, log: GameLog):
         children = getattr(log, "_children", [])
         return GameLogSerializer(children, many=True, context=self.context).data
+
+
+class GameLogNodeSerializer(GameLogSerializer):
+    """a log without its children, which come as logs of their own (log feed)"""
+
+    class Meta(GameLogSerializer.Meta):
+        fields = [field for field in GameLogSerializer.Meta.fields if field != "children"]
+
+
+class GameLogFeedSerializer(serializers.Serializer):
+    latest_log_id = serializers.IntegerField(allow_null=True)
+    logs_updated_at = serializers.DateTimeField(allow_null=True)
+    cursor = serializers.CharField(allow_null=True)
+    reset = serializers.BooleanField()
+    logs = GameLogNodeSerializer(many=True)
@@ -540,7 +540,7 @@ def log_moles_price_of_failure(
 # DISPATCHER
 # ==================
 
-def get_serializer_data(log, details, request=None):
+def get_serializer_data(log, details, redacted=False):
     moles_serializers = {
         LogType.MOLES_SETUP_PICK_CORNER: MolesSetupPickCornerLogDetailsSerializer,
         LogType.MOLES_BIRDSONG_PLACE_WARRIORS: MolesBirdsongPlaceWarriorsLogDetailsSerializer,
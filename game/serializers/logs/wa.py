@@ -291,16 +291,15 @@ def log_wa_supporters_lost(game: Game, player: Player, cards: list[Card], parent
         game=game, player=player, log_type=LogType.WA_SUPPORTERS_LOST, details=serializer.validated_data, parent=parent
     )
 
-def get_serializer_data(log: GameLog, details: dict, request=None):
+def get_serializer_data(log: GameLog, details: dict, redacted: bool = False):
     if log.log_type == LogType.WA_REVOLT:
         return WARevoltLogDetailsSerializer(details).data
     if log.log_type == LogType.WA_SPREAD_SYMPATHY:
         return WASpreadSympathyLogDetailsSerializer(details).data
     if log.log_type == LogType.WA_MOBILIZE:
         data = dict(details)
-        if request and hasattr(request, "user"):
-            if log.player and log.player.user != request.user:
-                data = WAMobilizeLogDetailsSerializer.get_redacted_details(data)
+        if redacted:
+            data = WAMobilizeLogDetailsSerializer.get_redacted_details(data)
         return WAMobilizeLogDetailsSerializer(data).data
     if log.log_type == LogType.WA_TRAIN:
         return WATrainLogDetailsSerializer(details).data
@@ -310,12 +309,8 @@ def get_serializer_data(log: GameLog, details: dict, request=None):
         return WAMilitaryOperationLogDetailsSerializer(details).data
     if log.log_type == LogType.WA_OUTRAGE:
         data = dict(details)
-        if request and hasattr(request, "user"):
-            outrageous_player_faction = details.get("outrageous_player_faction")
-            from game.models.game_models import Player
-            outrageous_player = Player.objects.filter(game=log.game, faction=outrageous_player_faction).first()
-            if (log.player and log.player.user != request.user) and (outrageous_player and outrageous_player.user != request.user):
-                data = WAOutrageLogDetailsSerializer.get_redacted_details(data)
+        if redacted:
+            data = WAOutrageLogDetailsSerializer.get_redacted_details(data)
         return WAOutrageLogDetailsSerializer(data).data
     if log.log_type == LogType.WA_BASE_REMOVED:
         return WABaseRemovedLogDetailsSerializer(details).data
@@ -323,8 +318,7 @@ def get_serializer_data(log: GameLog, details: dict, request=None):
         return WAOfficersLostLogDetailsSerializer(details).data
     if log.log_type == LogType.WA_SUPPORTERS_LOST:
         data = dict(details)
-        if request and hasattr(request, "user"):
-            if log.player and log.player.user != request.user:
-                data = WASupportersLostLogDetailsSerializer.get_redacted_details(data)
+        if redacted:
+            data = WASupportersLostLogDetailsSerializer.get_redacted_details(data)
         return WASupportersLostLogDetailsSerializer(data).data
     return None
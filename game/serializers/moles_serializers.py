@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from game.models.game_models import Player, Warrior
+from game.models.game_models import Player
 from game.models.moles.buildings import Citadel, Market
 from game.models.moles.tokens import Tunnel
 from game.models.moles.turn import MoleTurn, MoleBirdsong, MoleDaylight, MoleEvening
@@ -10,7 +10,10 @@ from game.serializers.general_serializers import (
     BuildingSerializer,
     PlayerPublicSerializer,
     TokenSerializer,
-    WarriorSerializer,
+    WarriorCountSerializer,
+    buildings_of,
+    tokens_of,
+    warrior_counts,
 )
 
 
@@ -32,7 +35,7 @@ class MolesCrownSerializer(serializers.ModelSerializer):
 
 
 class MolesCitadelSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer()
+    building = BuildingSerializer(source="*")
 
     class Meta:
         model = Citadel
@@ -40,7 +43,7 @@ class MolesCitadelSerializer(serializers.ModelSerializer):
 
 
 class MolesMarketSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer()
+    building = BuildingSerializer(source="*")
 
     class Meta:
         model = Market
@@ -55,7 +58,7 @@ class MolesBuildingsSerializer(serializers.Serializer):
 
 
 class MolesNestedTokenSerializer(serializers.Serializer):
-    token = TokenSerializer()
+    token = TokenSerializer(source="*")
 
 
 class MolesTokensSerializer(serializers.Serializer):
@@ -96,7 +99,7 @@ class MolesSerializer(serializers.Serializer):
     """Serializer to provide all (public) information about moles"""
 
     player = PlayerPublicSerializer()
-    warriors = WarriorSerializer(many=True)
+    warriors = WarriorCountSerializer(many=True)
     buildings = MolesBuildingsSerializer()
     tokens = MolesTokensSerializer()
     ministers = MolesMinisterSerializer(many=True)
@@ -105,10 +108,10 @@ class MolesSerializer(serializers.Serializer):
 
     @classmethod
     def from_player(cls, player: Player):
-        warriors = Warrior.objects.filter(player=player)
-        citadels = Citadel.objects.filter(player=player)
-        markets = Market.objects.filter(player=player)
-        tunnels = Tunnel.objects.filter(player=player)
+        warriors = warrior_counts(player)
+        citadels = buildings_of(Citadel, player)
+        markets = buildings_of(Market, player)
+        tunnels = tokens_of(Tunnel, player)
 
         buildings = {
             "citadels": citadels,
@@ -122,10 +125,10 @@ class MolesSerializer(serializers.Serializer):
         ministers = Minister.objects.filter(player=player)
         crowns = Crown.objects.filter(player=player)
 
-        # Count warriors in burrow (warriors with no clearing)
-        burrow_count = Warrior.objects.filter(
-            player=player, clearing__isnull=False, clearing__clearing_number=0
-        ).count()
+        # Count warriors in burrow (clearing 0)
+        burrow_count = next(
+            (entry["count"] for entry in warriors if entry["clearing_number"] == 0), 0
+        )
 
         return cls(
             instance={
@@ -1,7 +1,7 @@
 from game.serializers.general_serializers import CardSerializer
 from rest_framework import serializers
 
-from game.models.game_models import Player, Warrior
+from game.models.game_models import Player
 from game.models.wa.buildings import WABase
 from game.models.wa.player import OfficerEntry, SupporterStackEntry
 from game.models.wa.tokens import WASympathy
@@ -10,12 +10,15 @@ from game.serializers.general_serializers import (
     BuildingSerializer,
     PlayerPublicSerializer,
     TokenSerializer,
-    WarriorSerializer,
+    WarriorCountSerializer,
+    buildings_of,
+    tokens_of,
+    warrior_counts,
 )
 
 
 class WABaseSerializer(serializers.ModelSerializer):
-    building = BuildingSerializer(read_only=True)
+    building = BuildingSerializer(source="*", read_only=True)
     suit = serializers.CharField(read_only=True)
 
     class Meta:
@@ -24,7 +27,7 @@ class WABaseSerializer(serializers.ModelSerializer):
 
 
 class WASympathySerializer(serializers.ModelSerializer):
-    token = TokenSerializer()
+    token = TokenSerializer(source="*")
     crafted_with = serializers.BooleanField(read_only=True)
 
     class Meta:
@@ -76,19 +79,19 @@ class WASerializer(serializers.Serializer):
     player = PlayerPublicSerializer()
     tokens = WATokenSerializer()
     buildings = WABuildingSerializer()
-    warriors = WarriorSerializer(many=True)
+    warriors = WarriorCountSerializer(many=True)
     supporter_count = serializers.IntegerField(read_only=True)
     officer_count = serializers.IntegerField(read_only=True)
 
     @classmethod
     def from_player(cls, player: Player):
-        tokens_sympathy = WASympathy.objects.filter(player=player)
+        tokens_sympathy = tokens_of(WASympathy, player)
         tokens = {"sympathy": tokens_sympathy}
 
-        bases = WABase.objects.filter(player=player)
+        bases = buildings_of(WABase, player)
         buildings = {"base": bases}
 
-        warriors = Warrior.objects.filter(player=player)
+        warriors = warrior_counts(player)
 
         supporter_count = SupporterStackEntry.objects.filter(player=player).count()
         officer_count = OfficerEntry.objects.filter(player=player).count()
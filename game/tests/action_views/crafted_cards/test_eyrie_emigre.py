@@ -23,7 +23,8 @@ class EyrieEmigreViewTestCase(TestCase):
 
         # Place some warriors for move
         self.clearing1 = Clearing.objects.get(game=self.game, clearing_number=1)
-        self.clearing2 = Clearing.objects.get(game=self.game, clearing_number=2)
+        # 1 and 5 are adjacent on the Autumn map
+        self.clearing2 = Clearing.objects.get(game=self.game, clearing_number=5)
         
         # Clear any existing warriors from setup
         Warrior.objects.filter(clearing__in=[self.clearing1, self.clearing2]).delete()
@@ -33,9 +34,6 @@ class EyrieEmigreViewTestCase(TestCase):
         Warrior.objects.create(player=self.cats_player, clearing=self.clearing2)
         self.cats_player.refresh_from_db()
         
-        # Ensure they are adjacent (should be in Autumn map)
-        if self.clearing2 not in self.clearing1.connected_clearings.all():
-            self.clearing1.connected_clearings.add(self.clearing2)
 
         # Set Birds turn and phase to the very end of Birdsong
         from game.models.birds.turn import BirdTurn, BirdBirdsong, BirdDaylight
@@ -79,7 +77,7 @@ class EyrieEmigreViewTestCase(TestCase):
         self.assertEqual(response.data["name"], "destination")
         
         # 4. SUBMIT destination -> count
-        response = self.birds_client.submit_action({"clearing_number": 2})
+        response = self.birds_client.submit_action({"clearing_number": 5})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["name"], "count")
         
@@ -11,7 +11,7 @@ from game.transactions.general import craft_card
 class FalseOrdersTest(TestCase):
     def setUp(self):
         self.owner = User.objects.create(username="owner")
-        self.game = Game.objects.create(owner=self.owner)
+        self.game = Game.objects.create(owner=self.owner, boardmap=Game.BoardMaps.AUTUMN)
         construct_deck(self.game)
         self.user1 = User.objects.create(username="user1")
         self.user2 = User.objects.create(username="user2")
@@ -19,8 +19,8 @@ class FalseOrdersTest(TestCase):
         self.bird_player = Player.objects.create(game=self.game, faction=Faction.BIRDS, turn_order=1, user=self.user2)
         
         self.clearing1 = Clearing.objects.create(game=self.game, clearing_number=1, suit=Suit.RED)
-        self.clearing2 = Clearing.objects.create(game=self.game, clearing_number=2, suit=Suit.YELLOW)
-        self.clearing1.connected_clearings.add(self.clearing2)
+        # 1 and 5 are adjacent on the Autumn map
+        self.clearing2 = Clearing.objects.create(game=self.game, clearing_number=5, suit=Suit.YELLOW)
         
         # Give cats some warriors in clearing 1
         for _ in range(5):
@@ -112,8 +112,7 @@ class FalseOrdersTest(TestCase):
         self.assertIn("yourself", str(cm.exception))
 
     def test_use_false_orders_no_warriors(self):
-        empty_clearing = Clearing.objects.create(game=self.game, clearing_number=3, suit=Suit.ORANGE)
-        self.clearing1.connected_clearings.add(empty_clearing)
+        empty_clearing = Clearing.objects.create(game=self.game, clearing_number=9, suit=Suit.ORANGE)
         
         with self.assertRaises(ValueError) as cm:
             use_false_orders(
@@ -129,7 +128,7 @@ from game.tests.client import RootGameClient
 class FalseOrdersViewTest(TestCase):
     def setUp(self):
         self.owner = User.objects.create(username="owner")
-        self.game = Game.objects.create(owner=self.owner)
+        self.game = Game.objects.create(owner=self.owner, boardmap=Game.BoardMaps.AUTUMN)
         construct_deck(self.game)
         self.user1 = User.objects.create(username="user1")
         self.user2 = User.objects.create(username="user2")
@@ -139,8 +138,8 @@ class FalseOrdersViewTest(TestCase):
         self.bird_player = Player.objects.create(game=self.game, faction=Faction.BIRDS, turn_order=1, user=self.user2)
         
         self.clearing1 = Clearing.objects.create(game=self.game, clearing_number=1, suit=Suit.RED)
-        self.clearing2 = Clearing.objects.create(game=self.game, clearing_number=2, suit=Suit.YELLOW)
-        self.clearing1.connected_clearings.add(self.clearing2)
+        # 1 and 5 are adjacent on the Autumn map
+        self.clearing2 = Clearing.objects.create(game=self.game, clearing_number=5, suit=Suit.YELLOW)
         
         # Give cats some warriors in clearing 1
         for _ in range(5):
@@ -180,7 +179,7 @@ class FalseOrdersViewTest(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["name"], "pick_destination")
-        self.assertEqual(response.data["options"][0]["value"], "2") # Clearing number
+        self.assertEqual(response.data["options"][0]["value"], "5") # Clearing number
         
         # 4. POST pick_destination (Final)
         response = self.client.post(
@@ -188,7 +187,7 @@ class FalseOrdersViewTest(TestCase):
             {
                 "origin_number": 1,
                 "target_faction": Faction.CATS,
-                "destination_number": 2
+                "destination_number": 5
             }
         )
         self.assertEqual(response.status_code, 200)
@@ -27,16 +27,14 @@ class LeagueOfAdventurersViewTestCase(TestCase):
 
         # Place some warriors
         self.clearing1 = Clearing.objects.get(game=self.game, clearing_number=1)
-        self.clearing2 = Clearing.objects.get(game=self.game, clearing_number=2)
+        # 1 and 5 are adjacent on the Autumn map
+        self.clearing2 = Clearing.objects.get(game=self.game, clearing_number=5)
         
         # Clear any existing warriors from setup
         Warrior.objects.filter(clearing__in=[self.clearing1, self.clearing2]).delete()
         
         Warrior.objects.create(player=self.birds_player, clearing=self.clearing1)
         
-        # Ensure they are adjacent
-        if self.clearing2 not in self.clearing1.connected_clearings.all():
-            self.clearing1.connected_clearings.add(self.clearing2)
 
         # Set Birds turn and phase to Daylight
         from game.models.birds.turn import BirdTurn, BirdBirdsong, BirdDaylight
@@ -80,7 +78,7 @@ class LeagueOfAdventurersViewTestCase(TestCase):
         self.assertEqual(response.data["name"], "pick_destination")
         
         # 5. SUBMIT destination -> pick-count
-        response = self.birds_client.submit_action({"clearing_number": 2})
+        response = self.birds_client.submit_action({"clearing_number": 5})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["name"], "pick_count")
         
@@ -34,6 +34,14 @@ class CrowsCraftingTests(APITestCase):
         self.birdsong.step = CrowBirdsong.CrowBirdsongSteps.CRAFT
         self.birdsong.save()
 
+    def test_crows_crafting_uncraftable_card(self):
+        card_obj = Card.objects.filter(card_type=CardsEP.DOMINANCE_RED.name).first()
+        HandEntry.objects.create(player=self.crows_player, card=card_obj)
+
+        self.crows_client.get_action()
+        response = self.crows_client.submit_action({"card": CardsEP.DOMINANCE_RED.name})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_crows_crafting_mixed_tokens(self):
         """Test crafting with one face-down and one face-up plot token."""
         # 1. Setup card in hand: FOXFOLK_STEEL (cost: 2 RED)
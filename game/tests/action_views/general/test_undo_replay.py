@@ -0,0 +1,116 @@
+from unittest import mock
+from django.test import TestCase, override_settings
+from game.decorators.transaction_decorator import atomic_game_action
+from game.logic import playback
+from game.logic.playback import actions_to_replay, replay_actions, undo_last_action
+from game.models import checkpoint_models
+from game.models.checkpoint_models import Action, Checkpoint
+from game.models.game_models import Faction, Clearing, Warrior
+from game.tests.my_factories import GameSetupWithFactionsFactory, WarriorFactory
+from game.serializers.action_serializer import ActionSerializer
+from game.utils import snapshot
+from game.transactions.general import move_warriors
+
+
+@override_settings(CHECKPOINT_ACTION_INTERVAL=3)
+class UndoReplayCacheTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats_player = self.game.players.get(faction=Faction.CATS)
+        self.c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        self.c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        for _ in range(10):
+            WarriorFactory(player=self.cats_player, clearing=self.c1)
+
+    def warriors_in_c5(self) -> int:
+        return Warrior.objects.filter(player=self.cats_player, clearing=self.c5).count()
+
+    def take_actions(self, count: int):
+        for _ in range(count):
+            atomic_game_action(move_warriors)(self.cats_player, self.c1, self.c5, 1)
+
+    def test_state_captured_every_interval(self):
+        self.take_actions(7)
+        captured = Action.objects.filter(gamestate__isnull=False).values_list(
+            "action_number", flat=True
+        )
+        self.assertEqual(sorted(captured), [2, 5])
+
+    def test_captures_do_not_replay_checkpoint_deltas(self):
+        # the actions go on a delta checkpoint of the current turn
+        Checkpoint.record(self.game, snapshot.capture_gamestate(self.game))
+        Checkpoint.record(self.game, snapshot.capture_gamestate(self.game))
+        checkpoint_models._materialized.clear()
+
+        with mock.patch.object(
+            snapshot, "apply_gamestate_delta", wraps=snapshot.apply_gamestate_delta
+        ) as apply_delta:
+            self.take_actions(6)
+        # the checkpoint is rebuilt for the first capture only
+        self.assertEqual(apply_delta.call_count, 1)
+        self.assertEqual(Action.objects.filter(gamestate__isnull=False).count(), 2)
+
+    def test_undo_replays_only_actions_after_capture(self):
+        start = self.warriors_in_c5()
+        self.take_actions(8)
+
+        with mock.patch.object(
+            playback, "get_function_by_name", wraps=playback.get_function_by_name
+        ) as resolve:
+            undo_last_action(self.game)
+        # restored from the state after action 5, then replays action 6
+        self.assertEqual(resolve.call_count, 1)
+        self.assertEqual(self.warriors_in_c5(), start + 7)
+
+    def test_replayed_actions_get_their_own_static_rows(self):
+        self.take_actions(2)
+        checkpoint = Checkpoint.objects.filter(game=self.game).last()
+        origins, cached = [], []
+
+        def record(player, origin, *args):
+            origins.append(origin)
+            cached.append(set(origin._state.fields_cache))
+            origin.game  # fills the relation cache of this action's clearing
+
+        with mock.patch.object(playback, "get_function_by_name", return_value=record):
+            replay_actions(actions_to_replay(checkpoint, 0, 1))
+        self.assertEqual([origin.pk for origin in origins], [self.c1.pk, self.c1.pk])
+        self.assertIsNot(origins[0], origins[1])
+        self.assertEqual(cached, [set(), set()])
+
+    def test_repeated_undo_restores_each_step(self):
+        start = self.warriors_in_c5()
+        self.take_actions(7)
+        for remaining in range(6, -1, -1):
+            undo_last_action(self.game)
+            self.assertEqual(self.warriors_in_c5(), start + remaining)
+
+
+class ReplayResolutionTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats_player = self.game.players.get(faction=Faction.CATS)
+
+    def test_wrapped_transactions_resolve_from_registry(self):
+        atomic_game_action(move_warriors)
+        with mock.patch.object(playback.importlib, "import_module") as import_module:
+            func = playback.get_function_by_name(
+                "game.transactions.general.move_warriors"
+            )
+        self.assertIs(func, move_warriors)
+        import_module.assert_not_called()
+
+    def test_model_refs_fetched_once_per_label(self):
+        warriors = list(Warrior.objects.filter(player=self.cats_player)[:3])
+        s_args, s_kwargs = ActionSerializer.serialize_args(
+            [self.cats_player, warriors], {}
+        )
+        refs = ActionSerializer.collect_model_refs(s_args)
+        self.assertEqual(refs["game.Warrior"], {w.pk for w in warriors})
+
+        with self.assertNumQueries(2):
+            instances = ActionSerializer.fetch_model_refs(refs)
+        with self.assertNumQueries(0):
+            d_args, _ = ActionSerializer.deserialize_args(s_args, s_kwargs, instances)
+        self.assertEqual(d_args[0], self.cats_player)
+        self.assertEqual(d_args[1], warriors)
@@ -1,6 +1,13 @@
 from django.test import TestCase
 from game.tests.client import RootGameClient
-from game.models.game_models import Faction, Player, Game, HandEntry, CraftedCardEntry
+from game.models.game_models import (
+    Card,
+    CraftedCardEntry,
+    Faction,
+    Game,
+    HandEntry,
+    Player,
+)
 
 from game.tests.my_factories import (
     GameSetupWithFactionsFactory,
@@ -179,6 +186,24 @@ class WATurnFlowTestCase(TestCase):
         # After skip, should move to next action
         self.assertIsNotNone(self.wa_client.step)
 
+    def test_wa_craft_uncraftable_card(self):
+        """
+        Test that crafting a card that cannot be crafted is refused with a 400.
+        """
+        turn = WATurn.objects.get(player=self.wa_player)
+        WABirdsong.objects.filter(turn=turn).update(
+            step=WABirdsong.WABirdsongSteps.COMPLETED
+        )
+        WADaylight.objects.filter(turn=turn).update(
+            step=WADaylight.WADaylightSteps.ACTIONS
+        )
+
+        self.wa_client.get_action()
+        response = self.wa_client.submit_action({"action_type": "craft"})
+        self.assertEqual(response.status_code, 200)
+        response = self.wa_client.submit_action({"card": CardsEP.DOMINANCE_RED.name})
+        self.assertEqual(response.status_code, 400)
+
     def test_wa_informants_flow(self):
         """
         Test that Informants triggers during WA Drawing step and can be skipped.
@@ -224,6 +249,37 @@ class WATurnFlowTestCase(TestCase):
         self.game.refresh_from_db()
         self.assertEqual(self.game.current_turn, 0)  # Back to Cats
 
+    def test_wa_discard_flow(self):
+        """
+        Test that WA discards down to five cards at the end of Evening.
+        """
+        HandEntry.objects.filter(player=self.wa_player).delete()
+        for card in Card.objects.filter(game=self.game)[:7]:
+            HandEntry.objects.create(player=self.wa_player, card=card)
+        turn = WATurn.objects.get(player=self.wa_player)
+        WABirdsong.objects.filter(turn=turn).update(
+            step=WABirdsong.WABirdsongSteps.COMPLETED
+        )
+        WADaylight.objects.filter(turn=turn).update(
+            step=WADaylight.WADaylightSteps.COMPLETED
+        )
+        WAEvening.objects.filter(turn=turn).update(
+            step=WAEvening.WAEveningSteps.DISCARDING
+        )
+
+        self.wa_client.get_action()
+        self.assertEqual(
+            self.wa_client.base_route, "/api/woodland-alliance/evening/discard-cards/"
+        )
+        for _ in range(2):
+            card = HandEntry.objects.filter(player=self.wa_player).first().card
+            response = self.wa_client.submit_action({"card": card.card_type})
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(HandEntry.objects.filter(player=self.wa_player).count(), 5)
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.current_turn, 0)  # Back to Cats
+
     def test_wa_eyrie_emigre_flow(self):
         """
         Test that Eyrie Emigre triggers after WA Birdsong and can be skipped.
@@ -0,0 +1,38 @@
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
+from game.game_data.cards.exiles_and_partisans import CardsEP
+from game.models.game_models import Card, Faction
+from game.serializers.general_serializers import CARD_CATALOG, CardSerializer
+from game.tests.my_factories import GameSetupWithFactionsFactory
+
+
+class CardCatalogTests(APITestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.url = "/api/cards/catalog/"
+
+    def test_card_payloads_are_unchanged(self):
+        for card in Card.objects.filter(game=self.game):
+            with self.subTest(card_type=card.card_type):
+                self.assertEqual(
+                    CardSerializer(card).data,
+                    serializers.ModelSerializer.to_representation(CardSerializer(), card),
+                )
+
+    def test_catalog_endpoint(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        catalog = {entry["card_name"]: entry for entry in response.json()}
+        self.assertEqual(set(catalog), {card_type.name for card_type in CardsEP})
+        self.assertEqual(catalog, CARD_CATALOG)
+
+        card = Card.objects.filter(game=self.game).first()
+        payload = CardSerializer(card).data
+        del payload["id"]
+        self.assertEqual(catalog[payload["card_name"]], payload)
+
+    def test_catalog_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
@@ -2,7 +2,9 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from game.tests.my_factories import GameSetupWithFactionsFactory, UserFactory
-from game.models.game_models import Faction
+from game.game_data.general.maps import get_map_graph
+from game.models.game_models import Clearing, Faction
+from game.serializers.general_serializers import ClearingSerializer
 
 
 class ClearingEndpointTests(APITestCase):
@@ -22,3 +24,14 @@ class ClearingEndpointTests(APITestCase):
         self.assertEqual(len(data), 12)
         has_ruins = any(len(c["ruins"]) > 0 for c in data)
         self.assertTrue(has_ruins)
+
+    def test_map_read_once_without_map_graph(self):
+        clearings = Clearing.objects.filter(game=self.game)
+        expected = ClearingSerializer(
+            clearings, many=True, context={"map_graph": get_map_graph(self.game.boardmap)}
+        ).data
+        count = clearings.count()
+        # the clearings, the game once, then ruins per clearing
+        with self.assertNumQueries(2 + count):
+            data = ClearingSerializer(Clearing.objects.filter(game=self.game), many=True).data
+        self.assertEqual(data, expected)
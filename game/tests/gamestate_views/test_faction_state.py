@@ -0,0 +1,75 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+from game.models.cats.buildings import Sawmill
+from game.models.game_models import BuildingSlot, Clearing, Faction, Warrior
+from game.tests.my_factories import GameSetupWithFactionsFactory
+
+
+class FactionStateEndpointTests(APITestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(
+            factions=[
+                Faction.CATS,
+                Faction.BIRDS,
+                Faction.WOODLAND_ALLIANCE,
+                Faction.CROWS,
+                Faction.MOLES,
+            ]
+        )
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.client.force_authenticate(user=self.cats.user)
+        self.urls = {
+            faction: f"/api/{route}/player-info/{self.game.id}/"
+            for faction, route in [
+                (Faction.CATS, "cats"),
+                (Faction.BIRDS, "birds"),
+                (Faction.WOODLAND_ALLIANCE, "woodland-alliance"),
+                (Faction.CROWS, "crows"),
+                (Faction.MOLES, "moles"),
+            ]
+        }
+
+    def get(self, faction) -> tuple[dict, int]:
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.urls[faction])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json(), len(ctx.captured_queries)
+
+    def test_warriors_are_counted_per_clearing(self):
+        data, _ = self.get(Faction.CATS)
+        warriors = Warrior.objects.filter(player=self.cats)
+        self.assertEqual(data["warriors"][0]["clearing_number"], None)
+        self.assertEqual(
+            {entry["clearing_number"]: entry["count"] for entry in data["warriors"]},
+            {
+                clearing_number: warriors.filter(
+                    clearing__clearing_number=clearing_number
+                ).count()
+                for clearing_number in warriors.values_list(
+                    "clearing__clearing_number", flat=True
+                )
+            },
+        )
+        self.assertEqual(sum(entry["count"] for entry in data["warriors"]), warriors.count())
+
+    def test_queries_do_not_grow_with_pieces(self):
+        queries = {faction: self.get(faction)[1] for faction in self.urls}
+
+        # put more cat pieces on the board
+        supply = Warrior.objects.filter(player=self.cats, clearing__isnull=True)
+        for clearing_number, warrior in zip(range(2, 12), supply[:10]):
+            warrior.clearing = Clearing.objects.get(game=self.game, clearing_number=clearing_number)
+            warrior.save()
+        sawmill = Sawmill.objects.filter(player=self.cats, building_slot__isnull=True).first()
+        sawmill.building_slot = BuildingSlot.objects.create(
+            clearing=Clearing.objects.get(game=self.game, clearing_number=3),
+            building_slot_number=5,
+        )
+        sawmill.save()
+
+        for faction, url in self.urls.items():
+            with self.subTest(faction=faction):
+                self.assertEqual(self.get(faction)[1], queries[faction])
+        self.assertLess(queries[Faction.CATS], 20)
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from rest_framework import status
+from rest_framework.test import APITestCase
+from game.models.game_log import GameLog
+from game.models.game_models import Faction
+from game.queries.game_log import log_cursor
+from game.serializers.logs.general import log_move, log_phase, log_turn
+from game.tests.my_factories import GameSetupWithFactionsFactory
+
+
+class GameLogFeedTests(APITestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.client.force_authenticate(user=self.cats.user)
+        self.url = f"/api/game-log/{self.game.id}/feed/"
+        self.turn = log_turn(self.game, self.cats, 1)
+        self.phase = log_phase(self.game, self.cats, "Birdsong", parent=self.turn)
+
+    def get(self, after=None) -> dict:
+        params = {} if after is None else {"after": after}
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_without_cursor_sends_everything(self):
+        data = self.get()
+        self.assertTrue(data["reset"])
+        self.assertEqual(data["latest_log_id"], self.phase.id)
+        self.assertEqual(data["cursor"], log_cursor(self.phase.id, self.phase.created_at))
+        self.assertEqual(
+            [log["id"] for log in data["logs"]],
+            list(GameLog.objects.filter(game=self.game).values_list("id", flat=True)),
+        )
+        self.assertEqual(
+            [(log["id"], log["parent_id"]) for log in data["logs"]][-2:],
+            [(self.turn.id, None), (self.phase.id, self.turn.id)],
+        )
+
+    def test_sends_only_new_logs(self):
+        cursor = self.get()["cursor"]
+        self.assertEqual(self.get(after=cursor)["logs"], [self.get()["logs"][-1]])
+
+        move = log_move(self.game, self.cats, 1, 5, 2, parent=self.phase)
+        data = self.get(after=cursor)
+        self.assertFalse(data["reset"])
+        self.assertEqual(data["latest_log_id"], move.id)
+        self.assertEqual(data["cursor"], log_cursor(move.id, move.created_at))
+        # the cursor log itself may come again, the new one (child of an older log) does
+        self.assertEqual(
+            [(log["id"], log["parent_id"]) for log in data["logs"]][-1],
+            (move.id, self.phase.id),
+        )
+        self.assertNotIn(self.turn.id, [log["id"] for log in data["logs"]])
+
+    def test_sends_changed_older_logs(self):
+        cursor = self.get()["cursor"]
+        self.turn.details = {**self.turn.details, "turn_number": 2}
+        self.turn.save()
+
+        data = self.get(after=cursor)
+        self.assertFalse(data["reset"])
+        self.assertEqual(data["logs_updated_at"], self.get()["logs_updated_at"])
+        turn = next(log for log in data["logs"] if log["id"] == self.turn.id)
+        self.assertEqual(turn["details"]["turn_number"], 2)
+        # no newer log: the cursor stays
+        self.assertEqual(data["cursor"], cursor)
+
+    def test_undone_cursor_resets(self):
+        move = log_move(self.game, self.cats, 1, 5, 2, parent=self.phase)
+        cursor = self.get()["cursor"]
+        GameLog.objects.filter(pk=move.pk).delete()
+
+        data = self.get(after=cursor)
+        self.assertTrue(data["reset"])
+        self.assertEqual(data["latest_log_id"], self.phase.id)
+        self.assertEqual(len(data["logs"]), GameLog.objects.filter(game=self.game).count())
+
+    def test_reused_log_id_resets(self):
+        move = log_move(self.game, self.cats, 1, 5, 2, parent=self.phase)
+        cursor = self.get()["cursor"]
+        # undone, and its id handed to the next log
+        GameLog.objects.filter(pk=move.pk).update(created_at=move.created_at + timedelta(seconds=1))
+
+        data = self.get(after=cursor)
+        self.assertTrue(data["reset"])
+        self.assertEqual(len(data["logs"]), GameLog.objects.filter(game=self.game).count())
+        self.assertNotEqual(data["cursor"], cursor)
+
+    def test_bad_cursor(self):
+        for after in ["x", str(self.phase.id), f"{self.phase.id}.x"]:
+            with self.subTest(after=after):
+                response = self.client.get(self.url, {"after": after})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
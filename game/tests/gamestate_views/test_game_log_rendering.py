@@ -0,0 +1,95 @@
+from unittest.mock import patch
+from rest_framework.test import APITestCase
+from game.models.game_log import GameLog, LogType
+from game.models.game_models import Card, Faction
+from game.serializers.general_serializers import CardSerializer
+from game.serializers.logs.general import log_ambush, log_draw, log_move, log_turn
+from game.serializers.logs.wa import log_wa_outrage
+from game.tests.my_factories import GameSetupWithFactionsFactory, UserFactory
+
+
+class GameLogRenderingTests(APITestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(
+            factions=[Faction.CATS, Faction.BIRDS, Faction.WOODLAND_ALLIANCE]
+        )
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.birds = self.game.players.get(faction=Faction.BIRDS)
+        self.wa = self.game.players.get(faction=Faction.WOODLAND_ALLIANCE)
+        self.card = Card.objects.filter(game=self.game).first()
+        self.url = f"/api/game-log/{self.game.id}/feed/"
+
+    def details_seen_by(self, user, log: GameLog) -> dict:
+        self.client.force_authenticate(user=user)
+        logs = self.client.get(self.url).json()["logs"]
+        return next(entry["details"] for entry in logs if entry["id"] == log.id)
+
+    def test_rendered_when_written(self):
+        log = log_draw(self.game, self.cats, [self.card])
+        log.refresh_from_db()
+        self.assertEqual(log.rendered["text"], f"Drew 1 cards: {log.details['cards'][0]['title']}")
+        self.assertEqual(log.rendered_redacted, {"count": 1, "text": "Drew 1 cards"})
+
+        move = log_move(self.game, self.cats, 1, 5, 2)
+        move.refresh_from_db()
+        self.assertEqual(move.rendered["text"], "Moved 2 warriors to clearing 5")
+        self.assertIsNone(move.rendered_redacted)
+
+        ambush = log_ambush(self.game, self.cats, self.card)
+        ambush.refresh_from_db()
+        self.assertEqual(
+            ambush.rendered["text"], f"Cats played Ambush ({self.card.get_suit_display()})"
+        )
+
+    def test_hidden_details_per_viewer(self):
+        log = log_draw(self.game, self.cats, [self.card])
+        self.assertIn("cards", self.details_seen_by(self.cats.user, log))
+        self.assertNotIn("cards", self.details_seen_by(self.birds.user, log))
+        self.assertNotIn("cards", self.details_seen_by(UserFactory(), log))
+
+    def test_hidden_details_seen_from_every_seat_of_a_user(self):
+        self.birds.user = self.cats.user
+        self.birds.save()
+        log = log_draw(self.game, self.birds, [self.card])
+        self.assertIn("cards", self.details_seen_by(self.cats.user, log))
+
+    def test_outraged_player_sees_the_card(self):
+        log = log_wa_outrage(self.game, self.wa, self.cats, 1, False, False, "move")
+        # filled in once the card is given (transactions.wa.outrage)
+        log.details = {**log.details, "card_given": True, "card": CardSerializer(self.card).data}
+        log.save()
+        self.assertIn(self.card.title, self.details_seen_by(self.wa.user, log)["text"])
+        self.assertIn(self.card.title, self.details_seen_by(self.cats.user, log)["text"])
+        self.assertNotIn(self.card.title, self.details_seen_by(self.birds.user, log)["text"])
+
+    def test_edited_details_are_rendered_again(self):
+        log = log_turn(self.game, self.cats, 1)
+        log.details = {**log.details, "turn_number": 2}
+        log.save()
+        self.assertEqual(GameLog.objects.get(pk=log.pk).rendered["text"], "Turn 2")
+
+    def test_reading_does_no_rendering(self):
+        for _ in range(5):
+            log_draw(self.game, self.cats, [self.card])
+        self.client.force_authenticate(user=self.birds.user)
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+        for _ in range(20):
+            log_draw(self.game, self.cats, [self.card])
+        with patch(
+            "game.serializers.logs.main.render_details", side_effect=AssertionError
+        ), self.assertNumQueries(3):
+            self.client.get(self.url)
+
+    def test_unrendered_logs_render_when_read(self):
+        with self.assertLogs("game.serializers.logs.main", "WARNING"):
+            log = GameLog.objects.create(
+                game=self.game, log_type=LogType.MOVE, details={"warriors_moved": 1}
+            )
+        self.assertIsNone(log.rendered)
+        log.details = {**log.details, "origin_clearing_number": 1, "dest_clearing_number": 5}
+        GameLog.objects.filter(pk=log.pk).update(details=log.details)
+        self.assertEqual(
+            self.details_seen_by(self.cats.user, log)["text"],
+            "Moved 1 warriors to clearing 5",
+        )
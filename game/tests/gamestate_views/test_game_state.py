@@ -0,0 +1,75 @@
+from rest_framework import status
+from rest_framework.test import APITestCase
+from game.decorators.transaction_decorator import atomic_game_action
+from game.models.game_models import Clearing, Faction, Game, HandEntry
+from game.tests.my_factories import GameSetupWithFactionsFactory
+from game.transactions.general import move_warriors
+
+
+class GameStateEndpointTests(APITestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.birds = self.game.players.get(faction=Faction.BIRDS)
+        self.client.force_authenticate(user=self.cats.user)
+        self.url = f"/api/game/{self.game.id}/state/"
+
+    def test_snapshot_is_masked_for_viewer(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["viewer"], self.cats.id)
+        self.assertNotIn("deck", data)
+        self.assertEqual(len(data["clearings"]), 12)
+        players = {p["id"]: p for p in data["players"]}
+        self.assertEqual(
+            len(players[self.cats.id]["hand"]),
+            HandEntry.objects.filter(player=self.cats).count(),
+        )
+        self.assertNotIn("hand", players[self.birds.id])
+        self.assertEqual(
+            players[self.birds.id]["hand_size"],
+            HandEntry.objects.filter(player=self.birds).count(),
+        )
+
+    def test_unchanged_game_returns_304(self):
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(response.content)
+
+    def test_game_action_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        version = Game.objects.get(pk=self.game.pk).version
+
+        c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        atomic_game_action(move_warriors)(self.cats, c1, c5, 1)
+
+        self.assertGreater(Game.objects.get(pk=self.game.pk).version, version)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_undo_keeps_version_increasing(self):
+        c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        atomic_game_action(move_warriors)(self.cats, c1, c5, 1)
+        version = Game.objects.get(pk=self.game.pk).version
+
+        response = self.client.post(f"/api/game/undo/{self.game.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(Game.objects.get(pk=self.game.pk).version, version)
+
+    def test_stale_save_keeps_version(self):
+        stale = Game.objects.get(pk=self.game.pk)
+        etag = self.client.get(self.url)["ETag"]
+        Game.bump_version(self.game.pk)
+        version = Game.objects.get(pk=self.game.pk).version
+
+        stale.current_turn = 1
+        stale.save()
+        self.assertEqual(Game.objects.get(pk=self.game.pk).version, version)
+        self.assertNotEqual(self.client.get(self.url)["ETag"], etag)
@@ -0,0 +1,172 @@
+from unittest.mock import patch
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from game.errors import IllegalActionError
+from game.game_data.cards.exiles_and_partisans import CardsEP
+from game.models.cats.buildings import CatBuildingTypes
+from game.models.cats.turn import CatDaylight, CatTurn
+from game.models.events.setup import GameSimpleSetup
+from game.models.game_models import Clearing, Faction, Game, HandEntry
+from game.queries.cats.building import get_buildable_clearings
+from game.queries.general import validate_legal_move
+from game.tests.my_factories import (
+    CardFactory,
+    GameSetupWithFactionsFactory,
+    HandEntryFactory,
+    UserFactory,
+    WarriorFactory,
+)
+from game.transactions.general import create_turn
+
+
+class LegalActionsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.game = GameSetupWithFactionsFactory(
+            owner=self.user, factions=[Faction.CATS, Faction.BIRDS]
+        )
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.birds = self.game.players.get(faction=Faction.BIRDS)
+        if not CatTurn.objects.filter(player=self.cats, turn_number=0).exists():
+            create_turn(self.cats)
+        self.turn = CatDaylight.objects.get(turn__player=self.cats).turn
+        self.turn.birdsong.step = self.turn.birdsong.CatBirdsongSteps.COMPLETED
+        self.turn.birdsong.save()
+        self.set_daylight_step(CatDaylight.CatDaylightSteps.ACTIONS)
+        # a contested clearing to battle in and move out of
+        self.c2 = Clearing.objects.get(game=self.game, clearing_number=2)
+        WarriorFactory(player=self.birds, clearing=self.c2)
+        self.url = f"/api/game/legal-actions/{self.game.pk}/"
+
+    def set_daylight_step(self, step):
+        daylight = self.turn.daylight
+        daylight.step = step
+        daylight.actions_left = 3
+        daylight.save()
+        Game.bump_version(self.game.pk)
+
+    def test_cats_daylight_actions(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["route"], "/api/cats/daylight/actions/")
+        self.assertEqual(data["faction"], Faction.CATS)
+        actions = data["actions"]
+
+        # the same moves the validator accepts one by one
+        clearings = list(Clearing.objects.filter(game=self.game))
+        legal_moves = set()
+        for origin in clearings:
+            for destination in clearings:
+                try:
+                    validate_legal_move(self.cats, origin, destination)
+                except IllegalActionError:
+                    continue
+                legal_moves.add((origin.clearing_number, destination.clearing_number))
+        self.assertEqual(
+            {(move["origin"], move["destination"]) for move in actions["moves"]},
+            legal_moves,
+        )
+        self.assertIn({"clearing_number": 2, "defender": Faction.BIRDS}, actions["battles"])
+        self.assertEqual(
+            {(site["clearing_number"], site["building_type"]) for site in actions["build_sites"]},
+            {
+                (clearing.clearing_number, building_type.name)
+                for building_type in CatBuildingTypes
+                for clearing in get_buildable_clearings(self.cats, building_type)
+            },
+        )
+        # the recruiter placed in setup
+        self.assertEqual(actions["recruit_sites"], [9])
+        self.assertTrue(data["complete"])
+        self.assertEqual(data["not_enumerated"], [])
+
+    def set_up_hand(self):
+        HandEntry.objects.filter(player=self.cats).delete()
+        for card in (
+            CardsEP.TUNNELS,  # rabbit, like the workshop
+            CardsEP.SABOTEURS,  # wild
+            CardsEP.EYRIE_EMIGRE,  # two foxes
+            CardsEP.INVESTMENTS,  # two rabbits, one workshop
+            CardsEP.AMBUSH_RED,  # not craftable
+        ):
+            HandEntryFactory(
+                player=self.cats, card=CardFactory(game=self.game, card_type=card.name)
+            )
+
+    def test_craftable_cards(self):
+        self.set_daylight_step(CatDaylight.CatDaylightSteps.CRAFTING)
+        self.set_up_hand()
+
+        data = self.client.get(self.url).json()
+        self.assertEqual(data["route"], "/api/cats/daylight/craft/")
+        self.assertEqual(
+            set(data["actions"]["crafts"]),
+            {CardsEP.TUNNELS.name, CardsEP.SABOTEURS.name},
+        )
+
+    def test_cached_per_version(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        WarriorFactory(player=self.cats, clearing=self.c2)
+        Game.bump_version(self.game.pk)
+        self.assertIn(
+            {"origin": 2, "destination": 5, "max_count": 2},
+            self.client.get(self.url).json()["actions"]["moves"],
+        )
+
+    def test_craftable_cards_only_for_the_current_player(self):
+        self.set_daylight_step(CatDaylight.CatDaylightSteps.CRAFTING)
+        self.set_up_hand()
+        self.client.get(self.url)  # cached with the cards to craft
+
+        self.client.force_authenticate(user=self.birds.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["route"], "/api/cats/daylight/craft/")
+        self.assertNotIn("crafts", response.json()["actions"])
+
+    def test_steps_with_actions_not_enumerated(self):
+        expected = {
+            "wa-daylight": ["mobilize", "train"],
+            "wa-operations": ["recruit", "organize"],
+            "crows-daylight": ["plot", "trick"],
+            "moles-daylight-actions": ["dig", "recruit", "build"],
+        }
+        for url_name, not_enumerated in expected.items():
+            with self.subTest(step=url_name):
+                cache.clear()
+                with patch(
+                    "game.queries.legal_actions.get_current_turn_action",
+                    return_value=reverse(url_name),
+                ):
+                    data = self.client.get(self.url).json()
+                self.assertFalse(data["complete"])
+                self.assertEqual(data["not_enumerated"], not_enumerated)
+                self.assertNotIn("build_sites", data["actions"])
+                self.assertNotIn("recruit_sites", data["actions"])
+
+    def test_step_without_enumeration(self):
+        with patch(
+            "game.queries.legal_actions.get_current_turn_action",
+            return_value=reverse("moles-daylight-dig"),
+        ):
+            data = self.client.get(self.url).json()
+        self.assertEqual(data["actions"], {})
+        self.assertFalse(data["complete"])
+
+    def test_no_current_action(self):
+        with patch("game.queries.legal_actions.get_current_turn_action", return_value=None):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 400)
+
+    def test_game_without_setup(self):
+        GameSimpleSetup.objects.filter(game=self.game).delete()
+        Game.bump_version(self.game.pk)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from game.utils import metrics
+
+
+class QueryBudgetMixin:
+    """
+    Mixin for Django TestCase to assert how many queries an endpoint or game transaction runs.
+    Names are the ones used by the metrics endpoint: "GET /api/game/<int:game_id>/state/"
+    for endpoints, the full transaction name (game.transactions.general.move_warriors) otherwise.
+    """
+
+    @contextmanager
+    def assertQueryBudget(self, name, max_queries, kind=metrics.ENDPOINT):
+        """asserts every call of name inside the block ran at most max_queries queries"""
+        metrics.reset_metrics()
+        yield
+        stats = metrics.get_metrics(kind, name)
+        self.assertIsNotNone(stats, f"{kind} {name} was not called")
+        self.assertLessEqual(
+            stats.max_queries,
+            max_queries,
+            f"{kind} {name} ran {stats.max_queries} queries, budget is {max_queries}",
+        )
@@ -0,0 +1,34 @@
+import re
+from django.db.models import Model, QuerySet
+
+
+class QueryPlanMixin:
+    """
+    Mixin for Django TestCase to assert how SQLite runs a query, from EXPLAIN QUERY PLAN.
+    A plan line is either a SCAN (reads the whole table or index) or a SEARCH (an index lookup).
+    """
+
+    def query_plan(self, queryset: QuerySet) -> list[str]:
+        return queryset.explain().splitlines()
+
+    def assertSearches(self, queryset: QuerySet, model: type[Model], index: str | None = None):
+        """asserts the query looks up model's table by an index (index, if given) and never scans it"""
+        plan = self.query_plan(queryset)
+        table = re.escape(model._meta.db_table)
+        scans = [line for line in plan if re.search(rf"\bSCAN {table}\b", line)]
+        self.assertFalse(scans, f"{model.__name__} is scanned:\n" + "\n".join(plan))
+        searches = [line for line in plan if re.search(rf"\bSEARCH {table}\b", line)]
+        self.assertTrue(searches, f"{model.__name__} is not searched:\n" + "\n".join(plan))
+        if index is not None:
+            self.assertTrue(
+                any(index in line for line in searches),
+                f"{model.__name__} is not searched by {index}:\n" + "\n".join(plan),
+            )
+
+    def assertNoSort(self, queryset: QuerySet):
+        """asserts the rows come out of an index in order, without sorting them"""
+        plan = self.query_plan(queryset)
+        self.assertFalse(
+            [line for line in plan if "TEMP B-TREE" in line],
+            "query sorts its rows:\n" + "\n".join(plan),
+        )
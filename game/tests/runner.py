@@ -22,3 +22,10 @@ class RootTestRunner(DiscoverRunner):
         # Propagate to the logging mixin's global state
         from game.tests.logging_mixin import set_cli_skip_logs
         set_cli_skip_logs(self.skip_logs)
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        from django.conf import settings
+
+        # updates are published in the test's thread, against the test database
+        settings.GAME_UPDATES_IN_BACKGROUND = False
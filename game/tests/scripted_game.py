@@ -0,0 +1,294 @@
+import itertools
+import random
+import time
+import traceback
+from collections import Counter, defaultdict
+from pathlib import Path
+from django.conf import settings
+from django.contrib.auth.models import User
+from rest_framework import status
+from game.models.enums import Suit
+from game.models.cats.buildings import CatBuildingTypes
+from game.models.game_models import Faction, Game, HandEntry, Player
+from game.tests.client import RootGameClient
+
+PASSWORD = "password"
+# where the frames views fail in are looked for
+_PROJECT_DIR = settings.BASE_DIR / "game"
+
+# values tried for payload types that come without options, besides the step's options
+_CLEARING_NUMBERS = list(range(1, 13))
+_NUMBERS = [1, 2, 3]
+
+
+class TimedGameClient(RootGameClient):
+    """
+    RootGameClient that records the wall time of every accepted request, per route,
+    and the exceptions raised by views
+    """
+
+    def __init__(
+        self,
+        *args,
+        timings: dict[str, list[float]],
+        exceptions: list[BaseException],
+        **kwargs,
+    ):
+        self.timings = timings
+        self.exceptions = exceptions
+        super().__init__(*args, **kwargs)
+        # views raising is a bug the benchmark reports, not a reason to stop the game
+        self.raise_request_exception = False
+
+    def request(self, **request):
+        start = time.perf_counter()
+        response = super().request(**request)
+        match = getattr(response, "resolver_match", None)
+        route = match.route if match is not None else request["PATH_INFO"]
+        if response.status_code < 400:
+            self.timings[f"{request['REQUEST_METHOD']} /{route}"].append(
+                time.perf_counter() - start
+            )
+        elif response.status_code >= 500 and response.exc_info:
+            # exc_info is set from a signal every client listens to,
+            # only trust it when this request failed
+            self.exceptions.append(response.exc_info[1])
+        return response
+
+
+class ScriptedGame:
+    """
+    Plays a game through the metadata-driven action flow, the way the frontend does:
+    ask for the current action, fill the step's payload, post it, repeat.
+    Payload values are picked from the step's options and the acting player's hand,
+    falling back to trying every clearing; the rng makes a run repeatable.
+    """
+
+    def __init__(
+        self,
+        factions: list[Faction],
+        seed: int = 0,
+        name: str = "bench",
+        max_attempts: int = 40,
+        max_retries: int = 10,
+        max_backtracks: int = 5,
+        undo_every: int = 25,
+    ):
+        self.factions = factions
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.name = name
+        self.max_attempts = max_attempts
+        self.max_retries = max_retries
+        self.max_backtracks = max_backtracks
+        self.undo_every = undo_every
+        self.timings: dict[str, list[float]] = defaultdict(list)
+        self.exceptions: list[BaseException] = []
+        self.actions = 0
+        self.rejected = 0
+        self.server_errors = 0
+        self.undos = 0
+        self.backtracks = 0
+        self.stuck = False
+        self.game_id: int | None = None
+        self.clients: dict[str, TimedGameClient] = {}
+        self.faction_by_label = {faction.label: faction.value for faction in factions}
+
+    def client(self, username: str) -> TimedGameClient:
+        return TimedGameClient(
+            username,
+            PASSWORD,
+            self.game_id or 0,
+            timings=self.timings,
+            exceptions=self.exceptions,
+        )
+
+    def set_up(self) -> None:
+        """creates the users and the game, joins, picks factions and starts it"""
+        usernames = [f"{self.name}-{i}" for i in range(len(self.factions))]
+        for username in usernames:
+            User.objects.create_user(username=username, password=PASSWORD)
+        owner = self.client(usernames[0])
+        response = owner.post(
+            "/api/game/create/",
+            data={
+                "map_label": Game.BoardMaps.AUTUMN,
+                "faction_options": [{"faction": f.value} for f in self.factions],
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.content
+        self.game_id = response.data["game_id"]
+        # same seed, same deck and dice: runs can be compared with each other
+        Game.objects.filter(pk=self.game_id).update(rng_seed=self.seed)
+        for username, faction in zip(usernames, self.factions):
+            client = self.client(username)
+            client.patch(f"/api/game/join/{self.game_id}/")
+            client.patch(
+                f"/api/game/pick-faction/{self.game_id}/", data={"faction": faction.value}
+            )
+            self.clients[faction.value] = client
+        owner.game_id = self.game_id
+        response = owner.patch(f"/api/game/start/{self.game_id}/")
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.content
+
+    def play(self, max_actions: int) -> None:
+        """posts actions until max_actions were accepted or no action can be completed"""
+        retries = 0
+        while self.actions < max_actions:
+            client = next(iter(self.clients.values()))
+            errors = len(self.exceptions)
+            try:
+                client.get_action()
+            except Exception:
+                if len(self.exceptions) > errors and retries < self.max_retries:
+                    # the view failed (e.g. database locked under load): ask again
+                    self.server_errors += 1
+                    retries += 1
+                    continue
+                self.stuck = True  # no current action (game over, or unimplemented)
+                return
+            if not self.complete_step(client.base_route, client.step, wrap_up=retries > 0):
+                # a dead end (e.g. battle clearing without defenders): start the action over,
+                # the shuffled candidates lead somewhere else next time
+                retries += 1
+                if retries > self.max_retries:
+                    # back out of the position the way a player would, at most a few times
+                    if self.backtracks >= self.max_backtracks or not self.undo():
+                        self.stuck = True
+                        return
+                    self.backtracks += 1
+                    retries = 0
+                continue
+            retries = 0
+            if self.undo_every and self.actions % self.undo_every == 0:
+                self.undo()
+
+    def undo(self) -> bool:
+        client = next(iter(self.clients.values()))
+        response = client.post(f"/api/game/undo/{self.game_id}/")
+        if response.status_code != status.HTTP_200_OK:
+            return False
+        self.undos += 1
+        return True
+
+    def complete_step(self, base_route: str, step: dict, wrap_up: bool = False) -> bool:
+        """
+        fills and posts steps until the action is completed; False if stuck.
+        wrap_up tries the options ending a step ("Done", "Skip") first.
+        """
+        while step.get("payload_details"):
+            for client in self.acting_clients(step):
+                client.base_route = base_route
+                client.step = step
+                response = self.try_payloads(client, step, wrap_up)
+                if response is not None:
+                    break
+            else:
+                return False
+            self.actions += 1
+            step = client.step
+            base_route = client.base_route
+            if step.get("name") == "completed":
+                return True
+        return True
+
+    def acting_clients(self, step: dict) -> list[TimedGameClient]:
+        """the client of the faction the step is for first, then everyone else"""
+        faction = step.get("faction")
+        if isinstance(faction, dict):  # serialized with its label
+            faction = self.faction_by_label.get(faction.get("value"))
+        if faction is None:
+            game = Game.objects.get(pk=self.game_id)
+            faction = (
+                Player.objects.filter(game=game, turn_order=game.current_turn)
+                .values_list("faction", flat=True)
+                .first()
+            )
+        first = self.clients.get(faction)
+        return [first] * (first is not None) + [
+            c for c in self.clients.values() if c is not first
+        ]
+
+    def try_payloads(self, client: TimedGameClient, step: dict, wrap_up: bool):
+        payloads = self.payloads(client, step, wrap_up)
+        for data in itertools.islice(payloads, self.max_attempts):
+            to_send = dict(step.get("accumulated_payload") or {})
+            for detail in step["payload_details"]:
+                to_send[detail["name"]] = data[detail["name"]]
+            response = client.post_action(to_send)
+            if client.ok(response):
+                return response
+            client.step = step
+            if response.status_code >= 500:
+                self.server_errors += 1
+            else:
+                self.rejected += 1
+        return None
+
+    def payloads(self, client: TimedGameClient, step: dict, wrap_up: bool):
+        """candidate payloads for the step, in a shuffled but repeatable order"""
+        candidates = []
+        for detail in step["payload_details"]:
+            values = self.candidates(client, step, detail["type"])
+            self.rng.shuffle(values)
+            if wrap_up:
+                values.sort(key=lambda value: value not in ("", False))
+            candidates.append([(detail["name"], value) for value in values])
+        for combination in itertools.product(*candidates):
+            yield dict(combination)
+
+    def candidates(self, client: TimedGameClient, step: dict, payload_type: str) -> list:
+        options = [option["value"] for option in step.get("options") or []]
+        match payload_type:
+            case "clearing_number":
+                return options or list(_CLEARING_NUMBERS)
+            case "card":
+                hand = HandEntry.objects.filter(
+                    player__game_id=self.game_id, player__user__username=client.user
+                ).values_list("card__card_type", flat=True)
+                return options + list(hand)
+            case "faction":
+                return options or list(self.clients)
+            case "number":
+                return options or list(_NUMBERS)
+            case "confirm":
+                return [True]
+            case "building_type":
+                return options or [t.name for t in CatBuildingTypes]
+            case "suit":
+                return options or [s.name for s in Suit]
+            case _:
+                return options
+
+    @property
+    def completed(self) -> bool:
+        """True if the game played all its actions without a server error"""
+        return not self.stuck and not self.server_errors
+
+    def errors(self) -> dict[str, int]:
+        """the exceptions views raised, by type, message and where (innermost frame)"""
+        errors = Counter()
+        for exception in self.exceptions:
+            frames = traceback.extract_tb(exception.__traceback__)
+            # the innermost frame of the project's code, not of Django's
+            ours = [frame for frame in frames if _PROJECT_DIR in Path(frame.filename).parents]
+            where = ""
+            if ours or frames:
+                frame = (ours or frames)[-1]
+                path = Path(frame.filename)
+                if _PROJECT_DIR in path.parents:
+                    path = path.relative_to(settings.BASE_DIR)
+                where = f" at {path}:{frame.lineno} in {frame.name}"
+            errors[f"{type(exception).__name__}({exception}){where}"] += 1
+        return dict(errors.most_common())
+
+    def report(self) -> dict:
+        return {
+            "actions": self.actions,
+            "rejected": self.rejected,
+            "server_errors": self.server_errors,
+            "undos": self.undos,
+            "backtracks": self.backtracks,
+            "stuck": self.stuck,
+        }
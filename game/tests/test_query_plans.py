@@ -0,0 +1,101 @@
+from unittest import skipUnless
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.utils import timezone
+from game.models import Building, Token, Warrior
+from game.models.birds.turn import BirdTurn
+from game.models.cats.turn import CatTurn
+from game.models.checkpoint_models import Action, Checkpoint
+from game.models.crows.turn import CrowTurn
+from game.models.events.event import Event
+from game.models.game_log import GameLog, LogType
+from game.models.game_models import Clearing, Faction, HandEntry
+from game.models.moles.turn import MoleTurn
+from game.models.wa.turn import WATurn
+from game.tests.my_factories import GameSetupWithFactionsFactory
+from game.tests.query_plan import QueryPlanMixin
+
+
+def index_name(model, *fields) -> str:
+    return next(index.name for index in model._meta.indexes if index.fields == list(fields))
+
+
+@skipUnless(connection.vendor == "sqlite", "plans are read from SQLite's EXPLAIN QUERY PLAN")
+class HotQueryPlanTests(TestCase, QueryPlanMixin):
+    """the queries run on every action look rows up by index, however big the tables get"""
+
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.player = self.game.players.get(faction=Faction.CATS)
+        self.clearing = Clearing.objects.get(game=self.game, clearing_number=1)
+
+    def test_pieces_in_clearing(self):
+        self.assertSearches(
+            Warrior.objects.filter(clearing=self.clearing, player=self.player), Warrior
+        )
+        self.assertSearches(
+            Token.objects.filter(clearing=self.clearing, player=self.player), Token
+        )
+        self.assertSearches(
+            Building.objects.filter(
+                building_slot__clearing=self.clearing, player=self.player
+            ),
+            Building,
+        )
+
+    def test_current_event(self):
+        # get_current_event
+        queryset = Event.objects.filter(game=self.game, is_resolved=False).order_by(
+            "-created_at", "-id"
+        )
+        self.assertSearches(queryset, Event, "unresolved_event_stack")
+        self.assertNoSort(queryset)
+
+    def test_game_logs(self):
+        queryset = GameLog.objects.filter(game=self.game)
+        self.assertSearches(queryset, GameLog, index_name(GameLog, "game", "created_at"))
+        self.assertNoSort(queryset)
+        # get_current_turn_log
+        queryset = GameLog.objects.filter(
+            game=self.game, player=self.player, log_type=LogType.TURN
+        ).order_by("-created_at")
+        self.assertSearches(
+            queryset,
+            GameLog,
+            index_name(GameLog, "game", "player", "log_type", "created_at"),
+        )
+        self.assertNoSort(queryset)
+
+    def test_game_log_feed(self):
+        # get_log_feed past a cursor
+        queryset = GameLog.objects.filter(
+            Q(game=self.game, pk__gt=1) | Q(game=self.game, updated_at__gte=timezone.now())
+        )
+        self.assertSearches(queryset, GameLog, index_name(GameLog, "game", "updated_at"))
+
+    def test_latest_checkpoint_and_its_actions(self):
+        queryset = Checkpoint.objects.filter(game=self.game).order_by("-id")
+        # the foreign key index on game ends in the rowid, so already sorts by id
+        self.assertSearches(queryset, Checkpoint)
+        self.assertNoSort(queryset)
+        queryset = Action.objects.filter(checkpoint_id=1).order_by("action_number")
+        self.assertSearches(queryset, Action)
+        self.assertNoSort(queryset)
+
+    def test_hand(self):
+        self.assertSearches(
+            HandEntry.objects.filter(player=self.player).values_list(
+                "card__card_type", flat=True
+            ),
+            HandEntry,
+            index_name(HandEntry, "player", "card"),
+        )
+
+    def test_current_turn(self):
+        for model in (CatTurn, BirdTurn, WATurn, CrowTurn, MoleTurn):
+            with self.subTest(model=model.__name__):
+                # get_turn
+                queryset = model.objects.filter(player=self.player).order_by("-turn_number")
+                self.assertSearches(queryset, model, index_name(model, "player", "turn_number"))
+                self.assertNoSort(queryset)
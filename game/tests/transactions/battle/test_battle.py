@@ -438,6 +438,29 @@ class BattleTransactionTests(TestCase):
         )
         self.assertEqual(battle.step, Battle.BattleSteps.COMPLETED)
 
+    @patch("game.transactions.battle.randint")
+    def test_attacker_ambush_no_counter_1_warrior_nothing_left_ends_battle(
+        self, mock_randint
+    ):
+        mock_randint.side_effect = [0, 0]
+        WarriorFactory.create_batch(1, player=self.cats, clearing=self.c1)
+        WarriorFactory.create_batch(2, player=self.birds, clearing=self.c1)
+
+        ambush_red = CardFactory(game=self.game, card_type=CardsEP.AMBUSH_RED.name)
+        HandEntry.objects.create(player=self.birds, card=ambush_red)
+
+        start_battle(self.game, Faction.CATS, Faction.BIRDS, self.c1)
+        battle = Battle.objects.get(clearing=self.c1)
+        defender_ambush_choice(self.game, battle, CardsEP.AMBUSH_RED)
+
+        attacker_ambush_choice(self.game, battle, None)
+        battle.refresh_from_db()
+
+        self.assertEqual(
+            Warrior.objects.filter(player=self.cats, clearing=self.c1).count(), 0
+        )
+        self.assertEqual(battle.step, Battle.BattleSteps.COMPLETED)
+
     @patch("game.transactions.battle.randint")
     def test_attacker_ambush_no_counter_losses_1_warrior_and_chooses(
         self, mock_randint
@@ -1,10 +1,10 @@
 from django.test import TestCase
-from game.models.game_models import Faction, Clearing, Warrior, HandEntry, Suit
+from game.models.game_models import Faction, Clearing, Warrior, HandEntry, Suit, BuildingSlot
 from game.models.birds.buildings import BirdRoost
 from game.models.birds.player import BirdLeader, DecreeEntry, Vizier
 from game.models.birds.turn import BirdTurn, BirdBirdsong
 from game.tests.my_factories import GameSetupFactory, CardFactory, HandEntryFactory
-from game.transactions.birds import emergency_draw, add_card_to_decree, end_add_to_decree_step, emergency_roost, try_auto_emergency_roost
+from game.transactions.birds import emergency_draw, add_card_to_decree, end_add_to_decree_step, emergency_roost, try_auto_emergency_roost, place_roost
 from game.tests.logging_mixin import LoggingTestMixin
 from game.models.game_log import LogType
 from game.game_data.cards.exiles_and_partisans import CardsEP
@@ -166,3 +166,18 @@ class BirdEmergencyRoostTests(BirdBirdsongBaseTestCase):
         self.assertTrue(BirdRoost.objects.filter(player=self.player, building_slot__clearing=c10).exists())
         self.birdsong.refresh_from_db()
         self.assertEqual(self.birdsong.step, BirdBirdsong.BirdBirdsongSteps.COMPLETED)
+
+
+class BirdPlaceRoostTests(BirdBirdsongBaseTestCase):
+    def test_place_roost_fails_clearing_has_roost(self):
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        # room for a second roost, so that only the rule refuses it
+        for number in range(2):
+            BuildingSlot.objects.create(clearing=c5, building_slot_number=100 + number)
+        place_roost(self.player, c5)
+
+        with self.assertRaises(IllegalActionError):
+            place_roost(self.player, c5)
+        self.assertEqual(
+            BirdRoost.objects.filter(player=self.player, building_slot__clearing=c5).count(), 1
+        )
@@ -18,6 +18,7 @@ from game.tests.my_factories import (
     GameFactory,
     PlayerFactory,
     CardFactory,
+    WarriorFactory,
     HandEntryFactory,
     GameSetupWithFactionsFactory,
 )
@@ -299,8 +300,11 @@ class BirdDecreeMoveTests(BirdDaylightBaseTestCase):
         Vizier.objects.filter(player=self.player, column=Vizier.Column.MOVE).delete()
         
         # Warriors are in Rabbit clearing but can't move (no adjacency or no rule)
-        # remove all connections for the clearing
-        self.clearing3.connected_clearings.clear()
+        # cats outnumber the birds here and in every adjacent clearing
+        from game.queries.general import get_connected_clearings
+
+        for clearing in [self.clearing3, *get_connected_clearings(self.clearing3)]:
+            WarriorFactory.create_batch(10, player=self.cats_player, clearing=clearing)
         
         from game.transactions.birds import move_turmoil_check
         move_turmoil_check(self.player)
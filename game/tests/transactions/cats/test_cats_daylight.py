@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from game.errors import UnavailableActionError, IllegalActionError, InternalGameError
 from game.models.game_models import (
     Faction,
@@ -8,6 +10,11 @@ from game.models.game_models import (
     HandEntry,
     Building,
 )
+from game.queries.board_state import board_state_cache, get_board_state
+from game.queries.cats.building import (
+    get_buildable_clearings,
+    get_usable_wood_for_building,
+)
 from game.queries.general import determine_clearing_rule
 from game.models.cats.buildings import Recruiter, Sawmill, Workshop, CatBuildingTypes
 from game.models.cats.tokens import CatWood
@@ -225,6 +232,40 @@ class CatBuildTests(CatBaseTestCase):
         with self.assertRaises(IllegalActionError):
             cat_build(self.player, CatBuildingTypes.SAWMILL, c2, [wood])
 
+    def test_wood_only_counts_in_ruled_island(self):
+        c2 = Clearing.objects.get(game=self.game, clearing_number=2)
+        c10 = Clearing.objects.get(game=self.game, clearing_number=10)
+        WarriorFactory.create_batch(3, player=self.birds_player, clearing=c10)
+        wood_before = CatWood.objects.filter(clearing__isnull=False).count()
+        CatWoodFactory(player=self.player, clearing=self.c1)
+        CatWoodFactory(player=self.player, clearing=c2)
+
+        board_state = get_board_state(self.game)
+        self.assertEqual(board_state.ruled_component(self.player, self.c1), board_state.ruled_component(self.player, self.c5))
+        self.assertNotIn(c10.pk, board_state.ruled_component(self.player, self.c1))
+        self.assertEqual(board_state.connected_wood(self.player, self.c9), wood_before + 2)
+        self.assertEqual(board_state.connected_wood(self.player, c10), 0)
+        self.assertIsNone(
+            get_usable_wood_for_building(self.player, CatBuildingTypes.SAWMILL, c10)
+        )
+        self.assertEqual(
+            len(get_usable_wood_for_building(self.player, CatBuildingTypes.SAWMILL, c2)),
+            wood_before + 2,
+        )
+
+    def test_buildable_clearings_reuse_board_state(self):
+        CatWoodFactory(player=self.player, clearing=self.c1)
+        with board_state_cache(), CaptureQueriesContext(connection) as ctx:
+            buildable = get_buildable_clearings(self.player, CatBuildingTypes.WORKSHOP)
+            first = len(ctx.captured_queries)
+            for clearing in buildable:
+                get_usable_wood_for_building(self.player, CatBuildingTypes.WORKSHOP, clearing)
+        self.assertTrue(buildable)
+        for clearing in buildable:
+            self.assertEqual(determine_clearing_rule(clearing), self.player)
+        # only the wood tokens themselves are loaded per clearing (plus the cost lookup)
+        self.assertLessEqual(len(ctx.captured_queries) - first, 2 * len(buildable))
+
 
 class CatOverworkTests(CatBaseTestCase):
     def test_overwork_success(self):
@@ -49,9 +49,8 @@ class TestLeagueOfAdventurersTransaction(TestCase):
     def test_use_league_of_adventurers_move_success(self):
         # Setup clearings and warriors
         clearing1 = Clearing.objects.get(game=self.game, clearing_number=1)
-        clearing2 = Clearing.objects.get(game=self.game, clearing_number=2)
-        # Ensure they are adjacent (Autumn map 1-2 is adjacent)
-        clearing1.connected_clearings.add(clearing2)
+        # 1 and 5 are adjacent on the Autumn map
+        clearing2 = Clearing.objects.get(game=self.game, clearing_number=5)
 
         WarriorFactory.create_batch(3, player=self.player, clearing=clearing1)
 
@@ -115,8 +114,8 @@ class TestLeagueOfAdventurersTransaction(TestCase):
         self.crafted_item.save()
 
         clearing1 = Clearing.objects.get(game=self.game, clearing_number=1)
-        clearing2 = Clearing.objects.get(game=self.game, clearing_number=2)
-        clearing1.connected_clearings.add(clearing2)
+        # 1 and 5 are adjacent on the Autumn map
+        clearing2 = Clearing.objects.get(game=self.game, clearing_number=5)
         WarriorFactory.create_batch(1, player=self.player, clearing=clearing1)
 
         move_data = {
@@ -142,8 +141,8 @@ class TestLeagueOfAdventurersTransaction(TestCase):
         )
 
         clearing1 = Clearing.objects.get(game=self.game, clearing_number=1)
-        clearing2 = Clearing.objects.get(game=self.game, clearing_number=2)
-        clearing1.connected_clearings.add(clearing2)
+        # 1 and 5 are adjacent on the Autumn map
+        clearing2 = Clearing.objects.get(game=self.game, clearing_number=5)
         WarriorFactory.create_batch(1, player=self.player, clearing=clearing1)
 
         move_data = {
@@ -28,9 +28,8 @@ class CrowDaylightTestCase(TestCase):
         self.daylight.save()
 
         self.c1 = Clearing.objects.get(game=self.game, clearing_number=1)
-        self.c2 = Clearing.objects.get(game=self.game, clearing_number=2)
-        self.c1.connected_clearings.add(self.c2)
-        self.c2.connected_clearings.add(self.c1)
+        # 1 and 5 are adjacent on the Autumn map
+        self.c2 = Clearing.objects.get(game=self.game, clearing_number=5)
         c1_ids = list(
             Warrior.objects.filter(player=self.player).values_list("id", flat=True)[:5]
         )
@@ -0,0 +1,115 @@
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from game.models.game_models import Building, Faction, Clearing, Token, Warrior
+from game.queries.board_state import (
+    BoardState,
+    board_state_cache,
+    get_board_state,
+)
+from game.queries.general import (
+    count_player_pieces_in_clearing,
+    determine_clearing_rule,
+    get_enemy_factions_in_clearing,
+    player_has_pieces_in_clearing,
+    player_has_warriors_in_clearing,
+    warrior_count_in_clearing,
+)
+from game.tests.my_factories import GameSetupWithFactionsFactory, WarriorFactory
+from game.transactions.general import move_warriors
+
+
+class BoardStateTests(TestCase):
+    def setUp(self):
+        # Autumn Map: Cats in 1 (Keep), Birds in 3 (Roost), WA empty
+        self.game = GameSetupWithFactionsFactory(
+            factions=[Faction.CATS, Faction.BIRDS, Faction.WOODLAND_ALLIANCE]
+        )
+        self.player_cats = self.game.players.get(faction=Faction.CATS)
+        self.player_birds = self.game.players.get(faction=Faction.BIRDS)
+        self.player_wa = self.game.players.get(faction=Faction.WOODLAND_ALLIANCE)
+        self.c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        self.c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+
+    def test_matches_database_counts(self):
+        board_state = BoardState(self.game.pk)
+        for clearing in Clearing.objects.filter(game=self.game):
+            for player in (self.player_cats, self.player_birds, self.player_wa):
+                self.assertEqual(
+                    board_state.warrior_count(player, clearing),
+                    Warrior.objects.filter(player=player, clearing=clearing).count(),
+                )
+        self.assertEqual(
+            board_state.warrior_count(self.player_cats, None),
+            Warrior.objects.filter(player=self.player_cats, clearing=None).count(),
+        )
+
+    def test_birds_rule_ties(self):
+        Warrior.objects.filter(clearing=self.c5).delete()
+        Building.objects.filter(building_slot__clearing=self.c5).delete()
+        Token.objects.filter(clearing=self.c5).delete()
+        WarriorFactory(player=self.player_cats, clearing=self.c5)
+        WarriorFactory(player=self.player_wa, clearing=self.c5)
+        self.assertIsNone(determine_clearing_rule(self.c5))
+
+        WarriorFactory(player=self.player_birds, clearing=self.c5)
+        self.assertEqual(determine_clearing_rule(self.c5), self.player_birds)
+
+    def test_loads_once_per_cache(self):
+        with board_state_cache():
+            first = get_board_state(self.game)
+            with CaptureQueriesContext(connection) as ctx:
+                for clearing in Clearing.objects.filter(game=self.game):
+                    determine_clearing_rule(clearing)
+                    get_enemy_factions_in_clearing(self.player_cats, clearing)
+            self.assertIs(get_board_state(self.game), first)
+        # only the clearing list itself is queried
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def answers(self) -> list:
+        return [
+            (
+                determine_clearing_rule(clearing),
+                sorted(get_enemy_factions_in_clearing(player, clearing)),
+                player_has_warriors_in_clearing(player, clearing),
+                warrior_count_in_clearing(player, clearing),
+                player_has_pieces_in_clearing(player, clearing),
+                count_player_pieces_in_clearing(player, clearing),
+            )
+            for clearing in Clearing.objects.filter(game=self.game)
+            for player in (self.player_cats, self.player_birds, self.player_wa)
+        ]
+
+    def test_single_queries_outside_cache(self):
+        with board_state_cache():
+            cached = self.answers()
+        self.assertEqual(self.answers(), cached)
+
+        # one question does not load the board
+        with self.assertNumQueries(1):
+            player_has_warriors_in_clearing(self.player_cats, self.c1)
+        with self.assertNumQueries(1):
+            get_enemy_factions_in_clearing(self.player_cats, self.c1)
+
+    def test_bulk_update_invalidates(self):
+        with board_state_cache():
+            before = warrior_count_in_clearing(self.player_cats, self.c5)
+            move_warriors(self.player_cats, self.c1, self.c5, 1)
+            self.assertEqual(
+                warrior_count_in_clearing(self.player_cats, self.c5), before + 1
+            )
+
+    def test_rolled_back_state_not_reused(self):
+        with board_state_cache():
+            before = warrior_count_in_clearing(self.player_cats, self.c5)
+            try:
+                with transaction.atomic():
+                    move_warriors(self.player_cats, self.c1, self.c5, 1)
+                    self.assertEqual(
+                        warrior_count_in_clearing(self.player_cats, self.c5),
+                        before + 1,
+                    )
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.assertEqual(warrior_count_in_clearing(self.player_cats, self.c5), before)
@@ -0,0 +1,44 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from game.game_data.general.maps import AUTUMN_MAP
+from game.models.game_models import Clearing, Faction
+from game.queries.board_state import board_state_cache
+from game.queries.general import get_adjacent_clearings, validate_legal_move
+from game.tests.my_factories import GameSetupWithFactionsFactory
+
+
+class MapGraphTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.player_cats = self.game.players.get(faction=Faction.CATS)
+
+    def test_matches_map_setup(self):
+        for clearing in Clearing.objects.filter(game=self.game):
+            number = clearing.clearing_number
+            self.assertEqual(
+                {c.clearing_number for c in clearing.connected_clearings.all()},
+                AUTUMN_MAP.adjacent(number),
+            )
+            self.assertEqual(
+                {c.clearing_number for c in clearing.water_connected_clearings.all()},
+                AUTUMN_MAP.river_adjacent(number),
+            )
+
+    def test_adjacency_is_symmetric(self):
+        for number, adjacent in AUTUMN_MAP.paths.items():
+            for other in adjacent:
+                self.assertIn(number, AUTUMN_MAP.adjacent(other))
+
+    def test_move_validation_skips_adjacency_tables(self):
+        c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        with board_state_cache(), CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(
+                {c.clearing_number for c in get_adjacent_clearings(self.player_cats, c1)},
+                {5, 9, 10},
+            )
+            validate_legal_move(self.player_cats, c1, c5)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if "connected_clearings" in q["sql"]]
+        )
@@ -0,0 +1,79 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from game.models.birds.turn import BirdBirdsong, BirdDaylight
+from game.models.events.event import Event, EventType
+from game.models.game_models import Faction, Game
+from game.queries.birds.turn import get_phase, validate_turn
+from game.queries.board_state import board_state_cache
+from game.queries.current_action.events import get_current_event
+from game.queries.general import (
+    get_current_phase,
+    get_current_player,
+    get_current_turn_number,
+)
+from game.queries.turn_context import get_turn_context
+from game.tests.my_factories import GameSetupWithFactionsFactory
+from game.transactions.general import create_turn
+
+
+class TurnContextTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.birds = self.game.players.get(faction=Faction.BIRDS)
+        self.game.current_turn = self.birds.turn_order
+        self.game.save()
+        create_turn(self.birds)
+        self.birds = self.game.players.get(faction=Faction.BIRDS)
+
+    def resolve_everything(self):
+        player = get_current_player(self.game)
+        validate_turn(player)
+        get_phase(player)
+        get_current_phase(player)
+        get_current_turn_number(self.game)
+        get_current_event(self.game)
+
+    def test_resolved_once_per_cache(self):
+        with board_state_cache():
+            with CaptureQueriesContext(connection) as ctx:
+                self.resolve_everything()
+            # player (with game), turn, three phases and the event
+            self.assertEqual(len(ctx.captured_queries), 6)
+            with self.assertNumQueries(0):
+                for _ in range(3):
+                    self.resolve_everything()
+
+    def test_cats_phases_come_with_the_turn(self):
+        self.game.current_turn = self.cats.turn_order
+        self.game.save()
+        with board_state_cache():
+            context = get_turn_context(self.game)
+            context.player
+            with self.assertNumQueries(1):
+                context.phases
+
+    def test_step_change_invalidates(self):
+        with board_state_cache():
+            self.assertIsInstance(get_phase(self.birds), BirdBirdsong)
+            birdsong = BirdBirdsong.objects.get(turn=validate_turn(self.birds))
+            birdsong.step = BirdBirdsong.BirdBirdsongSteps.COMPLETED
+            birdsong.save()
+            self.assertIsInstance(get_phase(self.birds), BirdDaylight)
+
+    def test_new_event_invalidates(self):
+        with board_state_cache():
+            self.assertIsNone(get_current_event(self.game))
+            event = Event.objects.create(game=self.game, type=EventType.BATTLE)
+            self.assertEqual(get_current_event(self.game), event)
+
+    def test_unsaved_change_of_turn(self):
+        with board_state_cache():
+            self.assertEqual(get_current_player(self.game), self.birds)
+            game = Game.objects.get(pk=self.game.pk)
+            game.current_turn = self.cats.turn_order
+            self.assertEqual(get_current_player(game), self.cats)
+
+    def test_not_shared_outside_a_cache(self):
+        self.assertIsNot(get_turn_context(self.game), get_turn_context(self.game))
@@ -14,6 +14,7 @@ from game.models import (
     Suit,
     DiscardPileEntry
 )
+from game.game_data.cards.exiles_and_partisans import CardsEP
 from game.models.wa.buildings import WABase
 from game.models.wa.player import SupporterStackEntry, OfficerEntry
 from game.models.wa.tokens import WASympathy
@@ -32,6 +33,7 @@ from game.transactions.wa import (
     end_evening_operations,
     draw_cards,
     check_discard_step,
+    discard_card,
     end_turn
 )
 from game.transactions.general import create_turn
@@ -233,6 +235,38 @@ class WAEveningTransitionTests(WAEveningBaseTestCase):
         self.evening.refresh_from_db()
         self.assertEqual(self.evening.step, WAEvening.WAEveningSteps.DISCARDING)
 
+    def test_discard_card_until_hand_limit(self):
+        self.evening.step = WAEvening.WAEveningSteps.DISCARDING
+        self.evening.save()
+
+        HandEntry.objects.filter(player=self.player).delete()
+        entries = [HandEntryFactory(player=self.player) for _ in range(7)]
+
+        discard_card(self.player, CardsEP[entries[0].card.card_type])
+        self.evening.refresh_from_db()
+        self.assertEqual(self.evening.step, WAEvening.WAEveningSteps.DISCARDING)
+        self.assertEqual(get_player_hand_size(self.player), 6)
+        self.assertTrue(
+            DiscardPileEntry.objects.filter(card=entries[0].card).exists()
+        )
+        self.assertLogExists(LogType.DISCARD, player=self.player)
+
+        discard_card(self.player, CardsEP[entries[1].card.card_type])
+        self.evening.refresh_from_db()
+        self.assertNotEqual(self.evening.step, WAEvening.WAEveningSteps.DISCARDING)
+        self.assertEqual(get_player_hand_size(self.player), 5)
+
+    def test_discard_card_fails_at_hand_limit(self):
+        self.evening.step = WAEvening.WAEveningSteps.DISCARDING
+        self.evening.save()
+
+        HandEntry.objects.filter(player=self.player).delete()
+        entries = [HandEntryFactory(player=self.player) for _ in range(5)]
+
+        with self.assertRaises(IllegalActionError):
+            discard_card(self.player, CardsEP[entries[0].card.card_type])
+        self.assertEqual(get_player_hand_size(self.player), 5)
+
     def test_end_turn_resets_components(self):
         self.evening.step = WAEvening.WAEveningSteps.COMPLETED
         self.evening.save()
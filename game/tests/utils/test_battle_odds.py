@@ -0,0 +1,110 @@
+from dataclasses import asdict
+from django.test import TestCase
+from rest_framework.test import APITestCase
+from game.logic.battle_odds import BattleScenario, battle_odds
+from game.models.game_models import Clearing, Faction, Warrior
+from game.tests.my_factories import (
+    GameSetupWithFactionsFactory,
+    UserFactory,
+    WarriorFactory,
+)
+
+
+class BattleOddsTests(TestCase):
+    def test_even_battle(self):
+        odds = battle_odds(BattleScenario(attacker_warriors=3, defender_warriors=3))
+        # the higher of two 0-3 dice averages 34/16, the lower 14/16
+        self.assertAlmostEqual(odds.defender_hits, 34 / 16)
+        self.assertAlmostEqual(odds.attacker_hits, 14 / 16)
+        # a 3 on either die wipes the defender, only a 3-3 roll the attacker
+        self.assertAlmostEqual(odds.defender_warriors_wiped, 7 / 16)
+        self.assertAlmostEqual(odds.attacker_wiped, 1 / 16)
+
+    def test_hits_are_capped_by_the_attackers_warriors(self):
+        odds = battle_odds(BattleScenario(attacker_warriors=1, defender_warriors=3))
+        # every roll but 0-0 deals a hit
+        self.assertAlmostEqual(odds.defender_hits, 15 / 16)
+
+    def test_guerrilla_war(self):
+        odds = battle_odds(BattleScenario(3, 3))
+        guerrilla = battle_odds(BattleScenario(3, 3, guerrilla=True))
+        self.assertAlmostEqual(guerrilla.attacker_hits, odds.defender_hits)
+        self.assertAlmostEqual(guerrilla.defender_hits, odds.attacker_hits)
+
+    def test_defenseless_buildings_score(self):
+        odds = battle_odds(
+            BattleScenario(attacker_warriors=3, defender_warriors=0, defender_pieces=1)
+        )
+        self.assertEqual(odds.defender_wiped, 1)
+        self.assertEqual(odds.attacker_points, 1)
+        self.assertEqual(odds.attacker_hits, 0)
+
+    def test_ambush(self):
+        # two warriors lose both to the ambush and never roll
+        odds = battle_odds(BattleScenario(2, 3, attacker_pieces=1, ambush=True))
+        self.assertEqual(odds.attacker_warriors_lost, 2)
+        self.assertEqual(odds.defender_hits, 0)
+        self.assertEqual(odds.defender_points, 0)
+        # a single warrior loses a building or token too
+        odds = battle_odds(BattleScenario(1, 3, attacker_pieces=1, ambush=True))
+        self.assertEqual(odds.attacker_wiped, 1)
+        self.assertEqual(odds.defender_points, 1)
+        # the survivors of a larger army roll
+        odds = battle_odds(BattleScenario(5, 3, ambush=True))
+        self.assertAlmostEqual(odds.defender_hits, 34 / 16)
+        self.assertAlmostEqual(odds.attacker_warriors_lost, 2 + 14 / 16)
+
+    def test_extra_hits(self):
+        odds = battle_odds(
+            BattleScenario(3, 3, extra_attacker_hits=1, extra_defender_hits=1)
+        )
+        self.assertAlmostEqual(odds.defender_hits, 34 / 16 + 1)
+        self.assertAlmostEqual(odds.attacker_hits, 14 / 16 + 1)
+
+    def test_results_are_cached(self):
+        battle_odds.cache_clear()
+        battle_odds(BattleScenario(5, 2))
+        battle_odds(BattleScenario(5, 2))
+        self.assertEqual(battle_odds.cache_info().hits, 1)
+
+
+class BattleOddsEndpointTests(APITestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.game = GameSetupWithFactionsFactory(
+            owner=self.user, factions=[Faction.CATS, Faction.BIRDS]
+        )
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.birds = self.game.players.get(faction=Faction.BIRDS)
+        self.clearing = Clearing.objects.get(game=self.game, clearing_number=5)
+        Warrior.objects.filter(clearing=self.clearing).delete()
+        for _ in range(3):
+            WarriorFactory(player=self.cats, clearing=self.clearing)
+        for _ in range(2):
+            WarriorFactory(player=self.birds, clearing=self.clearing)
+        self.url = f"/api/battle/odds/{self.game.id}/"
+
+    def test_odds_for_every_clearing(self):
+        response = self.client.get(self.url, {"attacker": Faction.BIRDS})
+        self.assertEqual(response.status_code, 200)
+        battles = {(b["clearing_number"], b["defender"]): b for b in response.json()}
+        self.assertTrue(all(defender == Faction.CATS for _, defender in battles))
+
+        battle = battles[(5, Faction.CATS)]
+        self.assertEqual(battle["odds"], asdict(battle_odds(BattleScenario(2, 3))))
+        self.assertEqual(
+            battle["if_ambushed"], asdict(battle_odds(BattleScenario(2, 3, ambush=True)))
+        )
+
+    def test_reads_the_board_in_a_fixed_number_of_queries(self):
+        with self.assertNumQueries(8):
+            self.client.get(self.url, {"attacker": Faction.CATS})
+
+    def test_invalid_faction(self):
+        response = self.client.get(self.url, {"attacker": "xx"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(
+            self.url, {"attacker": Faction.CATS, "defender": Faction.CROWS}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase
+from game.management.commands.benchmark_games import COMPARED_FIGURES, TIME_FIGURE, Command
+
+
+def report(time_per_action: float, queries_per_action: float) -> dict:
+    return {
+        "scenarios": {
+            "4p": {
+                "time_per_action": time_per_action,
+                "queries_per_action": queries_per_action,
+                "checkpoint_bytes_per_action": 100.0,
+            }
+        }
+    }
+
+
+class BenchmarkCompareTests(SimpleTestCase):
+    def test_time_is_not_compared_by_default(self):
+        baseline = report(0.01, 20)
+        slower = report(0.05, 20)
+        self.assertEqual(Command().compare(baseline, slower, 0.25, COMPARED_FIGURES), [])
+        self.assertEqual(
+            Command().compare(baseline, slower, 0.25, COMPARED_FIGURES + (TIME_FIGURE,)),
+            ["4p time per action: 0.01 -> 0.05"],
+        )
+
+    def test_queries_regression(self):
+        regressions = Command().compare(report(0.01, 20), report(0.01, 30), 0.25, COMPARED_FIGURES)
+        self.assertEqual(regressions, ["4p queries per action: 20 -> 30"])
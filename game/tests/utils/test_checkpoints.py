@@ -0,0 +1,114 @@
+from django.test import TestCase, override_settings
+from game.models.game_models import Faction, Clearing, Warrior, HandEntry
+from game.models import checkpoint_models
+from game.models.checkpoint_models import Checkpoint
+from game.tests.my_factories import GameSetupWithFactionsFactory, HandEntryFactory
+from game.utils.snapshot import (
+    capture_gamestate,
+    diff_gamestate,
+    apply_gamestate_delta,
+)
+from game.utils.loader import load_gamestate
+
+
+def as_rows(gamestate: list) -> dict:
+    return {(obj["model"], obj["pk"]): obj for obj in gamestate}
+
+
+class DeltaCheckpointTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(
+            factions=[Faction.CATS, Faction.BIRDS, Faction.WOODLAND_ALLIANCE]
+        )
+        self.cats_player = self.game.players.get(faction=Faction.CATS)
+        self.c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+
+    def mutate(self):
+        """moves a warrior, inserts a hand entry and deletes another"""
+        warrior = Warrior.objects.filter(
+            player=self.cats_player, clearing__isnull=False
+        ).first()
+        assert warrior is not None
+        warrior.clearing = self.c5
+        warrior.save()
+        HandEntry.objects.filter(player=self.cats_player).first().delete()
+        return HandEntryFactory(player=self.cats_player)
+
+    def test_diff_and_apply_roundtrip(self):
+        before = capture_gamestate(self.game)
+        new_entry = self.mutate()
+        after = capture_gamestate(self.game)
+
+        delta = diff_gamestate(before, after)
+        self.assertIn(["game.handentry", new_entry.pk], [[o["model"], o["pk"]] for o in delta["changed"]])
+        self.assertEqual(len(delta["deleted"]), 1)
+        self.assertLess(len(delta["changed"]), len(after) // 10)
+
+        rebuilt = apply_gamestate_delta(before, delta)
+        self.assertEqual(as_rows(rebuilt), as_rows(after))
+
+    def test_record_stores_base_then_deltas(self):
+        first = Checkpoint.record(self.game, capture_gamestate(self.game))
+        self.assertFalse(first.is_delta)
+
+        self.mutate()
+        state = capture_gamestate(self.game)
+        second = Checkpoint.record(self.game, state)
+        self.assertTrue(second.is_delta)
+        self.assertEqual(second.base, first)
+        self.assertEqual(second.current_turn, self.game.current_turn)
+        self.assertEqual(as_rows(second.get_gamestate()), as_rows(state))
+
+        self.mutate()
+        state = capture_gamestate(self.game)
+        third = Checkpoint.record(self.game, state)
+        self.assertEqual(third.base, first)
+        self.assertEqual(as_rows(third.get_gamestate()), as_rows(state))
+
+    @override_settings(CHECKPOINT_KEYFRAME_INTERVAL=2)
+    def test_keyframe_interval_starts_new_base(self):
+        first = Checkpoint.record(self.game, capture_gamestate(self.game))
+        second = Checkpoint.record(self.game, capture_gamestate(self.game))
+        third = Checkpoint.record(self.game, capture_gamestate(self.game))
+        self.assertEqual(second.base, first)
+        self.assertFalse(third.is_delta)
+
+    @override_settings(CHECKPOINT_DELTAS=False)
+    def test_full_snapshots_when_disabled(self):
+        Checkpoint.record(self.game, capture_gamestate(self.game))
+        second = Checkpoint.record(self.game, capture_gamestate(self.game))
+        self.assertFalse(second.is_delta)
+
+    def test_restore_from_delta_checkpoint(self):
+        Checkpoint.record(self.game, capture_gamestate(self.game))
+        self.mutate()
+        expected = capture_gamestate(self.game)
+        checkpoint = Checkpoint.record(self.game, expected)
+
+        self.mutate()
+        load_gamestate(self.game.id, checkpoint.get_gamestate())
+        self.assertEqual(as_rows(capture_gamestate(self.game)), as_rows(expected))
+
+    def test_rebuilt_from_deltas_without_cached_state(self):
+        Checkpoint.record(self.game, capture_gamestate(self.game))
+        self.mutate()
+        Checkpoint.record(self.game, capture_gamestate(self.game))
+        self.mutate()
+        expected = capture_gamestate(self.game)
+        checkpoint = Checkpoint.record(self.game, expected)
+
+        checkpoint_models._materialized.clear()
+        stored = Checkpoint.objects.get(pk=checkpoint.pk)
+        self.assertEqual(as_rows(stored.get_gamestate()), as_rows(expected))
+
+    def test_record_does_not_replay_deltas(self):
+        previous = Checkpoint.record(self.game, capture_gamestate(self.game))
+        for _ in range(5):
+            self.mutate()
+            previous = Checkpoint.record(
+                self.game, capture_gamestate(self.game), previous=previous
+            )
+        # only the insert, however far the base is
+        state = capture_gamestate(self.game)
+        with self.assertNumQueries(1):
+            Checkpoint.record(self.game, state, previous=previous)
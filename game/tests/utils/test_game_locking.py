@@ -0,0 +1,109 @@
+import threading
+from unittest import skipUnless
+from django.db import connection, connections
+from django.test import TransactionTestCase
+from game.decorators.transaction_decorator import atomic_game_action
+from game.logic.playback import undo_last_action
+from game.models.checkpoint_models import Action
+from game.models.game_models import Faction, Game
+from game.tests.my_factories import GameSetupWithFactionsFactory
+
+WAIT = 5
+
+
+@skipUnless(connection.features.has_select_for_update, "needs row locks (PostgreSQL)")
+class GameLockingTests(TransactionTestCase):
+    """actions on the same game commit one at a time, actions on different games in parallel"""
+
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.other_game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.holding = threading.Event()
+        self.release = threading.Event()
+        self.entered = []
+
+        @atomic_game_action
+        def hold(game: Game):
+            self.entered.append(game.pk)
+            self.holding.set()
+            self.release.wait(WAIT)
+
+        @atomic_game_action
+        def act(game: Game):
+            self.entered.append(game.pk)
+
+        @atomic_game_action
+        def hold_next_turn(game: Game):
+            Game.objects.filter(pk=game.pk).update(current_turn=1)
+            self.holding.set()
+            self.release.wait(WAIT)
+
+        self.hold = hold
+        self.act = act
+        self.hold_next_turn = hold_next_turn
+
+    def in_thread(self, func, game: Game) -> threading.Thread:
+        def run():
+            try:
+                func(Game.objects.get(pk=game.pk))
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def test_actions_on_one_game_wait_for_each_other(self):
+        holder = self.in_thread(self.hold, self.game)
+        self.assertTrue(self.holding.wait(WAIT))
+
+        waiter = self.in_thread(self.act, self.game)
+        waiter.join(0.5)
+        # still blocked on the game row
+        self.assertTrue(waiter.is_alive())
+        self.assertEqual(self.entered, [self.game.pk])
+
+        # another game is not held up
+        other = self.in_thread(self.act, self.other_game)
+        other.join(WAIT)
+        self.assertFalse(other.is_alive())
+        self.assertEqual(self.entered, [self.game.pk, self.other_game.pk])
+
+        self.release.set()
+        holder.join(WAIT)
+        waiter.join(WAIT)
+        self.assertEqual(self.entered, [self.game.pk, self.other_game.pk, self.game.pk])
+        self.assertEqual(Game.objects.get(pk=self.game.pk).version, self.game.version + 2)
+
+    def test_waiting_action_sees_the_holders_changes(self):
+        turns = []
+
+        @atomic_game_action
+        def read_turn(game: Game):
+            turns.append(game.current_turn)
+
+        holder = self.in_thread(self.hold_next_turn, self.game)
+        self.assertTrue(self.holding.wait(WAIT))
+        # loaded before the holder commits
+        waiter = self.in_thread(read_turn, self.game)
+        waiter.join(0.5)
+        self.assertTrue(waiter.is_alive())
+
+        self.release.set()
+        holder.join(WAIT)
+        waiter.join(WAIT)
+        self.assertEqual(turns, [1])
+
+    def test_undo_waits_for_the_action(self):
+        holder = self.in_thread(self.hold_next_turn, self.game)
+        self.assertTrue(self.holding.wait(WAIT))
+        undo = self.in_thread(undo_last_action, self.game)
+        undo.join(0.5)
+        self.assertTrue(undo.is_alive())
+
+        self.release.set()
+        holder.join(WAIT)
+        undo.join(WAIT)
+        # the held action was the one undone
+        self.assertFalse(Action.objects.filter(checkpoint__game=self.game).exists())
+        self.assertEqual(Game.objects.get(pk=self.game.pk).current_turn, 0)
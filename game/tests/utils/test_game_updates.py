@@ -0,0 +1,121 @@
+import asyncio
+import threading
+from unittest import mock
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from django.test import TestCase, override_settings
+from game.decorators.transaction_decorator import atomic_game_action
+from game.models.game_log import GameLog, LogType
+from game.models.game_models import Clearing, Faction, Game
+from game.tests.my_factories import GameSetupWithFactionsFactory
+from game.transactions.general import draw_card_from_deck_to_hand, move_warriors
+from game.utils import game_updates
+from game.utils.game_updates import (
+    game_group_name,
+    deferred_game_updates,
+    schedule_game_update,
+    wait_for_game_updates,
+)
+
+
+@override_settings(
+    CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}},
+)
+class GameUpdateTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.channel_layer = get_channel_layer()
+        self.channel = async_to_sync(self.channel_layer.new_channel)()
+        async_to_sync(self.channel_layer.group_add)(
+            game_group_name(self.game.id), self.channel
+        )
+
+    def receive(self, channel):
+        async def receive():
+            return await asyncio.wait_for(self.channel_layer.receive(channel), 1)
+
+        return async_to_sync(receive)()
+
+    def assertNothingReceived(self, channel):
+        with self.assertRaises(asyncio.TimeoutError):
+            self.receive(channel)
+
+    def move_warrior(self):
+        c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        atomic_game_action(move_warriors)(self.cats, c1, c5, 1)
+
+    def test_action_publishes_version(self):
+        version = Game.objects.get(pk=self.game.pk).version
+        with self.captureOnCommitCallbacks(execute=True):
+            self.move_warrior()
+
+        message = self.receive(self.channel)
+        self.assertEqual(message["message"], "update")
+        self.assertGreater(message["version"], version)
+        self.assertEqual(message["version"], Game.objects.get(pk=self.game.pk).version)
+        self.assertIsNotNone(message["committed_at"])
+
+    def test_update_carries_log_head(self):
+        log = GameLog.objects.create(game=self.game, log_type=LogType.MOVE)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.move_warrior()
+
+        message = self.receive(self.channel)
+        log.refresh_from_db()
+        self.assertEqual(message["latest_log_id"], log.id)
+        self.assertEqual(message["logs_updated_at"], log.updated_at.isoformat())
+
+    def test_nested_actions_send_one_update(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.move_warrior()
+                atomic_game_action(draw_card_from_deck_to_hand)(self.cats)
+
+        message = self.receive(self.channel)
+        self.assertEqual(message["version"], Game.objects.get(pk=self.game.pk).version)
+        self.assertNothingReceived(self.channel)
+
+    def test_deferred_updates_are_merged(self):
+        with deferred_game_updates():
+            with self.captureOnCommitCallbacks(execute=True):
+                self.move_warrior()
+            with self.captureOnCommitCallbacks(execute=True):
+                atomic_game_action(draw_card_from_deck_to_hand)(self.cats)
+            self.assertNothingReceived(self.channel)
+
+        message = self.receive(self.channel)
+        self.assertEqual(message["version"], Game.objects.get(pk=self.game.pk).version)
+        self.assertNothingReceived(self.channel)
+
+    def test_rolled_back_update_is_not_merged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    schedule_game_update(self.game.id)
+                    raise ValueError
+            except ValueError:
+                pass
+            schedule_game_update(self.game.id)
+
+        self.assertEqual(self.receive(self.channel)["type"], "game_update")
+
+    @override_settings(GAME_UPDATES_IN_BACKGROUND=True)
+    def test_updates_are_built_off_the_request(self):
+        publishing = threading.Event()
+        threads = []
+
+        def publish(game_id, committed_at):
+            publishing.wait(1)
+            threads.append(threading.current_thread().name)
+
+        with mock.patch.object(game_updates, "publish_game_update", side_effect=publish):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.move_warrior()
+            self.assertEqual(threads, [])
+            publishing.set()
+            wait_for_game_updates()
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("game-updates"))
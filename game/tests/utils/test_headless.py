@@ -0,0 +1,114 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import TestCase
+from game.decorators.transaction_decorator import atomic_game_action
+from game.errors import InternalGameError
+from game.errors.action_errors import IllegalActionError
+from game.logic.headless import HeadlessGame
+from game.models.checkpoint_models import Action, Checkpoint
+from game.models.game_models import Clearing, Faction, Game, HandEntry, Player, Warrior
+from game.tests.my_factories import GameSetupWithFactionsFactory, WarriorFactory
+from game.transactions.general import draw_card_from_deck_to_hand, move_warriors
+from game.utils.snapshot import capture_gamestate
+
+
+class HeadlessGameTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        self.c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        for _ in range(5):
+            WarriorFactory(player=self.cats, clearing=self.c1)
+
+    def opened(self, headless: HeadlessGame) -> HeadlessGame:
+        self.addCleanup(headless.close)
+        return headless
+
+    def warriors_in_c5(self) -> int:
+        return Warrior.objects.filter(player=self.cats, clearing=self.c5).count()
+
+    def move_warrior(self, headless: HeadlessGame):
+        with headless.activate():
+            cats = Player.objects.get(pk=self.cats.pk)
+            c1 = Clearing.objects.get(pk=self.c1.pk)
+            c5 = Clearing.objects.get(pk=self.c5.pk)
+        headless.run(atomic_game_action(move_warriors), cats, c1, c5, 1)
+
+    def test_actions_stay_in_memory(self):
+        before = self.warriors_in_c5()
+        headless = self.opened(HeadlessGame.from_game(self.game))
+
+        with self.assertNumQueries(0):
+            self.move_warrior(headless)
+            self.move_warrior(headless)
+
+        with headless.activate():
+            self.assertEqual(self.warriors_in_c5(), before + 2)
+        self.assertEqual(self.warriors_in_c5(), before)
+        self.assertFalse(Action.objects.filter(checkpoint__game=self.game).exists())
+
+    def test_failed_action_is_rolled_back(self):
+        headless = self.opened(HeadlessGame.from_game(self.game))
+        with headless.activate():
+            cats = Player.objects.get(pk=self.cats.pk)
+            c1 = Clearing.objects.get(pk=self.c1.pk)
+            c5 = Clearing.objects.get(pk=self.c5.pk)
+        snapshot = headless.snapshot()
+
+        with self.assertRaises(IllegalActionError):
+            headless.run(move_warriors, cats, c1, c5, 100)
+        self.assertEqual(headless.snapshot(), snapshot)
+
+    def test_write_back_applies_the_result(self):
+        version = Game.objects.get(pk=self.game.pk).version
+        last_entry = HandEntry.objects.latest("pk").pk
+        headless = self.opened(HeadlessGame.from_game(self.game))
+        self.move_warrior(headless)
+        with headless.activate():
+            headless.run(draw_card_from_deck_to_hand, Player.objects.get(pk=self.cats.pk))
+
+        headless.write_back()
+
+        # the version only counts real writes
+        real = capture_gamestate(Game.objects.get(pk=self.game.pk))
+        self.assertEqual(real[1:], headless.snapshot()[1:])
+        self.assertGreater(Game.objects.get(pk=self.game.pk).version, version)
+        self.assertTrue(Checkpoint.objects.filter(game=self.game).exists())
+        # the drawn card's row got a pk the real database had not used
+        self.assertGreater(HandEntry.objects.filter(player=self.cats).latest("pk").pk, last_entry)
+
+    def test_fork_is_independent(self):
+        headless = self.opened(HeadlessGame.from_game(self.game))
+        fork = self.opened(headless.fork())
+        self.move_warrior(fork)
+
+        with fork.activate():
+            forked = self.warriors_in_c5()
+        with headless.activate():
+            self.assertEqual(self.warriors_in_c5(), forked - 1)
+
+    def test_checkpoint_replay_matches_the_game(self):
+        for _ in range(3):
+            atomic_game_action(move_warriors)(self.cats, self.c1, self.c5, 1)
+        checkpoint = Checkpoint.objects.filter(game=self.game).last()
+
+        headless = self.opened(HeadlessGame.from_checkpoint(checkpoint, action_number=2))
+
+        real = capture_gamestate(Game.objects.get(pk=self.game.pk))
+        self.assertEqual(headless.snapshot()[1:], real[1:])
+
+    def test_close_drops_the_database(self):
+        with HeadlessGame.from_game(self.game) as headless:
+            self.move_warrior(headless)
+        self.assertTrue(headless.closed)
+        with self.assertRaises(InternalGameError):
+            headless.snapshot()
+
+    def test_activate_restores_the_connection(self):
+        real = connections[DEFAULT_DB_ALIAS]
+        headless = self.opened(HeadlessGame.from_game(self.game))
+        with self.assertRaises(IllegalActionError):
+            with headless.activate():
+                self.assertIs(connections[DEFAULT_DB_ALIAS], headless.engine)
+                raise IllegalActionError("no")
+        self.assertIs(connections[DEFAULT_DB_ALIAS], real)
@@ -0,0 +1,103 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from game.models.game_models import Faction, Card, Clearing, HandEntry, Warrior, CoffinWarrior
+from game.models.game_log import GameLog, LogType
+from game.tests.my_factories import GameSetupWithFactionsFactory, HandEntryFactory, WarriorFactory
+from game.utils.loader import load_gamestate
+from game.utils.snapshot import capture_gamestate
+from game.game_data.cards.exiles_and_partisans import CardsEP
+
+# capturing the live state plus a few set-based writes per model: writing the
+# differing rows one by one would add about 40 queries here
+RESTORE_QUERY_BUDGET = 90
+
+
+def as_rows(gamestate: list) -> dict:
+    return {(obj["model"], obj["pk"]): obj for obj in gamestate}
+
+
+class LoadGamestateTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(
+            factions=[Faction.CATS, Faction.BIRDS, Faction.WOODLAND_ALLIANCE, Faction.CROWS]
+        )
+        self.cats_player = self.game.players.get(faction=Faction.CATS)
+        self.c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+
+    def test_restore_cascaded_rows(self):
+        """a snapshot row cascade-deleted with a culled row is inserted again"""
+        hand_entry = HandEntryFactory(player=self.cats_player)
+        snapshot = capture_gamestate(self.game)
+        # the hand entry now points at a card that is not in the snapshot
+        new_card = Card.objects.create(game=self.game, card_type=CardsEP.AMBUSH_RED.name)
+        hand_entry.card = new_card
+        hand_entry.save()
+
+        load_gamestate(self.game.id, snapshot)
+
+        self.assertFalse(Card.objects.filter(pk=new_card.pk).exists())
+        self.assertTrue(HandEntry.objects.filter(pk=hand_entry.pk).exists())
+        self.assertEqual(as_rows(capture_gamestate(self.game)), as_rows(snapshot))
+
+    def test_sequences_reset_after_cull(self):
+        snapshot = capture_gamestate(self.game)
+        warrior = WarriorFactory(player=self.cats_player, clearing=self.c5)
+        load_gamestate(self.game.id, snapshot)
+        self.assertEqual(WarriorFactory(player=self.cats_player, clearing=self.c5).pk, warrior.pk)
+
+    def test_sequences_follow_inserted_pks(self):
+        """rows inserted with their snapshot pks move the sequence past them"""
+        snapshot = capture_gamestate(self.game)
+        pk = WarriorFactory(player=self.cats_player, clearing=self.c5).pk
+        # the same warrior, under a pk the database has not handed out yet
+        rows = [
+            {**obj, "pk": pk + 10}
+            for obj in capture_gamestate(self.game)
+            if obj["pk"] == pk and obj["model"] in ("game.piece", "game.warrior")
+        ]
+        Warrior.objects.filter(pk=pk).delete()
+        load_gamestate(self.game.id, snapshot + rows)
+        self.assertEqual(WarriorFactory(player=self.cats_player, clearing=self.c5).pk, pk + 11)
+
+    def test_restored_logs_count_as_written(self):
+        """a log an undo puts back reaches log feed clients again"""
+        log = GameLog.objects.create(game=self.game, log_type=LogType.MOVE, details={"i": 0})
+        snapshot = capture_gamestate(self.game)
+        log.details = {"i": 1}
+        log.save()
+        edited_at = GameLog.objects.get(pk=log.pk).updated_at
+
+        load_gamestate(self.game.id, snapshot)
+
+        log.refresh_from_db()
+        self.assertEqual(log.details, {"i": 0})
+        self.assertGreater(log.updated_at, edited_at)
+
+    def test_late_game_restore_benchmark(self):
+        """restoring a late-game snapshot only writes the rows that differ"""
+        parent = GameLog.objects.create(game=self.game, log_type=LogType.TURN)
+        for i in range(2000):
+            GameLog.objects.create(
+                game=self.game, parent=parent, log_type=LogType.MOVE, details={"i": i}
+            )
+        for _ in range(40):
+            WarriorFactory(player=self.cats_player, clearing=self.c5)
+        snapshot = capture_gamestate(self.game)
+
+        # a turn's worth of changes
+        for warrior in Warrior.objects.filter(player=self.cats_player, clearing=self.c5)[:10]:
+            warrior.clearing = Clearing.objects.get(game=self.game, clearing_number=1)
+            warrior.save()
+        for _ in range(30):
+            GameLog.objects.create(game=self.game, parent=parent, log_type=LogType.MOVE)
+        HandEntry.objects.filter(player=self.cats_player)[0].delete()
+        CoffinWarrior.warrior_to_coffin(Warrior.objects.filter(player=self.cats_player).first())
+        self.cats_player.score = 12
+        self.cats_player.save()
+
+        with CaptureQueriesContext(connection) as ctx:
+            load_gamestate(self.game.id, snapshot)
+
+        self.assertEqual(as_rows(capture_gamestate(self.game)), as_rows(snapshot))
+        self.assertLessEqual(len(ctx.captured_queries), RESTORE_QUERY_BUDGET)
@@ -0,0 +1,69 @@
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+from game.decorators.transaction_decorator import atomic_game_action, transaction_name
+from game.models.game_models import Clearing, Faction
+from game.tests.my_factories import GameSetupWithFactionsFactory
+from game.tests.query_budget import QueryBudgetMixin
+from game.transactions.general import move_warriors
+from game.utils import metrics
+
+
+class MetricsTests(APITestCase, QueryBudgetMixin):
+    def setUp(self):
+        metrics.reset_metrics()
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        self.cats = self.game.players.get(faction=Faction.CATS)
+        self.client.force_authenticate(user=self.cats.user)
+
+    def test_endpoint_is_recorded_per_route(self):
+        # 82 today
+        with self.assertQueryBudget("GET /api/game/<int:game_id>/state/", 85):
+            self.client.get(f"/api/game/{self.game.id}/state/")
+            self.client.get(f"/api/game/{self.game.id}/state/")
+
+        stats = metrics.get_metrics(metrics.ENDPOINT, "GET /api/game/<int:game_id>/state/")
+        self.assertEqual(stats.calls, 2)
+        self.assertGreater(stats.queries, 0)
+        self.assertGreaterEqual(stats.total_time, stats.db_time)
+
+    def test_transaction_records_checkpoint_size(self):
+        name = transaction_name(move_warriors)
+        c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        # 89 today, most of it capturing the first checkpoint
+        with self.settings(METRICS_CHECKPOINT_SIZE=True), self.assertQueryBudget(
+            name, 95, kind=metrics.TRANSACTION
+        ):
+            atomic_game_action(move_warriors)(self.cats, c1, c5, 1)
+
+        stats = metrics.get_metrics(metrics.TRANSACTION, name)
+        self.assertEqual(stats.calls, 1)
+        # first action of the game: a full checkpoint is written
+        self.assertGreater(stats.checkpoint_size, 0)
+
+    def test_metrics_endpoint_is_staff_only(self):
+        self.client.get(f"/api/game/{self.game.id}/state/")
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        self.client.force_authenticate(user=staff)
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(
+            "GET /api/game/<int:game_id>/state/", [m["name"] for m in response.json()]
+        )
+
+    def test_percentile(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(metrics.percentile(values, 0.5), 3)
+        self.assertEqual(metrics.percentile(values, 0.95), 5)
+        self.assertEqual(metrics.percentile([7], 0.5), 7)
+
+    def test_checkpoint_size_off_by_default(self):
+        c1 = Clearing.objects.get(game=self.game, clearing_number=1)
+        c5 = Clearing.objects.get(game=self.game, clearing_number=5)
+        atomic_game_action(move_warriors)(self.cats, c1, c5, 1)
+        stats = metrics.get_metrics(metrics.TRANSACTION, transaction_name(move_warriors))
+        self.assertEqual(stats.checkpoint_size, 0)
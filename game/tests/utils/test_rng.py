@@ -0,0 +1,65 @@
+from django.test import TestCase
+from game.models.game_models import DeckEntry, Faction, Game
+from game.tests.my_factories import GameFactory, GameSetupWithFactionsFactory
+from game.transactions.game_setup import construct_deck
+from game.utils.loader import load_gamestate
+from game.utils.rng import game_random, randint, shuffle
+from game.utils.snapshot import capture_gamestate
+
+
+class GameRandomTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+
+    def test_same_seed_same_draws(self):
+        other = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        Game.objects.filter(pk__in=[self.game.pk, other.pk]).update(rng_seed=7, rng_draws=0)
+
+        items, other_items = list(range(20)), list(range(20))
+        shuffle(self.game, items)
+        shuffle(other, other_items)
+        self.assertEqual(items, other_items)
+        self.assertEqual(
+            [randint(self.game, 0, 100) for _ in range(5)],
+            [randint(other, 0, 100) for _ in range(5)],
+        )
+
+    def test_draws_advance_the_counter(self):
+        draws = Game.objects.get(pk=self.game.pk).rng_draws
+        first = game_random(self.game).random()
+        second = game_random(self.game).random()
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(Game.objects.get(pk=self.game.pk).rng_draws, draws + 2)
+        self.assertEqual(self.game.rng_draws, draws + 2)
+
+    def test_stale_instance_does_not_rewind_the_counter(self):
+        stale = Game.objects.get(pk=self.game.pk)
+        game_random(self.game)
+
+        stale.current_turn += 1
+        stale.save()
+
+        game = Game.objects.get(pk=self.game.pk)
+        self.assertEqual(game.rng_draws, self.game.rng_draws)
+        self.assertEqual(game.current_turn, stale.current_turn)
+
+    def test_restored_game_draws_the_same_values(self):
+        snapshot = capture_gamestate(Game.objects.get(pk=self.game.pk))
+        rolls = [randint(self.game, 0, 3) for _ in range(10)]
+
+        load_gamestate(self.game.pk, snapshot)
+        self.assertEqual([randint(self.game, 0, 3) for _ in range(10)], rolls)
+
+    def test_deck_order_follows_the_seed(self):
+        def deck(seed: int) -> list[str]:
+            game = GameFactory(rng_seed=seed)
+            construct_deck(game)
+            return list(
+                DeckEntry.objects.filter(game=game)
+                .order_by("spot")
+                .values_list("card__card_type", flat=True)
+            )
+
+        self.assertEqual(deck(1), deck(1))
+        self.assertNotEqual(deck(1), deck(2))
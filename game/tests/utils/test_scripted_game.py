@@ -0,0 +1,38 @@
+from django.test import TestCase
+from game.game_data.cards.exiles_and_partisans import CardsEP
+from game.models.game_models import Faction, Game
+from game.queries.wa.crafting import is_able_to_be_crafted
+from game.tests.scripted_game import ScriptedGame
+
+
+class ScriptedGameTests(TestCase):
+    def test_plays_through_setup_into_turns(self):
+        game = ScriptedGame([Faction.CATS, Faction.BIRDS], seed=3, undo_every=5)
+        game.set_up()
+        game.play(15)
+
+        report = game.report()
+        self.assertEqual(report["actions"], 15)
+        self.assertEqual(report["server_errors"], 0)
+        self.assertTrue(game.completed)
+        self.assertEqual(game.errors(), {})
+        self.assertGreater(report["undos"], 0)
+        self.assertNotEqual(
+            Game.objects.get(pk=game.game_id).status, Game.GameStatus.NOT_STARTED
+        )
+        self.assertIn("GET /api/game/current-action/<int:game_id>/", game.timings)
+
+    def test_errors_name_where_the_view_failed(self):
+        game = ScriptedGame([Faction.CATS, Faction.BIRDS])
+        for _ in range(2):
+            try:
+                is_able_to_be_crafted(None, CardsEP.AMBUSH_RED)
+            except ValueError as e:
+                game.exceptions.append(e)
+        game.server_errors = 2
+
+        self.assertFalse(game.completed)
+        [(error, count)] = game.errors().items()
+        self.assertEqual(count, 2)
+        self.assertTrue(error.startswith("ValueError(Card is not craftable) at game/queries/wa/crafting.py:"))
+        self.assertTrue(error.endswith(" in is_able_to_be_crafted"))
@@ -0,0 +1,70 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from game.models.game_models import Faction, Clearing, Piece, Warrior
+from game.models.moles.burrow import Burrow
+from game.tests.my_factories import GameSetupWithFactionsFactory
+from game.utils.snapshot import (
+    SNAPSHOT_MODELS,
+    capture_gamestate,
+    get_all_game_objects,
+)
+
+FIVE_FACTIONS = [
+    Faction.CATS,
+    Faction.BIRDS,
+    Faction.WOODLAND_ALLIANCE,
+    Faction.CROWS,
+    Faction.MOLES,
+]
+
+# one query per model with a game lookup, plus the two clearing M2M prefetches
+EXPECTED_QUERY_COUNT = sum(1 for _, lookup in SNAPSHOT_MODELS if lookup) + 2
+
+
+class SnapshotCaptureTests(TestCase):
+    def setUp(self):
+        self.game = GameSetupWithFactionsFactory(factions=FIVE_FACTIONS)
+
+    def test_capture_matches_per_model_queries(self):
+        """batched capture finds the same rows as querying each model by itself"""
+        expected = {("game.game", self.game.pk)}
+        for model, lookup in SNAPSHOT_MODELS[1:]:
+            if lookup is None:
+                lookup = "game" if model is Burrow else "player__game"
+            label = model._meta.label_lower
+            expected.update(
+                (label, pk)
+                for pk in model.objects.filter(**{lookup: self.game}).values_list(
+                    "pk", flat=True
+                )
+            )
+        captured = {(obj["model"], obj["pk"]) for obj in capture_gamestate(self.game)}
+        self.assertEqual(captured, expected)
+
+    def test_mti_levels_are_captured(self):
+        objects = get_all_game_objects(self.game)
+        warrior = Warrior.objects.filter(player__game=self.game).first()
+        assert warrior is not None
+        self.assertIn((Piece, warrior.pk), [(o.__class__, o.pk) for o in objects])
+        self.assertIn((Warrior, warrior.pk), [(o.__class__, o.pk) for o in objects])
+
+    def test_clearing_connections_serialized(self):
+        gamestate = capture_gamestate(self.game)
+        clearing = Clearing.objects.get(game=self.game, clearing_number=1)
+        row = next(
+            o for o in gamestate if o["model"] == "game.clearing" and o["pk"] == clearing.pk
+        )
+        self.assertCountEqual(
+            row["fields"]["connected_clearings"],
+            clearing.connected_clearings.values_list("pk", flat=True),
+        )
+
+    def test_query_count_is_fixed(self):
+        """capture cost does not grow with the number of players"""
+        small_game = GameSetupWithFactionsFactory(factions=[Faction.CATS, Faction.BIRDS])
+        with CaptureQueriesContext(connection) as small:
+            capture_gamestate(small_game)
+        with self.assertNumQueries(EXPECTED_QUERY_COUNT):
+            capture_gamestate(self.game)
+        self.assertEqual(len(small), EXPECTED_QUERY_COUNT)
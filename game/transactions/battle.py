@@ -3,7 +3,7 @@ from game.errors.system_errors import InternalGameError
 from game.models import GameLog
 from game.models.game_models import Suit
 from game.queries.general import validate_player_has_card_in_hand
-from random import randint
+from game.utils.rng import randint
 from django.db import transaction
 from game.errors import IllegalActionError
 
@@ -25,6 +25,7 @@ from game.models.game_models import (
     Warrior,
 )
 from game.models.wa.tokens import WASympathy
+from game.queries.crafted_cards import get_partisan_card_type
 from game.queries.general import (
     count_player_pieces_in_clearing,
     player_has_pieces_in_clearing,
@@ -188,6 +189,10 @@ def attacker_ambush_choice(game: Game, battle: Battle, ambush_card: CardsEP | No
                 1,
                 parent=get_battle_log(game, battle.pk),
             )
+            # nothing left for the remaining hit to land on
+            if count_player_pieces_in_clearing(attacking_player, battle.clearing) == 0:
+                end_battle(game, battle)
+                return
             # do i need to convey that attacker must choose one hit, or is this kind of guaranteed to only be one?
             start_removal_event(game)
             battle.step = Battle.BattleSteps.ATTACKER_CHOOSE_AMBUSH_HITS
@@ -258,15 +263,6 @@ def attacker_choose_ambush_hit(game: Game, battle: Battle, piece: Piece):
     end_battle(game, battle)
 
 
-def get_partisan_card_type(suit_str: str) -> CardsEP | None:
-    suit_map = {
-        "r": CardsEP.FOX_PARTISANS,
-        "y": CardsEP.RABBIT_PARTISANS,
-        "o": CardsEP.MOUSE_PARTISANS,
-    }
-    return suit_map.get(suit_str)
-
-
 def can_use_partisans(player: Player, clearing: Clearing) -> bool:
     card_type = get_partisan_card_type(clearing.suit)
     if not card_type:
@@ -319,8 +315,8 @@ def roll_dice(game: Game, battle: Battle):
     # check the timing
     if battle.step != Battle.BattleSteps.ROLL_DICE:
         raise UnavailableActionError("Not roll dice step")
-    die1 = randint(0, 3)
-    die2 = randint(0, 3)
+    die1 = randint(game, 0, 3)
+    die2 = randint(game, 0, 3)
     print(f"dice rolled: {die1}, {die2}")
     hi, lo = max(die1, die2), min(die1, die2)
     attacking_player = Player.objects.get(game=game, faction=battle.attacker)
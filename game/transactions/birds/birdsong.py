@@ -123,6 +123,8 @@ def place_roost(player: Player, clearing: Clearing):
     roost = BirdRoost.objects.filter(player=player, building_slot__isnull=True).first()
     if roost is None:
         raise IllegalActionError("No roosts in supply to place")
+    if BirdRoost.objects.filter(player=player, building_slot__clearing=clearing).exists():
+        raise IllegalActionError("Clearing already has a roost")
     # place roost
     place_piece_from_supply_into_clearing(roost, clearing)
 
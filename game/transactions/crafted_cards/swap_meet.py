@@ -1,6 +1,6 @@
 from game.queries.general import validate_player_has_card_in_hand
 from game.queries.general import validate_player_has_crafted_card
-from random import choice
+from game.utils.rng import choice
 from django.db import transaction
 from game.models import HandEntry, Card, CraftedCardEntry
 from game.models.events.crafted_cards import SwapMeetEvent
@@ -22,12 +22,12 @@ def swap_meet_take_card(player, target_player):
     if not can_use_card(player, crafted_card):
         raise ValueError("Swap Meet cannot be used right now")
 
-    target_hand = HandEntry.objects.filter(player=target_player)
+    target_hand = HandEntry.objects.filter(player=target_player).order_by("pk")
     if not target_hand.exists():
         raise ValueError("Target player has no cards in hand")
 
     # Pick a random card
-    taken_hand_entry = choice(list(target_hand))
+    taken_hand_entry = choice(player.game, list(target_hand))
     taken_card = taken_hand_entry.card
 
     # Move card
@@ -16,6 +16,7 @@ from game.models.crows.tokens import PlotToken
 from game.models.events.crows import CrowRecruitEvent
 from game.models.events import Event
 from game.utility.textchoice import next_choice
+from game.utils.rng import choice
 from game.models.crows.turn import CrowBirdsong, CrowDaylight, CrowEvening
 from game.queries.crows.turn import get_phase, validate_step
 from game.queries.crows.crafting import validate_crafting_pieces_satisfy_requirements
@@ -87,7 +88,6 @@ def resolve_extortion(player: Player, token: PlotToken, **kwargs):
     """resolves an extortion plot token"""
     parent = kwargs.get("parent")
     from game.models.game_models import HandEntry
-    import random
 
     clearing = token.clearing
     from game.models.game_models import Token, Building
@@ -98,9 +98,9 @@ def resolve_extortion(player: Player, token: PlotToken, **kwargs):
                          Building.objects.filter(building_slot__clearing=clearing, player=player_).exists()
 
             if has_pieces:
-                enemy_hand = list(HandEntry.objects.filter(player=player_))
+                enemy_hand = list(HandEntry.objects.filter(player=player_).order_by("pk"))
                 if enemy_hand:
-                    stolen_card = random.choice(enemy_hand)
+                    stolen_card = choice(player.game, enemy_hand)
                     stolen_card.player = player
                     stolen_card.save()
                     
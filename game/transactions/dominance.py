@@ -5,7 +5,7 @@ from game.models.dominance import DominanceSupplyEntry, ActiveDominanceEntry
 from game.transactions.general import discard_card_from_hand
 from game.queries.general import is_phase
 from game.models.game_models import Clearing, Game
-from game.queries.general import determine_clearing_rule
+from game.queries.board_state import get_board_state
 from django.db import transaction
 
 
@@ -58,20 +58,20 @@ def check_dominance_victory(player: Player):
 
     suit = active_dominance.card.suit
     game = player.game
+    # one load of the board answers rule for every clearing checked below
+    board_state = get_board_state(game)
 
     if suit == Suit.WILD:  # Bird Dominance
         # Rule 2 opposite corners
         # Corners are 1, 2, 3, 4. Opposites: (1, 3), (2, 4).
         corners = [1, 2, 3, 4]
-        ruled_corners = []
-        for c_num in corners:
-            try:
-                clearing = Clearing.objects.get(game=game, clearing_number=c_num)
-                ruler = determine_clearing_rule(clearing)
-                if ruler == player:
-                    ruled_corners.append(c_num)
-            except Clearing.DoesNotExist:
-                pass
+        ruled_corners = [
+            clearing.clearing_number
+            for clearing in Clearing.objects.filter(
+                game=game, clearing_number__in=corners
+            )
+            if board_state.ruler(clearing) == player
+        ]
 
         has_1_3 = 1 in ruled_corners and 3 in ruled_corners
         has_2_4 = 2 in ruled_corners and 4 in ruled_corners
@@ -86,7 +86,7 @@ def check_dominance_victory(player: Player):
         count = 0
         suit_clearings = Clearing.objects.filter(game=game, suit=suit)
         for clearing in suit_clearings:
-            if determine_clearing_rule(clearing) == player:
+            if board_state.ruler(clearing) == player:
                 count += 1
 
         if count >= needed:
@@ -1,4 +1,4 @@
-from random import shuffle
+from game.utils.rng import shuffle
 from django.contrib.auth.models import User
 from django.db import transaction, models
 from game.errors import UnavailableActionError, IllegalActionError, InternalGameError
@@ -17,6 +17,7 @@ from game.models import (
     Suit,
 )
 from game.game_data.cards.exiles_and_partisans import deck as exile_deck
+from game.game_data.general.maps import AUTUMN_MAP
 from game.models.events.setup import GameSimpleSetup
 from game.models.game_models import Faction
 
@@ -136,26 +137,17 @@ def autumn_map_setup(game: Game):
     # presave clearings because we need pks to connect them via m2m relationships
     for clearing in clearings:
         clearing.save()
-    # connect clearings. this is a lot of redundant work but easier to comapre to a map
-    clearings[0].connected_clearings.add(clearings[4], clearings[8], clearings[9])
-    clearings[1].connected_clearings.add(clearings[4], clearings[5], clearings[9])
-    clearings[2].connected_clearings.add(clearings[5], clearings[6], clearings[10])
-    clearings[3].connected_clearings.add(clearings[7], clearings[8], clearings[11])
-    clearings[4].connected_clearings.add(clearings[0], clearings[1])
-    clearings[5].connected_clearings.add(clearings[1], clearings[2], clearings[10])
-    clearings[6].connected_clearings.add(clearings[2], clearings[7], clearings[11])
-    clearings[7].connected_clearings.add(clearings[3], clearings[6])
-    clearings[8].connected_clearings.add(clearings[0], clearings[3], clearings[11])
-    clearings[9].connected_clearings.add(clearings[0], clearings[1], clearings[11])
-    clearings[10].connected_clearings.add(clearings[2], clearings[5], clearings[11])
-    clearings[11].connected_clearings.add(
-        clearings[3], clearings[6], clearings[8], clearings[9], clearings[10]
-    )
-    # water connected clearings. adding in order since connections are max 2.
-    clearings[3].water_connected_clearings.add(clearings[6])
-    clearings[6].water_connected_clearings.add(clearings[10])
-    clearings[10].water_connected_clearings.add(clearings[9])
-    clearings[9].water_connected_clearings.add(clearings[4])
+    # connect clearings as laid out in the static map graph
+    for clearing in clearings:
+        clearing.connected_clearings.add(
+            *[clearings[i - 1] for i in AUTUMN_MAP.adjacent(clearing.clearing_number)]
+        )
+        clearing.water_connected_clearings.add(
+            *[
+                clearings[i - 1]
+                for i in AUTUMN_MAP.river_adjacent(clearing.clearing_number)
+            ]
+        )
 
     # save clearings again now that we have all the connections
     for clearing in clearings:
@@ -175,7 +167,7 @@ def autumn_map_setup(game: Game):
         ItemTypes.HAMMER,
         ItemTypes.SWORD,
     ]
-    shuffle(ruin_item_types)
+    shuffle(game, ruin_item_types)
     for i in ruin_clearings:
         clearing = clearings[i]
         # this doesnt allow for more than one ruin per clearing
@@ -203,7 +195,7 @@ def construct_deck(game: Game):
         for card in exile_deck
     ]
     Card.objects.bulk_create(deck)
-    shuffle(deck)
+    shuffle(game, deck)
     deck_entries = [
         DeckEntry(game=game, card=deck[i], spot=i) for i in range(len(deck))
     ]
@@ -1,7 +1,7 @@
 from game.models.cats import CatKeep
 from game.queries.general import validate_player_has_crafted_card
 from game.queries.general import validate_legal_move
-from random import shuffle
+from game.utils.rng import shuffle
 import warnings
 from django.db import transaction
 
@@ -46,7 +46,7 @@ def reshuffle_discard_into_deck(game: Game):
     assert len(DeckEntry.objects.filter(game=game)) == 0, "deck is not empty"
     # query all cards in discard pile
     cards_in_discard = list(DiscardPileEntry.objects.filter(game=game))
-    shuffle(cards_in_discard)
+    shuffle(game, cards_in_discard)
     # create deck entries for each card
     deck_entries = [
         DeckEntry(game=game, card=card_in_discard.card, spot=i)
@@ -1,4 +1,4 @@
-import random
+from game.utils.rng import choice
 from django.db import transaction
 
 from game.models.game_models import Player, HandEntry
@@ -112,9 +112,9 @@ def _perform_price_of_failure(player: Player, minister: Minister | None):
         minister.save()
 
     # Discard a random card if hand has cards
-    hand_entries = HandEntry.objects.filter(player=player)
+    hand_entries = HandEntry.objects.filter(player=player).order_by("pk")
     if hand_entries.exists():
-        card_entry = random.choice(list(hand_entries))
+        card_entry = choice(player.game, list(hand_entries))
         card_model = card_entry.card
         discard_card_from_hand(player, card_entry)
 
@@ -10,6 +10,7 @@ from game.models.moles.ministers import Minister
 from game.models.moles.burrow import Burrow
 from game.models.events.setup import GameSimpleSetup
 from game.errors import UnavailableActionError, IllegalActionError
+from game.queries.general import get_connected_clearings
 from game.queries.setup.moles import validate_corner
 from game.transactions.setup_util import next_player_setup
 from game.transactions.general import place_warriors_into_clearing
@@ -148,7 +149,9 @@ def pick_corner(player: Player, clearing: Clearing):
     tunnel_in_corner.save()
 
     # place 2 warriors in each adjacent clearing
-    adjacent_clearings = clearing.connected_clearings.all()
+    adjacent_clearings = sorted(
+        get_connected_clearings(clearing), key=lambda c: c.clearing_number
+    )
     for adjacent_clearing in adjacent_clearings:
         place_warriors_into_clearing(player, adjacent_clearing, 2)
 
@@ -37,6 +37,7 @@ from game.transactions.wa.daylight import (
 from game.transactions.wa.evening import (
     draw_cards,
     check_discard_step,
+    discard_card,
     end_evening_operations,
 )
 
@@ -76,6 +77,7 @@ __all__ = [
     # evening
     "draw_cards",
     "check_discard_step",
+    "discard_card",
     "end_evening_operations",
     # outrage
     "pay_outrage",
@@ -1,11 +1,18 @@
 from django.db import transaction
 
+from game.game_data.cards.exiles_and_partisans import CardsEP
 from game.models.game_models import Player
 from game.models.wa.buildings import WABase
 from game.models.wa.turn import WAEvening
-from game.queries.general import get_player_hand_size
+from game.queries.general import (
+    get_player_hand_size,
+    validate_player_has_card_in_hand,
+)
 from game.queries.wa.turn import get_phase, validate_step
-from game.transactions.general import draw_card_from_deck_to_hand
+from game.transactions.general import (
+    discard_card_from_hand,
+    draw_card_from_deck_to_hand,
+)
 from game.errors import UnavailableActionError, IllegalActionError, InternalGameError
 
 
@@ -51,6 +58,33 @@ def check_discard_step(player: Player):
     next_step(player)
 
 
+@transaction.atomic
+def discard_card(player: Player, card: CardsEP):
+    """discards a card from hand, moving to the next step once down to 5 cards"""
+    evening = get_phase(player)
+    assert isinstance(evening, WAEvening)
+    validate_step(player, WAEvening.WAEveningSteps.DISCARDING)
+
+    if get_player_hand_size(player) <= 5:
+        raise IllegalActionError("Player must have more than 5 cards to discard")
+
+    card_in_hand = validate_player_has_card_in_hand(player, card)
+    discard_card_from_hand(player, card_in_hand)
+
+    from game.serializers.logs.general import log_discard, get_current_phase_log
+
+    log_discard(
+        player.game,
+        player,
+        card_in_hand.card,
+        parent=get_current_phase_log(player.game, player),
+    )
+
+    if get_player_hand_size(player) <= 5:
+        from game.transactions.wa.turn import next_step
+        next_step(player)
+
+
 @transaction.atomic
 def end_evening_operations(player: Player):
     from game.transactions.wa.turn import next_step
@@ -3,7 +3,7 @@ from game.views.gamestate_views.wa import get_wa_player_private
 from django.urls import URLPattern, path
 
 from game.views.DevLoginView import DevLoginView
-from game.views.action_views.battle import BattleActionView
+from game.views.action_views.battle import BattleActionView, get_battle_odds_view
 from game.views.action_views.birds.birdsong import AddToDecreeView, EmergencyDrawingView
 from game.views.action_views.birds.daylight import (
     BirdBattleView,
@@ -24,7 +24,7 @@ from game.views.action_views.setup.birds import (
 )
 from game.views.action_views.wa.birdsong import RevoltView, SpreadSympathyView
 from game.views.action_views.wa.daylight import WADaylightActionsView
-from game.views.action_views.wa.evening import WAOperationsView
+from game.views.action_views.wa.evening import WADiscardCardsView, WAOperationsView
 from game.views.action_views.wa.outrage import OutrageView
 from game.views.action_views.crows.birdsong import (
     CrowsCraftingView,
@@ -69,16 +69,19 @@ from game.views.gamestate_views.crows import (
 
 from game.views.gamestate_views.general import (
     get_current_action,
+    get_legal_actions_view,
     get_players,
     get_turn_info,
     undo_last_action_view,
     get_game_session_detail,
+    get_game_state,
     get_dominance_supply,
     get_revealed_cards,
     get_craftable_items,
     get_game_logs,
+    get_game_log_feed,
 )
-from game.views.gamestate_views.cards import GetCraftedCardsView
+from game.views.gamestate_views.cards import GetCraftedCardsView, get_card_catalog
 from game.views.setup_views import (
     create_game,
     create_demo_game,
@@ -104,6 +107,7 @@ from rest_framework_simplejwt.views import (
 )
 from rest_framework.views import APIView
 
+from game.views.metrics import get_metrics
 from game.views.user_info import get_player_info, get_user_info
 
 
@@ -120,6 +124,7 @@ urlpatterns = [
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("api/user/", get_user_info, name="user"),
+    path("api/metrics/", get_metrics, name="metrics"),
     path("api/player/<int:game_id>/", get_player_info, name="player"),
     path("api/players/<int:game_id>/", get_players, name="players"),
     path("api/cats/player-info/<int:game_id>/", get_cat_player_public),
@@ -147,7 +152,17 @@ urlpatterns = [
         get_current_action,
         name="get-current-action",
     ),
+    path(
+        "api/game/legal-actions/<int:game_id>/",
+        get_legal_actions_view,
+        name="legal-actions",
+    ),
     path("api/game/undo/<int:game_id>/", undo_last_action_view, name="undo-action"),
+    path(
+        "api/game/<int:game_id>/state/",
+        get_game_state,
+        name="game-state",
+    ),
     path(
         "api/game/<int:game_id>/session/",
         get_game_session_detail,
@@ -158,6 +173,7 @@ urlpatterns = [
         GetCraftedCardsView.as_view(),
         name="get-crafted-cards",
     ),
+    path("api/cards/catalog/", get_card_catalog, name="get-card-catalog"),
     path("api/games/active/", list_active_games, name="list-active-games"),
     path("api/games/joinable/", list_joinable_games, name="list-joinable-games"),
     path(
@@ -180,6 +196,11 @@ urlpatterns = [
         get_game_logs,
         name="get-game-logs",
     ),
+    path(
+        "api/game-log/<int:game_id>/feed/",
+        get_game_log_feed,
+        name="get-game-log-feed",
+    ),
 ]
 register_action(
     "cats-setup-pick-corner",
@@ -346,12 +367,21 @@ register_action(
     "api/woodland-alliance/evening/operations/",
     urlpatterns,
 )
+register_action(
+    "wa-discard-cards",
+    WADiscardCardsView,
+    "api/woodland-alliance/evening/discard-cards/",
+    urlpatterns,
+)
 register_action(
     "battle",
     BattleActionView,
     "api/battle/",
     urlpatterns,
 )
+urlpatterns.append(
+    path("api/battle/odds/<int:game_id>/", get_battle_odds_view, name="battle-odds")
+)
 
 # Crows Actions
 register_action(
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import connection, transaction
+from game.models.game_models import Game
+from game.queries.game_log import get_log_head
+
+logger = logging.getLogger(__name__)
+
+# builds and sends the updates off the request, one at a time so a process publishes
+# them in commit order (GAME_UPDATES_IN_BACKGROUND)
+_publisher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-updates")
+# games with an update waiting in the publisher: a later commit is covered by it
+_queued: set[int] = set()
+_queued_lock = threading.Lock()
+
+# games committed to inside a deferred_game_updates() block, published when it ends,
+# with the time of their first commit
+_deferred_updates: ContextVar[dict | None] = ContextVar("deferred_updates", default=None)
+
+
+def game_group_name(game_id: int) -> str:
+    return f"game_{game_id}"
+
+
+def _send(group: str, message: dict) -> None:
+    try:
+        async_to_sync(get_channel_layer().group_send)(group, message)
+    except Exception:
+        logger.exception("Failed to send websocket update to %s", group)
+
+
+def publish_game_update(game_id: int, committed_at: float | None = None) -> None:
+    """
+    Tells the game's websocket group that the game changed, and to which version.
+    committed_at (epoch seconds) is passed on so clients can tell how stale the update is.
+    The head of the game log (latest_log_id, logs_updated_at) comes along, for clients to
+    fetch the log feed only when it moved.
+    """
+    version = Game.objects.filter(pk=game_id).values_list("version", flat=True).first()
+    if version is None:
+        return
+    _send(
+        game_group_name(game_id),
+        {
+            "type": "game_update",
+            "message": "update",
+            "version": version,
+            "committed_at": committed_at,
+            **get_log_head(game_id),
+        },
+    )
+
+
+def _publish_queued(game_id: int, committed_at: float) -> None:
+    with _queued_lock:
+        _queued.discard(game_id)
+    try:
+        publish_game_update(game_id, committed_at)
+    except Exception:
+        logger.exception("Failed to publish the update of game %s", game_id)
+    finally:
+        # the publisher thread's own connection
+        connection.close()
+
+
+def dispatch_game_update(game_id: int, committed_at: float) -> None:
+    """publishes the update of a committed game, in the background unless configured not to"""
+    if not settings.GAME_UPDATES_IN_BACKGROUND:
+        publish_game_update(game_id, committed_at)
+        return
+    with _queued_lock:
+        if game_id in _queued:
+            return
+        _queued.add(game_id)
+    _publisher.submit(_publish_queued, game_id, committed_at)
+
+
+def wait_for_game_updates() -> None:
+    """blocks until the updates handed to the background publisher so far are sent"""
+    _publisher.submit(lambda: None).result()
+
+
+def _publish_committed(game_id: int, committed_at: float) -> None:
+    deferred = _deferred_updates.get()
+    if deferred is not None:
+        deferred.setdefault(game_id, committed_at)
+    else:
+        dispatch_game_update(game_id, committed_at)
+
+
+def schedule_game_update(game_id: int) -> None:
+    """
+    Publishes an update for the game once the current transaction commits.
+    Scheduling the same game again before that is a no-op, so an action made of several
+    wrapped transactions (battle, removals, Field Hospital, Outrage...) sends one message.
+    """
+    for _, func, _ in connection.run_on_commit:
+        if getattr(func, "game_id", None) == game_id:
+            return
+
+    def publish():
+        _publish_committed(game_id, time.time())
+
+    publish.game_id = game_id
+    transaction.on_commit(publish, robust=True)
+
+
+@contextmanager
+def deferred_game_updates():
+    """
+    Holds back the updates of everything committed inside the block,
+    then publishes one per game. Re-entrant, nested blocks defer to the outer one.
+    """
+    if _deferred_updates.get() is not None:
+        yield
+        return
+
+    deferred: dict[int, float] = {}
+    token = _deferred_updates.set(deferred)
+    try:
+        yield
+    finally:
+        _deferred_updates.reset(token)
+        for game_id, committed_at in sorted(deferred.items()):
+            dispatch_game_update(game_id, committed_at)
@@ -1,88 +1,222 @@
+from collections import defaultdict
+from django.apps import apps
 from django.core import serializers
-from django.db import transaction
-from game.utils.snapshot import get_all_game_objects
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models.fields import AutoFieldMixin
+from django.utils import timezone
+from game.utils.snapshot import capture_gamestate, diff_gamestate, SNAPSHOT_MODEL_ORDER
 from game.models.game_models import Game
 
+
 @transaction.atomic
 def load_gamestate(game_id: int, gamestate_data: list):
     """
     Restores the game state from a snapshot (list of dicts).
-    1. Deserializes the snapshot.
-    2. Culls (deletes) any current game objects that are NOT in the snapshot.
-    3. Saves (updates/creates) objects from the snapshot.
+    1. Diffs the snapshot against the live rows of the game, per model.
+    2. Culls (bulk deletes) live rows that are NOT in the snapshot.
+    3. Bulk updates rows that differ and bulk inserts rows that are missing.
+    Rows that already match the snapshot are not touched.
     """
-    # 1. Deserialize
-    # deserialized_objects is a generator of DeserializedObject wrappers
-    # We use 'python' format because gamestate_data is already a python list (from JSONField)
-    deserialized_objects = list(serializers.deserialize('python', gamestate_data))
-    
-    # Map of (Model, PK) -> DeserializedObject
-    snapshot_map = {
-        (obj.object.__class__, obj.object.pk): obj 
-        for obj in deserialized_objects
-    }
-
-    # 2. Cull
     try:
         current_game = Game.objects.get(pk=game_id)
-        current_objects = get_all_game_objects(current_game)
-        
-        # Determine what to delete
-        # Iterate in REVERSE of collection order (leaves first) to respect FK dependencies during deletion
-        for obj in reversed(current_objects):
-            # Key identification: (Model Class, PK)
-            # Note: For MTI, exact class match matters. 
-            # get_all_game_objects returns leaf classes.
-            key = (obj.__class__, obj.pk)
-            
-            # Special case for Game: Do not delete the Game object itself!
-            if isinstance(obj, Game):
-                continue
-                
-            if key not in snapshot_map:
-                # This object exists in DB but not in snapshot. Delete it.
-                obj.delete()
-                
+        current_state = capture_gamestate(current_game)
     except Game.DoesNotExist:
-        pass
+        current_state = []
+
+    # the version only ever increases, so it is never restored from a snapshot
+    gamestate_data = _keep_live_version(current_state, gamestate_data)
+
+    # 1. Diff live state -> snapshot
+    delta = diff_gamestate(current_state, gamestate_data)
+    live_rows = {(obj["model"], obj["pk"]): obj["fields"] for obj in current_state}
+
+    deleted_pks = defaultdict(list)
+    for model_label, pk in delta["deleted"]:
+        # Special case for Game: Do not delete the Game object itself!
+        if model_label == "game.game":
+            continue
+        deleted_pks[apps.get_model(model_label)].append(pk)
+
+    # only the rows that differ get deserialized
+    changed_rows = defaultdict(list)
+    for row in delta["changed"]:
+        changed_rows[apps.get_model(row["model"])].append(row)
+
+    # 2. Cull
+    # Delete leaves first (reverse of collection order) to respect FK dependencies
+    for model in _in_snapshot_order(deleted_pks, reverse=True):
+        model._base_manager.filter(pk__in=deleted_pks[model]).delete()
 
     # 3. Restore (Update/Create)
-    # Iterate in original order (dependencies first: Game -> Player -> ...)
-    for dobj in deserialized_objects:
-        # dobj.save() saves to DB. 
-        # It handles both update (if PK exists) and create (if not).
-        try:
-            dobj.save()
-        except Exception as e:
-            print(f"ERROR saving object: {dobj.object} (Type: {dobj.object.__class__.__name__})")
-            if hasattr(dobj.object, '__dict__'):
-                print(f"Object dict: {dobj.object.__dict__}")
-            raise e
-
-    # 4. (SQLite Specifc) Reset Sequences
-    # Since we culled objects, we might have rolled back the 'tip' of the table.
-    # SQLite does not auto-reset autoincrement sequences on delete, so next insert will use old_max + 1,
-    # causing mismatches with recorded Actions that expect reused PKs.
-    from django.db import connection, connections
-    from django.db.models import Max
-    
-    if 'sqlite' in connection.vendor:
-        # Identify all models we just touched
-        restored_models = set(dobj.object.__class__ for dobj in deserialized_objects)
-        
-        with connection.cursor() as cursor:
-            for model in restored_models:
-                table_name = model._meta.db_table
-                max_id = model.objects.all().aggregate(Max('id'))['id__max']
-                if max_id is None:
-                    max_id = 0
-                
-                # Update sqlite_sequence
-                # Note: We blindly set it to max_id. 
-                # If other games exist with higher IDs, max_id will reflect that, preventing reuse (which is correct behavior to avoid corruption).
-                # If we are the only game, max_id will be the snapshot's max, allowing reuse of the next IDs.
-                try:
-                    cursor.execute("UPDATE sqlite_sequence SET seq = %s WHERE name = %s", [max_id, table_name])
-                except Exception:
-                    # Table might not depend on sequence or other error, safe to ignore usually
-                    pass
+    # Iterate in collection order (dependencies first: Game -> Player -> ...)
+    for model in _in_snapshot_order(changed_rows):
+        rows = changed_rows[model]
+        label = model._meta.label_lower
+        update_rows = [row for row in rows if (label, row["pk"]) in live_rows]
+        # rows cascade-deleted by the cull above have to be inserted again
+        if update_rows and deleted_pks:
+            surviving = set(
+                model._base_manager.filter(
+                    pk__in=[row["pk"] for row in update_rows]
+                ).values_list("pk", flat=True)
+            )
+            update_rows = [row for row in update_rows if row["pk"] in surviving]
+        update_pks = {row["pk"] for row in update_rows}
+        insert_rows = [row for row in rows if row["pk"] not in update_pks]
+
+        if update_rows:
+            _bulk_update_rows(model, update_rows, live_rows)
+        if insert_rows:
+            _bulk_insert_rows(model, insert_rows)
+
+    # 4. Reset Sequences
+    _reset_sequences(deleted_pks.keys() | changed_rows.keys())
+
+
+def _keep_live_version(current_state: list, gamestate_data: list) -> list:
+    """the snapshot, with the Game row carrying the live version"""
+    live_version = next(
+        (
+            obj["fields"].get("version")
+            for obj in current_state
+            if obj["model"] == "game.game"
+        ),
+        None,
+    )
+    if live_version is None:
+        return gamestate_data
+    return [
+        {**obj, "fields": {**obj["fields"], "version": live_version}}
+        if obj["model"] == "game.game"
+        else obj
+        for obj in gamestate_data
+    ]
+
+
+def _in_snapshot_order(models_by_key: dict, reverse: bool = False) -> list:
+    """the models of a dict, sorted by their position in the snapshot"""
+    rank = {model: i for i, model in enumerate(SNAPSHOT_MODEL_ORDER)}
+    return sorted(
+        models_by_key, key=lambda model: rank.get(model, len(rank)), reverse=reverse
+    )
+
+
+def _deserialize(rows: list) -> list:
+    return list(serializers.deserialize("python", rows))
+
+
+def _bulk_update_rows(model, rows: list, live_rows: dict):
+    """bulk updates existing rows, writing only the fields that changed"""
+    label = model._meta.label_lower
+    changed_fields = set()
+    for row in rows:
+        live = live_rows[(label, row["pk"])]
+        changed_fields.update(
+            name for name, value in row["fields"].items() if live.get(name) != value
+        )
+
+    m2m_names = {field.name for field in model._meta.local_many_to_many}
+    concrete_fields = changed_fields - m2m_names
+    deserialized = _deserialize(rows)
+    if concrete_fields:
+        concrete_fields |= set(_touch_auto_now(model, deserialized))
+        model._base_manager.bulk_update(
+            [dobj.object for dobj in deserialized], sorted(concrete_fields)
+        )
+    if changed_fields & m2m_names:
+        for dobj in deserialized:
+            for accessor_name, object_list in dobj.m2m_data.items():
+                if accessor_name in changed_fields:
+                    getattr(dobj.object, accessor_name).set(object_list)
+
+
+def _bulk_insert_rows(model, rows: list):
+    """
+    Inserts rows with their snapshot pks.
+    Uses a raw insert of the model's own table (like a raw fixture save), so it also
+    works for multi-table inheritance children, whose parent rows are separate snapshot
+    rows, and keeps auto_now_add values from the snapshot.
+    """
+    deserialized = _deserialize(rows)
+    _touch_auto_now(model, deserialized)
+    objs = [dobj.object for dobj in deserialized]
+    fields = [field for field in model._meta.local_concrete_fields]
+    batch_size = connection.ops.bulk_batch_size(fields, objs) or len(objs)
+    for start in range(0, len(objs), batch_size):
+        model._base_manager._insert(
+            objs[start : start + batch_size], fields=fields, raw=True
+        )
+    for dobj in deserialized:
+        for accessor_name, object_list in dobj.m2m_data.items():
+            getattr(dobj.object, accessor_name).set(object_list)
+
+
+def _touch_auto_now(model, deserialized: list) -> list[str]:
+    """
+    restoring a row is a write: its auto_now fields (GameLog.updated_at) get the time
+    of the restore rather than the snapshot's, returns their names
+    """
+    names = [
+        field.name
+        for field in model._meta.local_concrete_fields
+        if getattr(field, "auto_now", False)
+    ]
+    now = timezone.now()
+    for dobj in deserialized:
+        for name in names:
+            setattr(dobj.object, name, now)
+    return names
+
+
+def _reset_sequences(models):
+    """
+    Since we culled objects, we might have rolled back the 'tip' of the table.
+    Neither SQLite nor PostgreSQL reset sequences on delete, so next insert will use old_max + 1,
+    causing mismatches with recorded Actions that expect reused PKs.
+    Sets every restored table's sequence to its current MAX(id).
+    If other games exist with higher IDs, max_id will reflect that, preventing reuse
+    (which is correct behavior to avoid corruption).
+    """
+    if connection.vendor == "postgresql":
+        _reset_postgres_sequences(models)
+        return
+    if connection.vendor != "sqlite":
+        return
+    # MTI children share their parent's pk and have no sequence of their own
+    tables = sorted(
+        {
+            (model._meta.db_table, model._meta.pk.column)
+            for model in models
+            if isinstance(model._meta.pk, AutoFieldMixin)
+        }
+    )
+    if not tables:
+        return
+    quote = connection.ops.quote_name
+    cases = " ".join(
+        f"WHEN %s THEN (SELECT COALESCE(MAX({quote(column)}), 0) FROM {quote(table)})"
+        for table, column in tables
+    )
+    tables = [table for table, _ in tables]
+    placeholders = ", ".join(["%s"] * len(tables))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE sqlite_sequence SET seq = CASE name {cases} END "
+            f"WHERE name IN ({placeholders})",
+            [*tables, *tables],
+        )
+
+
+def _reset_postgres_sequences(models):
+    """
+    (PostgreSQL) Also moves sequences forward: unlike SQLite's AUTOINCREMENT, inserting a row
+    with an explicit pk (a snapshot row, or a HeadlessGame write back) does not advance them.
+    """
+    statements = connection.ops.sequence_reset_sql(
+        no_style(), sorted(models, key=lambda model: model._meta.label)
+    )
+    if not statements:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(" ".join(statements))
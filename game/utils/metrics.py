@@ -0,0 +1,130 @@
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger("game.metrics")
+
+ENDPOINT = "endpoint"
+TRANSACTION = "transaction"
+
+
+@dataclass
+class Measurement:
+    """cost of one request or game transaction"""
+
+    kind: str
+    name: str
+    queries: int = 0
+    db_time: float = 0.0
+    total_time: float = 0.0
+    # bytes of checkpoint and action state written (with METRICS_CHECKPOINT_SIZE)
+    checkpoint_size: int = 0
+
+
+@dataclass
+class MetricStats:
+    """aggregated measurements of one endpoint or transaction"""
+
+    calls: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    db_time: float = 0.0
+    total_time: float = 0.0
+    max_total_time: float = 0.0
+    checkpoint_size: int = 0
+
+    def add(self, measurement: Measurement) -> None:
+        self.calls += 1
+        self.queries += measurement.queries
+        self.max_queries = max(self.max_queries, measurement.queries)
+        self.db_time += measurement.db_time
+        self.total_time += measurement.total_time
+        self.max_total_time = max(self.max_total_time, measurement.total_time)
+        self.checkpoint_size += measurement.checkpoint_size
+
+
+_stats: dict[tuple[str, str], MetricStats] = {}
+_stats_lock = threading.Lock()
+# measurements in progress, innermost last
+_open_measurements: ContextVar[tuple[Measurement, ...]] = ContextVar(
+    "open_measurements", default=()
+)
+
+
+def record(measurement: Measurement) -> None:
+    with _stats_lock:
+        key = (measurement.kind, measurement.name)
+        _stats.setdefault(key, MetricStats()).add(measurement)
+    logger.info(json.dumps(asdict(measurement)))
+
+
+@contextmanager
+def measure(kind: str, name: str):
+    """
+    Counts the queries, DB time and total time of the block and records them under name.
+    Nested blocks are all charged for the queries run inside them.
+    """
+    measurement = Measurement(kind, name)
+
+    def count_query(execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            measurement.queries += 1
+            measurement.db_time += time.perf_counter() - start
+
+    token = _open_measurements.set(_open_measurements.get() + (measurement,))
+    start = time.perf_counter()
+    try:
+        with connection.execute_wrapper(count_query):
+            yield measurement
+    finally:
+        measurement.total_time = time.perf_counter() - start
+        _open_measurements.reset(token)
+        record(measurement)
+
+
+def add_checkpoint_size(gamestate) -> None:
+    """
+    charges the JSON size of saved game state to every measurement in progress.
+    Only with METRICS_CHECKPOINT_SIZE: the state is serialized once more to measure it
+    """
+    measurements = _open_measurements.get()
+    if not measurements or not settings.METRICS_CHECKPOINT_SIZE:
+        return
+    size = len(json.dumps(gamestate))
+    for measurement in measurements:
+        measurement.checkpoint_size += size
+
+
+def get_metrics(kind: str, name: str) -> MetricStats | None:
+    with _stats_lock:
+        stats = _stats.get((kind, name))
+        return None if stats is None else MetricStats(**asdict(stats))
+
+
+def get_all_metrics() -> list[dict]:
+    with _stats_lock:
+        return [
+            {"kind": kind, "name": name, **asdict(stats)}
+            for (kind, name), stats in sorted(_stats.items())
+        ]
+
+
+def percentile(values: list[float], p: float) -> float:
+    """nearest-rank percentile, p between 0 and 1"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p * len(ordered)) - 1, 0)]
+
+
+def reset_metrics() -> None:
+    with _stats_lock:
+        _stats.clear()
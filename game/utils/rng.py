@@ -0,0 +1,39 @@
+import random
+import secrets
+from django.db import models, transaction
+
+
+def new_rng_seed() -> int:
+    return secrets.randbits(62)
+
+
+def game_random(game) -> random.Random:
+    """
+    the next draw of the game's random stream, advancing the stream by one.
+    A draw depends only on the game's seed and how many draws came before it,
+    and the counter is part of the checkpointed Game row, so replaying actions
+    after restoring a checkpoint draws the same values again.
+    """
+    from game.models.game_models import Game
+
+    game_id = game if isinstance(game, int) else game.pk
+    with transaction.atomic():
+        Game.objects.filter(pk=game_id).update(rng_draws=models.F("rng_draws") + 1)
+        seed, draws = (
+            Game.objects.filter(pk=game_id).values_list("rng_seed", "rng_draws").get()
+        )
+    if isinstance(game, Game):
+        game.rng_draws = draws
+    return random.Random(f"{seed}:{draws - 1}")
+
+
+def randint(game, a: int, b: int) -> int:
+    return game_random(game).randint(a, b)
+
+
+def choice(game, seq):
+    return game_random(game).choice(seq)
+
+
+def shuffle(game, items: list) -> None:
+    game_random(game).shuffle(items)
@@ -1,10 +1,14 @@
+from collections import defaultdict
 from django.core import serializers
-from itertools import chain
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.db.models import Prefetch
 
 # Import all models
 from game.models.game_models import (
     Game,
     FactionChoiceEntry,
+    Player,
     Clearing,
     BuildingSlot,
     Warrior,
@@ -72,168 +76,189 @@ from game.models.removal_tracker import RemovalEventTracker
 from game.models.game_log import GameLog
 
 
+# Every model captured in a snapshot, in dependency order, with the lookup
+# from the model to its Game. Each model is read with one query per game, so
+# the query count does not depend on the number of players.
+# MTI children (Burrow, the Piece subclasses) have no lookup of their own:
+# they are read in the same query as their root model (see _collect_with_children).
+SNAPSHOT_MODELS: list[tuple[type[models.Model], str | None]] = [
+    (Game, None),
+    (FactionChoiceEntry, "game"),
+    (Clearing, "game"),
+    # Moles Burrows (special Clearing variant)
+    (Burrow, None),
+    (BuildingSlot, "clearing__game"),
+    # Cards & Items (Global/Game level)
+    (Card, "game"),
+    (Item, "game"),
+    # Game State Collections (Deck, Discard, Ruins, Craftable)
+    (DeckEntry, "game"),
+    (DiscardPileEntry, "game"),
+    (Ruin, "game"),
+    (CraftableItemEntry, "game"),
+    (DominanceSupplyEntry, "game"),
+    (GameSimpleSetup, "game"),
+    # Players and their generic assets
+    (Player, "game"),
+    (HandEntry, "player__game"),
+    (RevealedCardEntry, "player__game"),
+    (CraftedItemEntry, "player__game"),
+    (CraftedCardEntry, "player__game"),
+    (ActiveDominanceEntry, "player__game"),
+    (CatsSimpleSetup, "player__game"),
+    (BirdsSimpleSetup, "player__game"),
+    (CrowsSimpleSetup, "player__game"),
+    (MolesSimpleSetup, "player__game"),
+    # Pieces: base -> intermediate -> leaf, all read with the Piece query
+    (Piece, "player__game"),
+    (Token, None),
+    (Building, None),
+    (Warrior, None),
+    (CoffinWarrior, None),
+    (BirdRoost, None),
+    (Workshop, None),
+    (Sawmill, None),
+    (Recruiter, None),
+    (CatKeep, None),
+    (CatWood, None),
+    (WABase, None),
+    (WASympathy, None),
+    (PlotToken, None),
+    (Tunnel, None),
+    (Citadel, None),
+    (Market, None),
+    # Faction specific assets
+    (BirdLeader, "player__game"),
+    (DecreeEntry, "player__game"),
+    (Vizier, "player__game"),
+    (SupporterStackEntry, "player__game"),
+    (OfficerEntry, "player__game"),
+    (ExposureRevealedCards, "player__game"),
+    (ExposureGuessedPlot, "player__game"),
+    (Crown, "player__game"),
+    (Minister, "player__game"),
+    # Turn History / State
+    (BirdTurn, "player__game"),
+    (BirdBirdsong, "turn__player__game"),
+    (BirdDaylight, "turn__player__game"),
+    (BirdEvening, "turn__player__game"),
+    (CatTurn, "player__game"),
+    (CatBirdsong, "turn__player__game"),
+    (CatDaylight, "turn__player__game"),
+    (CatEvening, "turn__player__game"),
+    (WATurn, "player__game"),
+    (WABirdsong, "turn__player__game"),
+    (WADaylight, "turn__player__game"),
+    (WAEvening, "turn__player__game"),
+    (CrowTurn, "player__game"),
+    (CrowBirdsong, "turn__player__game"),
+    (CrowDaylight, "turn__player__game"),
+    (CrowEvening, "turn__player__game"),
+    (MoleTurn, "player__game"),
+    (MoleBirdsong, "turn__player__game"),
+    (MoleDaylight, "turn__player__game"),
+    (MoleEvening, "turn__player__game"),
+    (RemovalEventTracker, "game"),
+    # Events: sub-events (OneToOne) depend on Event + Players/Clearings
+    (Event, "game"),
+    (Battle, "event__game"),
+    (OutrageEvent, "event__game"),
+    (TurmoilEvent, "event__game"),
+    (FieldHospitalEvent, "event__game"),
+    (InformantsEvent, "event__game"),
+    (EyrieEmigreEvent, "event__game"),
+    (SaboteursEvent, "event__game"),
+    (CharmOffensiveEvent, "event__game"),
+    (PartisansEvent, "event__game"),
+    (SwapMeetEvent, "event__game"),
+    (CrowRecruitEvent, "event__game"),
+    (CrowRaidEvent, "event__game"),
+    (PriceOfFailureEvent, "event__game"),
+    # Game Logs
+    (GameLog, "game"),
+]
+
+# Order in which models appear in a snapshot (dependencies first).
+# Also used to place rows inserted by a checkpoint delta.
+SNAPSHOT_MODEL_ORDER = [model for model, _ in SNAPSHOT_MODELS]
+
+_MODEL_RANK = {
+    model._meta.label_lower: rank for rank, model in enumerate(SNAPSHOT_MODEL_ORDER)
+}
+
+
+def _mti_children(model: type[models.Model]) -> list:
+    """reverse parent links from a model to its direct multi-table-inheritance children"""
+    return [
+        rel
+        for rel in model._meta.related_objects
+        if rel.one_to_one and rel.parent_link
+    ]
+
+
+def _mti_select_related(model: type[models.Model], prefix: str = "") -> list[str]:
+    """select_related paths reaching every MTI descendant of model"""
+    paths = []
+    for rel in _mti_children(model):
+        path = f"{prefix}{rel.get_accessor_name()}"
+        paths.append(path)
+        paths.extend(_mti_select_related(rel.related_model, f"{path}__"))
+    return paths
+
+
+def _collect_with_children(obj: models.Model, buckets: dict) -> None:
+    """
+    Adds obj and the MTI child rows joined onto it by select_related to buckets.
+    Parent and child tables are read in one query, and each level is kept as its
+    own instance so the serializer emits a fixture row per table.
+    """
+    buckets[obj.__class__].append(obj)
+    for rel in _mti_children(obj.__class__):
+        try:
+            child = getattr(obj, rel.get_accessor_name())
+        except ObjectDoesNotExist:
+            continue
+        _collect_with_children(child, buckets)
+
+
 def get_all_game_objects(game: Game):
     """
     Collects all model instances related to the given game instance.
     Returns a list of objects in an order suitable for serialization (dependencies first).
+    Runs a fixed number of queries regardless of the number of players.
     """
-    objects = []
-
-    # 1. Root Game Object
-    objects.append(game)
-
-    # 2. Static-ish components (depend on Game)
-    objects.extend(FactionChoiceEntry.objects.filter(game=game))
-    objects.extend(Clearing.objects.filter(game=game))
-    # Moles Burrows (special Clearing variant)
-    objects.extend(Burrow.objects.filter(game=game))
-    # BuildingSlot depends on Clearing
-    objects.extend(BuildingSlot.objects.filter(clearing__game=game))
-
-    # Cards & Items (Global/Game level)
-    objects.extend(Card.objects.filter(game=game))
-    objects.extend(Item.objects.filter(game=game))
-
-    # Game State Collections (Deck, Discard, Ruins, Craftable)
-    objects.extend(DeckEntry.objects.filter(game=game))
-    objects.extend(DiscardPileEntry.objects.filter(game=game))
-    objects.extend(Ruin.objects.filter(game=game))
-    objects.extend(CraftableItemEntry.objects.filter(game=game))
-    objects.extend(DominanceSupplyEntry.objects.filter(game=game))
-
-    # Setup State (depend on Game)
-    objects.extend(GameSimpleSetup.objects.filter(game=game))
-
-    # 3. Players and their direct assets
-    players = game.players.all().order_by("turn_order")
-    objects.extend(players)
-
-    for player in players:
-        # Player generic assets
-        objects.extend(HandEntry.objects.filter(player=player))
-        objects.extend(RevealedCardEntry.objects.filter(player=player))
-        objects.extend(CraftedItemEntry.objects.filter(player=player))
-        objects.extend(CraftedCardEntry.objects.filter(player=player))
-        objects.extend(ActiveDominanceEntry.objects.filter(player=player))
-        objects.extend(CoffinWarrior.objects.filter(player=player))
-
-        # Setup state (depend on Player)
-        objects.extend(CatsSimpleSetup.objects.filter(player=player))
-        objects.extend(BirdsSimpleSetup.objects.filter(player=player))
-        objects.extend(CrowsSimpleSetup.objects.filter(player=player))
-        objects.extend(MolesSimpleSetup.objects.filter(player=player))
-
-        # Pieces (Warriors, Buildings, Tokens)
-        # For MTI (Multi-Table Inheritance), we MUST serialize the base models as well
-        # to capture the inherited fields (like 'player' on Piece, 'clearing' on Token).
-        # Order matters: Base -> Child.
-
-        # 3a. Base Piece (Parent of Token, Building, Warrior)
-        # Note: We filter by player to keep it organized, though we could do bulk query.
-        objects.extend(Piece.objects.filter(player=player))
-
-        # 3b. Intermediate Bases (Token, Building)
-        objects.extend(Token.objects.filter(player=player))
-        objects.extend(Building.objects.filter(player=player))
-
-        # 3c. Leaf Classes
-        # Warriors (Direct child of Piece)
-        objects.extend(Warrior.objects.filter(player=player))
-
-        # Faction Specific Assets & Pieces
-        # Birds
-        objects.extend(BirdLeader.objects.filter(player=player))
-        objects.extend(DecreeEntry.objects.filter(player=player))
-        objects.extend(Vizier.objects.filter(player=player))
-        objects.extend(BirdRoost.objects.filter(player=player))
-
-        # Cats
-        objects.extend(Workshop.objects.filter(player=player))
-        objects.extend(Sawmill.objects.filter(player=player))
-        objects.extend(Recruiter.objects.filter(player=player))
-        objects.extend(CatKeep.objects.filter(player=player))
-        objects.extend(CatWood.objects.filter(player=player))
-
-        # WA
-        objects.extend(WABase.objects.filter(player=player))
-        objects.extend(WASympathy.objects.filter(player=player))
-        objects.extend(SupporterStackEntry.objects.filter(player=player))
-        objects.extend(OfficerEntry.objects.filter(player=player))
-
-        # Turn History / State
-        # Birds
-        bird_turns = BirdTurn.objects.filter(player=player)
-        objects.extend(bird_turns)
-        objects.extend(BirdBirdsong.objects.filter(turn__in=bird_turns))
-        objects.extend(BirdDaylight.objects.filter(turn__in=bird_turns))
-        objects.extend(BirdEvening.objects.filter(turn__in=bird_turns))
-
-        # Cats
-        cat_turns = CatTurn.objects.filter(player=player)
-        objects.extend(cat_turns)
-        objects.extend(CatBirdsong.objects.filter(turn__in=cat_turns))
-        objects.extend(CatDaylight.objects.filter(turn__in=cat_turns))
-        objects.extend(CatEvening.objects.filter(turn__in=cat_turns))
-
-        # WA
-        wa_turns = WATurn.objects.filter(player=player)
-        objects.extend(wa_turns)
-        objects.extend(WABirdsong.objects.filter(turn__in=wa_turns))
-        objects.extend(WADaylight.objects.filter(turn__in=wa_turns))
-        objects.extend(WAEvening.objects.filter(turn__in=wa_turns))
-
-        # Crows
-        crow_turns = CrowTurn.objects.filter(player=player)
-        objects.extend(crow_turns)
-        objects.extend(CrowBirdsong.objects.filter(turn__in=crow_turns))
-        objects.extend(CrowDaylight.objects.filter(turn__in=crow_turns))
-        objects.extend(CrowEvening.objects.filter(turn__in=crow_turns))
-        objects.extend(PlotToken.objects.filter(player=player))
-        objects.extend(ExposureRevealedCards.objects.filter(player=player))
-        objects.extend(ExposureGuessedPlot.objects.filter(player=player))
-
-        # Moles
-        objects.extend(Crown.objects.filter(player=player))
-        objects.extend(Minister.objects.filter(player=player))
-        objects.extend(Tunnel.objects.filter(player=player))
-        objects.extend(Citadel.objects.filter(player=player))
-        objects.extend(Market.objects.filter(player=player))
-
-        # Turn History / State
-        mole_turns = MoleTurn.objects.filter(player=player)
-        objects.extend(mole_turns)
-        objects.extend(MoleBirdsong.objects.filter(turn__in=mole_turns))
-        objects.extend(MoleDaylight.objects.filter(turn__in=mole_turns))
-        objects.extend(MoleEvening.objects.filter(turn__in=mole_turns))
-
-
-    # 4. Removal Tracker (depends on Game)
-    removal_tracker = RemovalEventTracker.objects.filter(game=game).first()
-    if removal_tracker:
-        objects.append(removal_tracker)
-
-    # 5. Events
-    # Events depend on Game, but sub-events depend on Event + Players/Clearings
-    events = Event.objects.filter(game=game)
-    objects.extend(events)
-    # Sub-events (OneToOne)
-    objects.extend(Battle.objects.filter(event__in=events))
-    objects.extend(OutrageEvent.objects.filter(event__in=events))
-    objects.extend(TurmoilEvent.objects.filter(event__in=events))
-    objects.extend(FieldHospitalEvent.objects.filter(event__in=events))
-    objects.extend(InformantsEvent.objects.filter(event__in=events))
-    objects.extend(EyrieEmigreEvent.objects.filter(event__in=events))
-    objects.extend(SaboteursEvent.objects.filter(event__in=events))
-    objects.extend(CharmOffensiveEvent.objects.filter(event__in=events))
-    objects.extend(PartisansEvent.objects.filter(event__in=events))
-    objects.extend(SwapMeetEvent.objects.filter(event__in=events))
-    objects.extend(CrowRecruitEvent.objects.filter(event__in=events))
-    objects.extend(CrowRaidEvent.objects.filter(event__in=events))
-    objects.extend(PriceOfFailureEvent.objects.filter(event__in=events))
-
-    # 6. Game Logs
-    objects.extend(GameLog.objects.filter(game=game).order_by("created_at"))
+    buckets = defaultdict(list)
+    buckets[Game].append(game)
+
+    for model, lookup in SNAPSHOT_MODELS:
+        if lookup is None:
+            continue
+        queryset = model.objects.filter(**{lookup: game})
+        if model is Player:
+            queryset = queryset.order_by("turn_order")
+        elif not model._meta.ordering:
+            # the same row order on every database (PostgreSQL returns rows as they lie)
+            queryset = queryset.order_by("pk")
+        if model is Clearing:
+            # serializer reads M2M fields from the prefetch cache
+            queryset = queryset.prefetch_related(
+                Prefetch("connected_clearings", Clearing.objects.order_by("pk")),
+                Prefetch("water_connected_clearings", Clearing.objects.order_by("pk")),
+            )
+        children = _mti_select_related(model)
+        if children:
+            queryset = queryset.select_related(*children)
+            for obj in queryset:
+                _collect_with_children(obj, buckets)
+        else:
+            buckets[model].extend(queryset)
 
+    objects = []
+    for model in SNAPSHOT_MODEL_ORDER:
+        objects.extend(buckets.pop(model, []))
+    # MTI descendants missing from SNAPSHOT_MODELS still belong in the snapshot
+    for leftover in buckets.values():
+        objects.extend(leftover)
     return objects
 
 
@@ -249,3 +274,38 @@ def capture_gamestate(game: Game) -> list:
     # Use 'json' serializer to handle datetimes, then load back to a list of dicts
     json_data = serializers.serialize("json", objects)
     return json.loads(json_data)
+
+
+def diff_gamestate(previous: list, current: list) -> dict:
+    """
+    Computes the delta between two snapshots (fixture lists).
+    "changed" holds every row of current that was inserted or modified,
+    "deleted" holds the (model, pk) keys of rows that no longer exist.
+    """
+    previous_rows = {(obj["model"], obj["pk"]): obj for obj in previous}
+    current_keys = set()
+    changed = []
+    for obj in current:
+        key = (obj["model"], obj["pk"])
+        current_keys.add(key)
+        if previous_rows.get(key) != obj:
+            changed.append(obj)
+    deleted = [[model, pk] for model, pk in previous_rows if (model, pk) not in current_keys]
+    return {"changed": changed, "deleted": deleted}
+
+
+def apply_gamestate_delta(gamestate: list, delta: dict) -> list:
+    """
+    Applies a delta produced by diff_gamestate to a snapshot and returns the new snapshot.
+    Rows keep their relative order within a model; inserted rows follow the existing
+    rows of their model, and models are kept in SNAPSHOT_MODEL_ORDER so the result
+    can be loaded dependencies-first.
+    """
+    rows = {(obj["model"], obj["pk"]): obj for obj in gamestate}
+    for model, pk in delta["deleted"]:
+        rows.pop((model, pk), None)
+    for obj in delta["changed"]:
+        rows[(obj["model"], obj["pk"])] = obj
+    return sorted(
+        rows.values(), key=lambda obj: _MODEL_RANK.get(obj["model"], len(_MODEL_RANK))
+    )
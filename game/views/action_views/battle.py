@@ -13,6 +13,12 @@ from game.transactions.battle import (
 )
 from game.utility.textchoice import get_choice_label_by_value
 from game.views.action_views.general import GameActionView
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from game.errors import IllegalActionError
+from game.models.game_models import Game
+from game.queries.battle_odds import get_battle_odds
+from rest_framework import status
+from rest_framework.decorators import api_view
 from rest_framework.exceptions import ValidationError
 from rest_framework.views import Response
 
@@ -324,3 +330,30 @@ class BattleActionView(GameActionView):
                 return "WaBaseMouse"
             return "Building"
         return "Unknown"
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter("attacker", str, required=True, enum=Faction.values),
+        OpenApiParameter("defender", str, enum=Faction.values),
+    ]
+)
+@api_view(["GET"])
+def get_battle_odds_view(request, game_id: int):
+    """odds of every battle the attacker could start, for every clearing at once"""
+    try:
+        game = Game.objects.get(pk=game_id)
+    except Game.DoesNotExist:
+        return Response(
+            {"message": "Game does not exist"}, status=status.HTTP_404_NOT_FOUND
+        )
+    try:
+        attacker = Faction(request.query_params.get("attacker"))
+        defender = request.query_params.get("defender")
+        defender = None if defender is None else Faction(defender)
+    except ValueError:
+        raise ValidationError({"detail": "Invalid faction"})
+    try:
+        return Response(get_battle_odds(game, attacker, defender))
+    except IllegalActionError as e:
+        raise ValidationError({"detail": str(e)})
@@ -13,7 +13,11 @@ from game.models.game_models import (
     Player,
     Warrior,
 )
-from game.queries.cats.building import get_usable_wood_for_building, get_wood_cost
+from game.queries.cats.building import (
+    get_buildable_clearings,
+    get_usable_wood_for_building,
+    get_wood_cost,
+)
 from game.queries.cats.crafting import (
     get_all_unused_workshops,
     get_unused_workshop_by_clearing_number,
@@ -654,6 +658,13 @@ class CatActionsView(GameActionView):
             "accumulated_payload": {
                 "building_type": building_type_string,
             },
+            "options": [
+                {
+                    "value": str(clearing.clearing_number),
+                    "label": f"Clearing {clearing.clearing_number} ({clearing.get_suit_display()})",
+                }
+                for clearing in get_buildable_clearings(player, building_type)
+            ],
         }
         serializer = GameActionStepSerializer(step)
         return Response(serializer.data)
@@ -19,6 +19,7 @@ from game.queries.general import (
     player_has_warriors_in_clearing,
     player_has_pieces_in_clearing,
     determine_clearing_rule,
+    get_connected_clearings,
     get_enemy_factions_in_clearing,
 )
 from game.game_data.cards.exiles_and_partisans import CardsEP
@@ -153,7 +154,9 @@ class LeagueOfAdventurersView(GameActionView):
             Clearing, game=self.game(game_id), clearing_number=origin_number
         )
 
-        adjacents = origin.connected_clearings.all()
+        adjacents = sorted(
+            get_connected_clearings(origin), key=lambda c: c.clearing_number
+        )
         options = []
         origin_rule = determine_clearing_rule(origin)
 
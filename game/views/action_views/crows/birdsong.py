@@ -62,7 +62,11 @@ class CrowsCraftingView(GameActionView):
             return self.generate_completed_step()
 
         card = CardsEP[request.data["card_to_craft"]]
-        if not is_able_to_be_crafted(player, card):
+        try:
+            craftable = is_able_to_be_crafted(player, card)
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)})
+        if not craftable:
             raise ValidationError("Not enough plot tokens to craft this card")
 
         suits_needed = [cost.label for cost in card.value.cost]
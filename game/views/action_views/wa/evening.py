@@ -1,6 +1,8 @@
+from game.game_data.cards.exiles_and_partisans import CardsEP
 from game.models.game_models import Clearing, Faction, Player
 from game.models.wa.turn import WAEvening
 from game.queries.general import (
+    get_player_hand_size,
     player_has_warriors_in_clearing,
     validate_enemy_pieces_in_clearing,
     validate_has_legal_moves,
@@ -9,6 +11,8 @@ from game.queries.general import (
 from game.queries.wa.actions import get_unused_officer_count
 from game.queries.wa.turn import validate_step
 from game.transactions.wa import (
+    check_discard_step,
+    discard_card,
     end_evening_operations,
     operation_battle,
     operation_move,
@@ -373,3 +377,63 @@ class WAOperationsView(GameActionView):
         """raises if not this player's turn or correct step"""
         player = self.player(request, game_id)
         validate_step(player, WAEvening.WAEveningSteps.MILITARY_OPERATIONS)
+
+
+class WADiscardCardsView(GameActionView):
+    action_name = "WA_DISCARD_CARDS"
+    faction = Faction.WOODLAND_ALLIANCE
+
+    def get(self, request):
+        game_id = int(request.query_params.get("game_id"))
+        player = self.player(request, game_id)
+        discard_count = get_player_hand_size(player) - 5
+        if discard_count <= 0:
+            try:
+                atomic_game_action(check_discard_step)(player)
+            except ValueError as e:
+                raise ValidationError({"detail": str(e)})
+            return self.generate_completed_step()
+
+        assert self.faction == Faction.WOODLAND_ALLIANCE
+        self.first_step = {
+            "faction": self.faction.label,
+            "name": "discard_card",
+            "prompt": f"Select card to discard. Cards to discard: {discard_count}",
+            "endpoint": "discard-cards",
+            "payload_details": [{"type": "card", "name": "card_to_discard"}],
+        }
+        return super().get(request)
+
+    def route_post(self, request, game_id: int, route: str):
+        if route == "discard-cards":
+            return self.post_discard_cards(request, game_id)
+        return Response({"error": "Invalid route"}, status=status.HTTP_404_NOT_FOUND)
+
+    def post_discard_cards(self, request, game_id: int):
+        player = self.player(request, game_id)
+        card_name = request.data["card_to_discard"]
+        if not card_name:
+            raise ValidationError("No card selected")
+        try:
+            card = CardsEP[card_name]
+        except KeyError:
+            raise ValidationError(f"Invalid card: {card_name}")
+        try:
+            atomic_game_action(discard_card)(player, card)
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)})
+
+        discard_count = get_player_hand_size(player) - 5
+        if discard_count <= 0:
+            return self.generate_completed_step()
+        return self.generate_step(
+            "discard_card",
+            f"Select card to discard. Cards to discard: {discard_count}",
+            "discard-cards",
+            [{"type": "card", "name": "card_to_discard"}],
+        )
+
+    def validate_timing(self, request, game_id, route, *args, **kwargs):
+        """raises if not this player's turn or correct step"""
+        player = self.player(request, game_id)
+        validate_step(player, WAEvening.WAEveningSteps.DISCARDING)
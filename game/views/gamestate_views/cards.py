@@ -1,9 +1,24 @@
+import hashlib
+import json
+from rest_framework.decorators import api_view
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags, quote_etag
+from drf_spectacular.utils import extend_schema
 from game.models.game_models import Game, Player, Faction, CraftedCardEntry
-from game.serializers.general_serializers import CraftedCardSerializer
+from game.serializers.general_serializers import (
+    CARD_CATALOG,
+    CardCatalogEntrySerializer,
+    CraftedCardSerializer,
+)
+
+CARD_CATALOG_ENTRIES = list(CARD_CATALOG.values())
+# changes only with the card data, i.e. with a deploy
+CARD_CATALOG_ETAG = quote_etag(
+    hashlib.sha256(json.dumps(CARD_CATALOG_ENTRIES).encode()).hexdigest()[:16]
+)
 
 
 class GetCraftedCardsView(APIView):
@@ -33,3 +48,17 @@ class GetCraftedCardsView(APIView):
 
         serializer = CraftedCardSerializer(crafted_cards, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(responses={200: CardCatalogEntrySerializer(many=True), 304: None})
+@api_view(["GET"])
+def get_card_catalog(request):
+    """
+    Every card type with its data, as repeated in card payloads under its card_name.
+    Static: fetch it once, an If-None-Match with its ETag gets an empty 304.
+    """
+    headers = {"ETag": CARD_CATALOG_ETAG, "Cache-Control": "public, no-cache"}
+    if CARD_CATALOG_ETAG in parse_etags(request.headers.get("If-None-Match", "")):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(CARD_CATALOG_ENTRIES, status=status.HTTP_200_OK, headers=headers)
+
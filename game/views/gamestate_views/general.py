@@ -1,9 +1,10 @@
 from django.urls import reverse
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework.exceptions import ValidationError
-from drf_spectacular.utils import extend_schema, inline_serializer
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
 from rest_framework import serializers
 
 from game.models.birds.setup import BirdsSimpleSetup
@@ -19,9 +20,11 @@ from game.models.game_models import (
     Player,
     CraftableItemEntry,
 )
+from game.game_data.general.maps import get_map_graph
 from game.queries.cats.turn import get_phase as get_cat_phase
 from game.queries.current_action.setup import get_setup_action
 from game.queries.current_action.turns import get_current_turn_action
+from game.queries.legal_actions import get_legal_actions
 from game.serializers.general_serializers import (
     CardSerializer,
     CraftableItemSerializer,
@@ -33,10 +36,10 @@ from game.serializers.general_serializers import (
     DominanceSupplyEntrySerializer,
     ValidationErrorSerializer,
 )
+from game.serializers.game_state_serializer import PlayerGameStateSerializer
 from game.serializers.revealed_cards_serializers import RevealedCardSerializer
 from game.logic.playback import undo_last_action
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from game.utils.game_updates import schedule_game_update
 
 
 @extend_schema(responses={200: CardSerializer(many=True)})
@@ -85,7 +88,9 @@ def get_clearings(request, game_id: int):
             {"message": "Game does not exist"}, status=status.HTTP_404_NOT_FOUND
         )
     clearings = Clearing.objects.filter(game=game)
-    serializer = ClearingSerializer(clearings, many=True)
+    serializer = ClearingSerializer(
+        clearings, many=True, context={"map_graph": get_map_graph(game.boardmap)}
+    )
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -121,6 +126,28 @@ def get_current_action(request, game_id: int):
     raise ValidationError("Not yet implemented")
 
 
+@extend_schema(responses={400: ValidationErrorSerializer})
+@api_view(["GET"])
+def get_legal_actions_view(request, game_id: int):
+    """
+    the route of the current action and every payload its step would accept
+    (moves, battle targets, build and recruit sites, and, for the player whose
+    turn it is, craftable cards). Steps that take more than that are marked
+    complete: false, with the actions left out in not_enumerated.
+    """
+    try:
+        game = Game.objects.get(pk=game_id)
+    except Game.DoesNotExist:
+        raise ValidationError("Game does not exist")
+    try:
+        legal_actions = get_legal_actions(game, request.user)
+    except GameSimpleSetup.DoesNotExist:
+        raise ValidationError("Game has not been set up")
+    if legal_actions is None:
+        raise ValidationError("Not yet implemented")
+    return Response(legal_actions)
+
+
 @extend_schema(
     responses={200: PlayerPublicSerializer(many=True), 400: ValidationErrorSerializer}
 )
@@ -153,13 +180,7 @@ def undo_last_action_view(request, game_id: int):
     undo_last_action(game)
 
     # Publish update to WebSocket
-    try:
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            f"game_{game.id}", {"type": "game_update", "message": "update"}
-        )
-    except Exception as e:
-        print(f"Failed to send websocket update: {e}")
+    schedule_game_update(game.pk)
 
     return Response({"status": "success"}, status=status.HTTP_200_OK)
 
@@ -177,6 +198,37 @@ def get_game_session_detail(request, game_id: int):
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+def game_state_etag(game_id: int, version: int, user_id: int | None) -> str:
+    # the snapshot differs per player, so the viewer is part of the tag
+    return quote_etag(f"{game_id}-{version}-{user_id or 0}")
+
+
+@extend_schema(responses={200: PlayerGameStateSerializer, 304: None})
+@api_view(["GET"])
+def get_game_state(request, game_id: int):
+    """
+    The whole game as seen by the requesting player, in one response.
+    Tagged with the game version: if If-None-Match still matches, an empty 304 is returned
+    without serializing anything.
+    """
+    version = Game.objects.filter(pk=game_id).values_list("version", flat=True).first()
+    if version is None:
+        return Response({"detail": "Game not found"}, status=status.HTTP_404_NOT_FOUND)
+    etag = game_state_etag(game_id, version, request.user.pk)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    game = Game.objects.get(pk=game_id)
+    player = None
+    if request.user.is_authenticated:
+        player = Player.objects.filter(game=game, user=request.user).first()
+    # the version read above may already be stale, which only costs the client a refetch
+    game.version = version
+    serializer = PlayerGameStateSerializer(game, context={"player": player})
+    return Response(serializer.data, status=status.HTTP_200_OK, headers=headers)
+
+
 @extend_schema(responses={200: DominanceSupplyEntrySerializer(many=True)})
 @api_view(["GET"])
 def get_dominance_supply(request, game_id: int):
@@ -303,8 +355,9 @@ def get_craftable_items(request, game_id: int):
     serializer = CraftableItemSerializer(craftable_items, many=True)
     return Response(serializer.data, status=status.HTTP_200_OK)
 
-from game.serializers.logs import GameLogSerializer
+from game.serializers.logs import GameLogFeedSerializer, GameLogSerializer
 from game.models.game_log import GameLog
+from game.queries.game_log import get_log_feed, get_log_head, parse_log_cursor
 
 @extend_schema(responses={200: GameLogSerializer(many=True)})
 @api_view(["GET"])
@@ -336,3 +389,42 @@ def get_game_logs(request, game_id: int):
 
     serializer = GameLogSerializer(root_logs, many=True, context={'request': request})
     return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            "after",
+            str,
+            description="cursor of the client's last feed response",
+        )
+    ],
+    responses={200: GameLogFeedSerializer},
+)
+@api_view(["GET"])
+def get_game_log_feed(request, game_id: int):
+    """
+    The game log as a feed: only the logs that are new or changed since the client's
+    cursor (?after=), flat, to be merged by id and nested by parent_id.
+    Without a cursor, or when it was undone (reset), the whole log.
+    Game updates carry latest_log_id and logs_updated_at, to fetch only when they moved.
+    """
+    if not Game.objects.filter(pk=game_id).exists():
+        return Response({"detail": "Game not found"}, status=status.HTTP_404_NOT_FOUND)
+    after = request.query_params.get("after")
+    if after is not None:
+        try:
+            parse_log_cursor(after)
+        except ValueError:
+            return Response(
+                {"detail": "after must be a log cursor"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+    # read before the logs: a log written in between is sent again next time, not missed
+    head = get_log_head(game_id)
+    logs, reset, cursor = get_log_feed(game_id, after)
+    serializer = GameLogFeedSerializer(
+        {**head, "cursor": cursor, "reset": reset, "logs": logs}, context={"request": request}
+    )
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
@@ -0,0 +1,12 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from game.utils.metrics import get_all_metrics
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def get_metrics(request):
+    """query count, DB time, total time and checkpoint size per endpoint and game transaction"""
+    return Response(get_all_metrics())
@@ -84,6 +84,10 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "game.middleware.MetricsMiddleware",
+    "game.middleware.BoardStateCacheMiddleware",
+    "game.middleware.GameUpdateMiddleware",
+    "game.middleware.GameVersionMiddleware",
 ]
 
 CORS_ALLOWED_ORIGINS = os.environ.get(
@@ -124,16 +128,64 @@ CHANNEL_LAYERS = {
     },
 }
 
+# The default cache holds the legal actions per game version.
+# CACHE_BACKEND=redis to share it between worker processes.
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "locmem")
+
+if CACHE_BACKEND == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": f"redis://{os.environ.get('REDIS_HOST', '127.0.0.1')}:6379/1",
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+# Build and send websocket updates in a background thread after the commit,
+# instead of in the request that committed (the test runner sends them in place).
+GAME_UPDATES_IN_BACKGROUND = os.environ.get("GAME_UPDATES_IN_BACKGROUND", "True") == "True"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# DATABASE_ENGINE=postgres for production: SQLite serializes every write of every game
+# behind one file lock, PostgreSQL only the actions of the same game (see atomic_game_action).
+DATABASE_ENGINE = os.environ.get("DATABASE_ENGINE", "sqlite")
+
+if DATABASE_ENGINE == "postgres":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("POSTGRES_DB", "rootgame"),
+            "USER": os.environ.get("POSTGRES_USER", "rootgame"),
+            "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),
+            "HOST": os.environ.get("POSTGRES_HOST", "127.0.0.1"),
+            "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+            # one connection per request: under ASGI (Daphne) requests run on short-lived
+            # threads, and persistent connections would pile up, one per thread. Django 5.0
+            # has no connection pool, docker-compose puts PgBouncer in front instead.
+            "CONN_MAX_AGE": int(os.environ.get("DATABASE_CONN_MAX_AGE", "0")),
+            "CONN_HEALTH_CHECKS": True,
+            # PgBouncer in transaction mode hands each transaction any server connection,
+            # which a cursor kept open across transactions would not survive
+            "DISABLE_SERVER_SIDE_CURSORS": os.environ.get("POSTGRES_PGBOUNCER", "False") == "True",
+        }
     }
-}
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+        }
+    }
+
+# settings of the private in-memory databases game.logic.headless copies games into;
+# nothing connects to the alias itself
+DATABASES["headless"] = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
 
 
 # Password validation
@@ -185,5 +237,20 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Undo checkpoints: store a full snapshot only every CHECKPOINT_KEYFRAME_INTERVAL
+# checkpoints and row-level deltas in between.
+CHECKPOINT_DELTAS = os.environ.get("CHECKPOINT_DELTAS", "True") == "True"
+CHECKPOINT_KEYFRAME_INTERVAL = int(os.environ.get("CHECKPOINT_KEYFRAME_INTERVAL", "50"))
+# How many games keep their last rebuilt snapshot in memory (per process), so new
+# checkpoints are diffed against it without replaying the deltas.
+CHECKPOINT_STATE_CACHE_SIZE = int(os.environ.get("CHECKPOINT_STATE_CACHE_SIZE", "32"))
+# Capture the state after every Nth action of a checkpoint, so undo replays
+# at most N - 1 actions.
+CHECKPOINT_ACTION_INTERVAL = int(os.environ.get("CHECKPOINT_ACTION_INTERVAL", "5"))
+# Record the bytes of checkpoint state each request and transaction writes
+# (game.utils.metrics). Costs one more serialization of every checkpoint, so off unless
+# measuring (the benchmark_games command turns it on).
+METRICS_CHECKPOINT_SIZE = os.environ.get("METRICS_CHECKPOINT_SIZE", "False") == "True"
+
 # Custom Test Runner for CLI flags
 TEST_RUNNER = "game.tests.runner.RootTestRunner"